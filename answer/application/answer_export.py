@@ -0,0 +1,91 @@
+"""게임별 답변 내보내기 (NDJSON / CSV)
+
+리포지토리가 서버 측 커서로 읽어 주는 행을 chunk_rows 개씩 묶어 bytes 로 인코딩한다.
+한 번에 chunk_rows 개만 메모리에 있으므로 게임 크기와 무관하게 메모리 사용량이 일정하다.
+"""
+import csv
+import io
+import json
+from datetime import datetime
+from enum import Enum, StrEnum
+from typing import Any, Iterable, Iterator
+
+EXPORT_FIELDS = (
+    "id",
+    "game_id",
+    "user_id",
+    "user_nickname",
+    "user_name",
+    "user_email",
+    "answer",
+    "is_correct",
+    "status",
+    "point",
+    "solved_at",
+    "created_at",
+    "updated_at",
+)
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+def encode_rows(
+    rows: Iterable[dict], fmt: ExportFormat, chunk_rows: int = 500
+) -> Iterator[bytes]:
+    if fmt == ExportFormat.CSV:
+        return _encode_csv(rows, chunk_rows)
+    return _encode_ndjson(rows, chunk_rows)
+
+
+def _encode_ndjson(rows: Iterable[dict], chunk_rows: int) -> Iterator[bytes]:
+    lines = []
+    for row in rows:
+        lines.append(
+            json.dumps(
+                {field: _value(row.get(field)) for field in EXPORT_FIELDS},
+                ensure_ascii=False,
+            )
+        )
+        if len(lines) >= chunk_rows:
+            yield ("\n".join(lines) + "\n").encode()
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+def _encode_csv(rows: Iterable[dict], chunk_rows: int) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # 엑셀에서 한글이 깨지지 않도록 BOM 추가
+    buffer.write("\ufeff")
+    writer.writerow(EXPORT_FIELDS)
+    count = 0
+    for row in rows:
+        writer.writerow(
+            ["" if row.get(field) is None else _value(row.get(field)) for field in EXPORT_FIELDS]
+        )
+        count += 1
+        if count >= chunk_rows:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            count = 0
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
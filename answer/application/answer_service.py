@@ -1,13 +1,24 @@
 from datetime import datetime
+import time
 import pytz
 from ulid import ULID
 
+from typing import Iterator
+
 from dependency_injector.wiring import inject
+from fastapi import HTTPException, status
 
-from answer.domain.answer import Answer, AnswerStatus
+from answer.application.answer_export import ExportFormat, encode_rows
+from answer.domain.answer import Answer, AnswerProvisionResult, AnswerStatus
 from answer.domain.repository.answer_repo import IAnswerRepository
+from game.application.current_game_cache import CurrentGameCache
+from game.domain.game import Game
 from game.domain.repository.game_repo import IGameRepository
 from user.domain.repository.user_repo import IUserRepository
+from user.domain.user import PointDrift
+from user.application.leaderboard_service import LeaderboardService
+from common.exceptions import ValidationError
+from common.unit_of_work import after_commit
 
 
 class AnswerService:
@@ -17,10 +28,14 @@ class AnswerService:
         answer_repo: IAnswerRepository,
         game_repo: IGameRepository,
         user_repo: IUserRepository,
+        leaderboard: LeaderboardService | None = None,
+        current_game_cache: CurrentGameCache | None = None,
     ):
         self.answer_repo = answer_repo
         self.game_repo = game_repo
         self.user_repo = user_repo
+        self.leaderboard = leaderboard
+        self.current_game_cache = current_game_cache
         self.ulid = ULID()
 
     def create_answer(
@@ -45,74 +60,91 @@ class AnswerService:
         self,
         game_id: str,
         count: int = 1,
-    ):
-        users = self.user_repo.find_all()  # TODO 활성화된 user 대상으로만 좁혀야 함
+        active_since: datetime | None = None,
+        chunk_size: int = 5000,
+    ) -> AnswerProvisionResult:
+        """유저별 답변 슬롯(count개)을 bulk insert로 생성
+
+        이미 슬롯이 있는 유저는 모자란 만큼만 만든다. 작업이 다시 실행되어도 슬롯이 늘어나지 않는다.
+
+        Args:
+            game_id (str): Game ID
+            count (int): 유저당 슬롯 수 (이미 있는 슬롯 포함)
+            active_since (datetime | None): 이 시각 이후 로그인한 유저만 대상
+            chunk_size (int): INSERT 한 번에 보낼 row 수
+
+        Returns:
+            AnswerProvisionResult: 대상 유저 수, 생성된 답변 수, 소요 시간
+        """
+        started = time.perf_counter()
+        user_ids = self.user_repo.find_ids(active_since=active_since)
+        existing = self.answer_repo.count_slots_by_game_id(game_id)
         now = datetime.now(pytz.timezone("Asia/Seoul"))
-        for _ in range(count):
-            for user in users:
-                # TODO bulk하여 save할지 고민 필요
-                self.answer_repo.save(
-                    Answer(
-                        id=self.ulid.generate(),
-                        game_id=game_id,
-                        user_id=user.id,
-                        answer="-",
-                        is_correct=False,
-                        solved_at=None,
-                        created_at=now,
-                        updated_at=now,
-                        point=0,
-                        status=AnswerStatus.NOT_USED,
-                    )
-                )
-
-        return True
 
-    def submit_answer(self, game_id: str, user_id: str, answer_text: str) -> Answer:
-        # 게임 정보 조회
-        game = self.game_repo.find_by_id(game_id)
+        answers = (
+            Answer(
+                id=self.ulid.generate(),
+                game_id=game_id,
+                user_id=user_id,
+                answer="-",
+                is_correct=False,
+                solved_at=None,
+                created_at=now,
+                updated_at=now,
+                point=0,
+                status=AnswerStatus.NOT_USED,
+            )
+            for user_id in user_ids
+            for _ in range(count - existing.get(user_id, 0))
+        )
+        answer_count = self.answer_repo.bulk_create(answers, chunk_size=chunk_size)
 
-        # 유저 정보 조회
-        user = self.user_repo.find_by_id(user_id)
-        # if user.coin < 1:
-        #     raise InsufficientCoinError()
+        return AnswerProvisionResult(
+            game_id=game_id,
+            user_count=len(user_ids),
+            answer_count=answer_count,
+            elapsed_ms=round((time.perf_counter() - started) * 1000),
+        )
 
-        # 정답 여부 확인
-        is_correct = game.answer.strip().lower() == answer_text.strip().lower()
+    def submit_answer(self, game_id: str, user_id: str, answer_text: str) -> Answer:
+        """답변 제출
 
-        # 포인트 계산 (임시로 정답이면 10점)
-        # point = 10 if is_correct else 0
+        정답은 캐시된 게임의 matcher(정규화된 정답 + 별칭 집합)로 확인하고,
+        남은 슬롯 하나를 잠금 + 갱신하는 UPDATE 한 번으로 제출한다
+        (동시에 눌러도 같은 기회를 두 번 쓰지 않는다).
+        """
+        game = self._get_game(game_id)
+        if not game:
+            raise ValueError(f"Game not found: {game_id}")
 
-        now = datetime.now(pytz.timezone("Asia/Seoul"))
-        # answer = Answer(
-        #     id=self.ulid.generate(),
-        #     game_id=game_id,
-        #     user_id=user_id,
-        #     answer=answer_text,
-        #     is_correct=is_correct,
-        #     solved_at=now if is_correct else None,
-        #     created_at=now,
-        #     updated_at=now,
-        #     point=0,
-        #     status=AnswerStatus.SUBMITTED,
-        # )
-        answer = self.answer_repo.find_not_used_by_game_id_and_user_id(game_id, user_id)
+        # 정답 여부 확인 (NFKC / casefold / 공백 무시, 별칭 포함)
+        is_correct = game.matcher.matches(answer_text)
 
+        answer = self.answer_repo.claim_and_submit(
+            game_id=game_id,
+            user_id=user_id,
+            answer_text=answer_text,
+            is_correct=is_correct,
+            submitted_at=datetime.now(pytz.timezone("Asia/Seoul")),
+        )
         if answer:
-            answer.answer = answer_text
-            answer.is_correct = is_correct
-            answer.solved_at = now if is_correct else None
-            answer.updated_at = now
-            answer.status = AnswerStatus.SUBMITTED
-        else:
+            return answer
+
+        # 실패한 경우에만 이유 확인
+        if self.answer_repo.find_corrected_by_game_id_and_user_id(game_id, user_id):
             raise HTTPException(
-                status_code=400,
-                detail="Already used all the chances provided",
+                status_code=status.HTTP_409_CONFLICT,
+                detail="You have already correctly submitted an answer for this game",
             )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="You have already submitted an answer for this game",
+        )
 
-        self.user_repo.update(user)
-
-        return self.answer_repo.update(answer)
+    def _get_game(self, game_id: str) -> Game | None:
+        if self.current_game_cache:
+            return self.current_game_cache.get_game(game_id)
+        return self.game_repo.find_by_id(game_id)
 
     def update_answer(self, id: str, answer: Answer) -> Answer:
         # 기존 답변 확인
@@ -134,6 +166,34 @@ class AnswerService:
     def get_answers_by_game(self, game_id: str) -> list[Answer]:
         return self.answer_repo.find_by_game_id(game_id)
 
+    def export_answers_by_game(
+        self,
+        game_id: str,
+        fmt: ExportFormat = ExportFormat.NDJSON,
+        after_solved_at: datetime | None = None,
+        after_id: str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[bytes]:
+        """게임의 답변을 NDJSON / CSV 로 스트리밍
+
+        (solved_at, id) 순서로 내보내며, 마지막 행의 solved_at / id 를
+        after_solved_at / after_id 로 넘기면 그 다음부터 이어서 내보낸다.
+
+        Raises:
+            ValidationError: after_solved_at 만 있고 after_id 가 없을 때
+            ValueError: If game not found
+        """
+        # after_id 없이는 keyset 조건을 만들 수 없어 처음부터 다시 내보내게 된다
+        if after_solved_at is not None and not after_id:
+            raise ValidationError("after_id is required with after_solved_at")
+        # 스트리밍이 시작되면 상태 코드를 바꿀 수 없으므로 게임 확인은 먼저
+        if not self.game_repo.find_by_id(game_id):
+            raise ValueError(f"Game not found: {game_id}")
+        rows = self.answer_repo.iter_export_by_game_id(
+            game_id, after_solved_at=after_solved_at, after_id=after_id, limit=limit
+        )
+        return encode_rows(rows, fmt)
+
     def get_answers_by_user(self, user_id: str) -> list[Answer]:
         return self.answer_repo.find_by_user_id(user_id)
 
@@ -169,31 +229,49 @@ class AnswerService:
             )
         self.answer_repo.delete_by_id(answer.id)
 
-    def calculate_points(self, game_id: str, multiplier: int = 50):
-        corrected_answers = self.get_corrected_answers_by_game(game_id)
+    def calculate_points(
+        self, game_id: str, multiplier: int = 50, limit: int = 10
+    ) -> dict[str, int]:
+        """정답자 순위별 포인트 계산 (DB에서 한 번에 처리)
 
-        # 점수 계산 로직
-        
-        length = len(corrected_answers)
-
-
-        for idx, answer in enumerate(corrected_answers):
-            rank = idx + 1
-
-            if answer.is_correct:
-                answer.point = round(multiplier * ((1 - (2 / length)) ** rank))
-            self.answer_repo.update(answer)
-    
-    def update_total_user_point(self, game_id: str):
-        corrected_answers = self.get_corrected_answers_by_game(game_id, limit=100)
-        for corrected_answer in corrected_answers:
-            user_id = corrected_answer.user_id
-            answers = self.get_answers_by_user(user_id)
-            total_point = sum(answer.point for answer in answers)
-            user = self.user_repo.find_by_id(user_id)
-            user.point = total_point
-            self.user_repo.update(user)
-            
-        
-        
-        
\ No newline at end of file
+        rank 번째 정답자는 round(multiplier * (1 - 2 / length) ** rank) 점을 받고,
+        이전에 반영된 점수와의 차이만큼 user.point 에도 반영된다.
+
+        Returns:
+            dict[str, int]: user_id 별 반영된 포인트 변화량
+        """
+        deltas = self.answer_repo.score_game(
+            game_id, multiplier=multiplier, limit=limit
+        )
+        if not self.leaderboard:
+            return deltas
+        if deltas:
+            after_commit(lambda: self.leaderboard.apply_deltas(deltas))
+        else:
+            # 이미 반영된 게임 (재실행 / 재전달). 이전 실행이 커밋 후 Redis 반영 전에
+            # 중단됐을 수 있으므로 이 게임에서 점수를 받은 유저를 DB 값으로 다시 맞춘다
+            user_ids = self.answer_repo.find_scored_user_ids_by_game_id(game_id)
+            after_commit(lambda: self.leaderboard.sync_users(user_ids))
+        return deltas
+
+    def update_total_user_point(self, game_id: str) -> dict[str, int]:
+        """해당 게임의 포인트 변화량만 user.point 에 반영
+
+        유저의 전체 답변 이력을 다시 합산하지 않는다.
+        이미 반영된 게임이면 변화량이 없으므로 아무것도 바뀌지 않는다.
+
+        Returns:
+            dict[str, int]: user_id 별 반영된 포인트 변화량
+        """
+        return self.calculate_points(game_id)
+
+    def reconcile_user_points(self, fix: bool = False) -> list[PointDrift]:
+        """answer 테이블 기준으로 user.point 를 재계산해 차이가 나는 유저를 반환
+
+        Args:
+            fix (bool): True 이면 차이가 나는 유저의 포인트를 재계산 값으로 덮어씀
+        """
+        drifts = self.user_repo.reconcile_points(fix=fix)
+        if fix and drifts and self.leaderboard:
+            after_commit(self.leaderboard.rebuild)
+        return drifts
@@ -0,0 +1,113 @@
+import hashlib
+import json
+
+from answer.domain.answer import Answer
+from answer.domain.repository.answer_repo import IAnswerRepository
+from common.redis.client import RedisClient
+
+# 계산을 시작할 때 읽은 버전이 현재 버전보다 오래됐으면 저장하지 않음
+# KEYS: 캐시 hash, 버전 키 / ARGV: 버전, body, etag, count, ttl
+WRITE_RANKING_SCRIPT = """
+if tonumber(ARGV[1]) < tonumber(redis.call("get", KEYS[2]) or "0") then
+    return 0
+end
+redis.call("hset", KEYS[1], "body", ARGV[2], "etag", ARGV[3], "count", ARGV[4])
+redis.call("expire", KEYS[1], ARGV[5])
+return 1
+"""
+
+class GameRankingCache:
+    """게임별 정답자 랭킹 캐시
+
+    랭킹 응답 JSON 을 미리 직렬화해 ETag 와 함께 Redis hash 에 저장한다.
+    정답이 제출되거나 게임이 종료될 때만 다시 계산한다.
+    정답이 제출될 때마다 게임별 버전을 올리고, 계산 도중 버전이 바뀐 결과는 저장하지 않는다
+    (늦게 끝난 이전 계산이 최신 랭킹을 덮어쓰지 않도록).
+    """
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        answer_repo: IAnswerRepository,
+        limit: int = 10,
+    ):
+        self.redis_client = redis_client
+        self.answer_repo = answer_repo
+        self.limit = limit
+        self.key_prefix = "game_ranking:"
+        self._write = redis_client._redis.register_script(WRITE_RANKING_SCRIPT)
+
+    def get(self, game_id: str) -> tuple[str, str]:
+        """직렬화된 랭킹 JSON 과 ETag 반환 (캐시에 없으면 계산)"""
+        cached = self.redis_client._redis.hgetall(self._key(game_id))
+        if cached:
+            return cached["body"], cached["etag"]
+        return self.refresh(game_id)
+
+    def refresh(self, game_id: str) -> tuple[str, str]:
+        """DB 에서 랭킹을 다시 계산해 캐시에 저장"""
+        # DB 조회 전에 읽어야 이후에 커밋된 정답을 놓친 결과를 걸러낼 수 있다
+        version = self.redis_client._redis.get(self._version_key(game_id)) or "0"
+        answers = self.answer_repo.find_corrected_by_game_id(game_id, limit=self.limit)
+        body = json.dumps(
+            [
+                self._serialize(answer)
+                for answer in answers
+                if getattr(answer, "user", None)
+            ],
+            ensure_ascii=False,
+        )
+        etag = f'"{hashlib.sha1(body.encode()).hexdigest()}"'
+
+        self._write(
+            keys=[self._key(game_id), self._version_key(game_id)],
+            args=[version, body, etag, len(answers), self.redis_client.settings.CACHE_TTL],
+        )
+        return body, etag
+
+    def on_correct_answer(self, game_id: str) -> None:
+        """정답 제출 시 호출
+
+        랭킹은 solved_at 순이므로 이미 limit 명이 채워졌다면 새 정답자는 순위에 들 수 없다.
+        """
+        self._bump_version(game_id)
+        count = self.redis_client._redis.hget(self._key(game_id), "count")
+        if count is None or int(count) < self.limit:
+            self.refresh(game_id)
+
+    def invalidate(self, game_id: str) -> None:
+        self._bump_version(game_id)
+        self.redis_client._redis.delete(self._key(game_id))
+
+    def _bump_version(self, game_id: str) -> None:
+        key = self._version_key(game_id)
+        pipe = self.redis_client._redis.pipeline(transaction=True)
+        pipe.incr(key)
+        pipe.expire(key, self.redis_client.settings.CACHE_TTL)
+        pipe.execute()
+
+    def _key(self, game_id: str) -> str:
+        return f"{self.key_prefix}{game_id}"
+
+    def _version_key(self, game_id: str) -> str:
+        return f"{self.key_prefix}{game_id}:version"
+
+    def _serialize(self, answer: Answer) -> dict:
+        # AnswerUserResponseDTO 와 같은 형태
+        return {
+            "id": answer.id,
+            "game_id": answer.game_id,
+            "user_id": answer.user_id,
+            "is_correct": answer.is_correct,
+            "solved_at": answer.solved_at.isoformat() if answer.solved_at else None,
+            "created_at": answer.created_at.isoformat(),
+            "updated_at": answer.updated_at.isoformat(),
+            "user": {
+                "id": answer.user.get("id"),
+                "name": "",
+                "nickname": answer.user.get("nickname"),
+                "email": None,
+                "point": None,
+                "created_at": None,
+            },
+        }
@@ -21,3 +21,11 @@ class Answer:
     updated_at: datetime
     point: int
     status: AnswerStatus
+
+
+@dataclass
+class AnswerProvisionResult:
+    game_id: str
+    user_count: int
+    answer_count: int
+    elapsed_ms: int
@@ -1,5 +1,7 @@
 from abc import ABCMeta, abstractmethod
+from datetime import datetime
 from re import A
+from typing import Iterable, Iterator
 from answer.domain.answer import Answer
 
 
@@ -8,6 +10,27 @@ class IAnswerRepository(metaclass=ABCMeta):
     def save(self, answer: Answer) -> Answer:
         raise NotImplementedError
 
+    @abstractmethod
+    def bulk_create(self, answers: Iterable[Answer], chunk_size: int = 5000) -> int:
+        """Insert answers with multi-row INSERTs, chunk_size rows at a time.
+
+        Returns:
+            int: Number of inserted rows
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_slots_by_game_id(self, game_id: str) -> dict[str, int]:
+        """Count answer slots per user for the game (any status).
+
+        Locks provisioning of the game until the transaction ends, so
+        concurrent runs for the same game see each other's inserts.
+
+        Returns:
+            dict[str, int]: user_id -> number of slots
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def find_by_id(self, id: str) -> Answer:
         raise NotImplementedError
@@ -16,6 +39,27 @@ class IAnswerRepository(metaclass=ABCMeta):
     def find_by_game_id(self, game_id: str) -> list[Answer]:
         raise NotImplementedError
 
+    @abstractmethod
+    def iter_export_by_game_id(
+        self,
+        game_id: str,
+        after_solved_at: datetime | None = None,
+        after_id: str | None = None,
+        limit: int | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[dict]:
+        """Stream a game's answers with user info, ordered by (solved_at NULLS LAST, id).
+
+        Rows are fetched batch_size at a time from a server-side cursor, so memory
+        does not grow with the game size. Passing the last row's solved_at / id
+        as after_solved_at / after_id continues after that row (after_solved_at
+        None means the row had no solved_at).
+
+        Yields:
+            dict: Answer columns plus user_nickname, user_name, user_email
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def find_by_user_id(self, user_id: str) -> list[Answer]:
         raise NotImplementedError
@@ -39,3 +83,44 @@ class IAnswerRepository(metaclass=ABCMeta):
     @abstractmethod
     def update(self, answer: Answer) -> Answer:
         raise NotImplementedError
+
+    @abstractmethod
+    def claim_and_submit(
+        self,
+        game_id: str,
+        user_id: str,
+        answer_text: str,
+        is_correct: bool,
+        submitted_at: datetime,
+    ) -> Answer | None:
+        """Claim one unused answer slot and store the submission in one statement.
+
+        Concurrent submissions never claim the same slot. Nothing is claimed if
+        the user has no unused slot or already has a correct submission.
+
+        Returns:
+            Answer | None: The submitted answer, or None if nothing was claimed
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def score_game(
+        self, game_id: str, multiplier: int = 50, limit: int = 10
+    ) -> dict[str, int]:
+        """Score a game's corrected answers and apply point deltas to users.
+
+        Answers are ranked by solved_at and get
+        round(multiplier * (1 - 2 / length) ** rank) points, where length is
+        the number of ranked answers (at most limit). Answer points and
+        user.point are updated in one transaction. Re-running is safe: only the
+        difference from the previously stored answer points is applied.
+
+        Returns:
+            dict[str, int]: Applied point delta per user_id
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_scored_user_ids_by_game_id(self, game_id: str) -> list[str]:
+        """Return ids of users holding points from this game (answer.point <> 0)."""
+        raise NotImplementedError
@@ -8,6 +8,8 @@ from sqlalchemy import (
     ForeignKey,
     Text,
     Enum,
+    Index,
+    text,
 )
 from sqlalchemy.orm import Mapped, relationship
 
@@ -18,6 +20,22 @@ from answer.domain.answer import AnswerStatus
 
 class Answer(Base):
     __tablename__ = "answer"  # DB 테이블 이름은 소문자
+    __table_args__ = (
+        # 유저의 게임별 슬롯 조회 / 제출 (claim_and_submit, find_*_by_game_id_and_user_id)
+        # game_id 로 시작하므로 게임 단위 조회 / 채점에도 사용된다
+        Index("ix_answer_game_id_user_id_status", "game_id", "user_id", "status"),
+        # 정답자 순위 (find_corrected_by_game_id, score_game). 제출된 정답만 담는다
+        Index(
+            "ix_answer_game_id_solved_at_correct",
+            "game_id",
+            "solved_at",
+            postgresql_where=text(
+                "is_correct AND status = 'SUBMITTED' AND solved_at IS NOT NULL"
+            ),
+        ),
+        # 유저별 답변 조회 (find_by_user_id), 유저 삭제 시 FK 확인
+        Index("ix_answer_user_id", "user_id"),
+    )
 
     id: Mapped[str] = Column(String(36), primary_key=True)
     game_id: Mapped[str] = Column(String(36), ForeignKey("game.id"), nullable=False)
@@ -1,12 +1,120 @@
+from datetime import datetime
+from itertools import islice
+from typing import Iterable, Iterator
+
+from sqlalchemy import func, insert, or_, select, text, tuple_
+
 from answer.domain.answer import Answer as AnswerDomain
 from answer.domain.answer import AnswerStatus
 from answer.domain.repository.answer_repo import IAnswerRepository
 from answer.infra.db_models.answer import Answer as AnswerModel
 
-from database import SessionLocal
+from common.unit_of_work import UnitOfWork
+
+
+# 정답 순위 산정 -> answer.point 갱신 -> user.point 에 차이만 반영 (한 statement, 한 트랜잭션)
+SCORE_GAME_SQL = text(
+    """
+    WITH ranked AS (
+        SELECT a.id, row_number() OVER (ORDER BY a.solved_at) AS rank
+        FROM answer a
+        JOIN "user" u ON u.id = a.user_id
+        WHERE a.game_id = :game_id
+          AND a.is_correct
+          AND a.solved_at IS NOT NULL
+          AND a.status = 'SUBMITTED'
+          AND u.role = 'USER'
+        ORDER BY a.solved_at
+        LIMIT :limit
+    ),
+    sized AS (
+        SELECT id, rank, count(*) OVER () AS length FROM ranked
+    ),
+    targets AS (
+        SELECT
+            a.id,
+            a.point AS old_point,
+            CASE
+                WHEN s.id IS NULL THEN 0
+                ELSE round(:multiplier * power(1 - 2.0 / s.length, s.rank))
+            END AS new_point
+        FROM answer a
+        LEFT JOIN sized s ON s.id = a.id
+        WHERE a.game_id = :game_id
+          AND (s.id IS NOT NULL OR a.point <> 0)
+    ),
+    scored AS (
+        UPDATE answer
+        SET point = targets.new_point
+        FROM targets
+        WHERE answer.id = targets.id
+          AND answer.point <> targets.new_point
+        RETURNING answer.user_id, targets.new_point - targets.old_point AS delta
+    ),
+    deltas AS (
+        SELECT user_id, sum(delta)::integer AS delta
+        FROM scored
+        GROUP BY user_id
+    ),
+    applied AS (
+        UPDATE "user"
+        SET point = "user".point + deltas.delta
+        FROM deltas
+        WHERE "user".id = deltas.user_id
+        RETURNING "user".id
+    )
+    SELECT user_id, delta FROM deltas
+    """
+)
+
+# 같은 게임 / 유저의 제출을 트랜잭션이 끝날 때까지 직렬화.
+# 뒤의 요청은 앞 요청이 커밋된 뒤에 CLAIM_AND_SUBMIT_SQL 을 실행하므로 먼저 들어온 정답을 보게 된다
+LOCK_SUBMISSION_SQL = text(
+    "SELECT pg_advisory_xact_lock(hashtext(:game_id), hashtext(:user_id))"
+)
+
+# 같은 게임의 슬롯 생성을 트랜잭션이 끝날 때까지 직렬화 (작업 재전달 / 중복 실행)
+LOCK_PROVISION_SQL = text(
+    "SELECT pg_advisory_xact_lock(hashtext('answer.provision'), hashtext(:game_id))"
+)
+
+# 사용하지 않은 슬롯 하나를 잠그고(다른 요청이 잠근 슬롯은 건너뜀) 제출 내용으로 갱신
+CLAIM_AND_SUBMIT_SQL = text(
+    """
+    UPDATE answer
+    SET answer = :answer,
+        is_correct = :is_correct,
+        solved_at = :solved_at,
+        updated_at = :submitted_at,
+        status = 'SUBMITTED'
+    WHERE id = (
+        SELECT a.id
+        FROM answer a
+        WHERE a.game_id = :game_id
+          AND a.user_id = :user_id
+          AND a.status = 'NOT_USED'
+          AND NOT EXISTS (
+              SELECT 1
+              FROM answer c
+              WHERE c.game_id = :game_id
+                AND c.user_id = :user_id
+                AND c.status = 'SUBMITTED'
+                AND c.is_correct
+          )
+        ORDER BY a.created_at, a.id
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING id, game_id, user_id, answer, is_correct, solved_at,
+              created_at, updated_at, point, status
+    """
+)
 
 
 class AnswerRepository(IAnswerRepository):
+    def __init__(self, uow: UnitOfWork | None = None):
+        self.uow = uow or UnitOfWork()
+
     def _to_domain(self, model: AnswerModel) -> AnswerDomain:
         domain = AnswerDomain(
             id=model.id,
@@ -45,15 +153,55 @@ class AnswerRepository(IAnswerRepository):
 
     def save(self, answer: AnswerDomain) -> AnswerDomain:
         model = self._to_model(answer)
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             db.add(model)
             db.commit()
             db.refresh(model)
             return self._to_domain(model)
 
+    def bulk_create(
+        self, answers: Iterable[AnswerDomain], chunk_size: int = 5000
+    ) -> int:
+        answers = iter(answers)
+        inserted = 0
+        with self.uow.session() as db:
+            while chunk := list(islice(answers, chunk_size)):
+                # executemany + insertmanyvalues -> multi-row INSERT
+                db.execute(
+                    insert(AnswerModel),
+                    [
+                        {
+                            "id": answer.id,
+                            "game_id": answer.game_id,
+                            "user_id": answer.user_id,
+                            "answer": answer.answer,
+                            "is_correct": answer.is_correct,
+                            "solved_at": answer.solved_at,
+                            "created_at": answer.created_at,
+                            "updated_at": answer.updated_at,
+                            "point": answer.point,
+                            "status": answer.status,
+                        }
+                        for answer in chunk
+                    ],
+                )
+                inserted += len(chunk)
+            db.commit()
+        return inserted
+
+    def count_slots_by_game_id(self, game_id: str) -> dict[str, int]:
+        with self.uow.session() as db:
+            db.execute(LOCK_PROVISION_SQL, {"game_id": game_id})
+            rows = db.execute(
+                select(AnswerModel.user_id, func.count())
+                .where(AnswerModel.game_id == game_id)
+                .group_by(AnswerModel.user_id)
+            ).all()
+            return {user_id: count for user_id, count in rows}
+
     def update(self, answer: AnswerDomain) -> AnswerDomain:
-        with SessionLocal() as db:
-            model = db.query(AnswerModel).filter(AnswerModel.id == answer.id).first()
+        with self.uow.session() as db:
+            model = db.get(AnswerModel, answer.id)
             if not model:
                 raise ValueError(f"Answer with id {answer.id} not found")
 
@@ -68,16 +216,77 @@ class AnswerRepository(IAnswerRepository):
             db.refresh(model)
             return self._to_domain(model)
 
+    def claim_and_submit(
+        self,
+        game_id: str,
+        user_id: str,
+        answer_text: str,
+        is_correct: bool,
+        submitted_at: datetime,
+    ) -> AnswerDomain | None:
+        with self.uow.session() as db:
+            # READ COMMITTED 에서는 NOT EXISTS 가 다른 요청의 커밋 전 정답을 보지 못하므로 먼저 잠근다
+            db.execute(LOCK_SUBMISSION_SQL, {"game_id": game_id, "user_id": user_id})
+            row = db.execute(
+                CLAIM_AND_SUBMIT_SQL,
+                {
+                    "game_id": game_id,
+                    "user_id": user_id,
+                    "answer": answer_text,
+                    "is_correct": is_correct,
+                    "solved_at": submitted_at if is_correct else None,
+                    "submitted_at": submitted_at,
+                },
+            ).one_or_none()
+            db.commit()
+            if row is None:
+                return None
+            return AnswerDomain(
+                id=row.id,
+                game_id=row.game_id,
+                user_id=row.user_id,
+                answer=row.answer,
+                is_correct=row.is_correct,
+                solved_at=row.solved_at,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+                point=row.point,
+                status=AnswerStatus[row.status],
+            )
+
+    def score_game(
+        self, game_id: str, multiplier: int = 50, limit: int = 10
+    ) -> dict[str, int]:
+        with self.uow.session() as db:
+            rows = db.execute(
+                SCORE_GAME_SQL,
+                {"game_id": game_id, "multiplier": multiplier, "limit": limit},
+            ).all()
+            # 공유 세션에 이미 로드된 answer / user 객체를 갱신된 값으로 다시 읽도록
+            db.expire_all()
+            db.commit()
+            return {row.user_id: row.delta for row in rows}
+
+    def find_scored_user_ids_by_game_id(self, game_id: str) -> list[str]:
+        with self.uow.session() as db:
+            return list(
+                db.execute(
+                    select(AnswerModel.user_id)
+                    .where(AnswerModel.game_id == game_id, AnswerModel.point != 0)
+                    .distinct()
+                ).scalars()
+            )
+
     def find_by_id(self, id: str) -> AnswerDomain:
-        with SessionLocal() as db:
-            model = db.query(AnswerModel).filter(AnswerModel.id == id).first()
+        with self.uow.session() as db:
+            model = db.get(AnswerModel, id)
             if not model:
                 raise ValueError(f"Answer not found with id: {id}")
             return self._to_domain(model)
 
     def find_by_game_id(self, game_id: str) -> list[AnswerDomain]:
         try:
-            with SessionLocal() as db:
+            with self.uow.session() as db:
                 from user.infra.db_models.user import User
 
                 models = (
@@ -122,14 +331,65 @@ class AnswerRepository(IAnswerRepository):
         except Exception as e:
             raise e
 
+    def iter_export_by_game_id(
+        self,
+        game_id: str,
+        after_solved_at: datetime | None = None,
+        after_id: str | None = None,
+        limit: int | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[dict]:
+        from user.infra.db_models.user import User
+
+        stmt = (
+            select(
+                AnswerModel.id,
+                AnswerModel.game_id,
+                AnswerModel.user_id,
+                AnswerModel.answer,
+                AnswerModel.is_correct,
+                AnswerModel.status,
+                AnswerModel.solved_at,
+                AnswerModel.created_at,
+                AnswerModel.updated_at,
+                AnswerModel.point,
+                User.nickname.label("user_nickname"),
+                User.name.label("user_name"),
+                User.email.label("user_email"),
+            )
+            .outerjoin(User, AnswerModel.user_id == User.id)
+            .where(AnswerModel.game_id == game_id)
+            .order_by(AnswerModel.solved_at.asc().nulls_last(), AnswerModel.id)
+        )
+        if after_id is not None:
+            if after_solved_at is None:
+                # 마지막 행이 solved_at 이 없는 구간
+                stmt = stmt.where(AnswerModel.solved_at.is_(None), AnswerModel.id > after_id)
+            else:
+                stmt = stmt.where(
+                    or_(
+                        AnswerModel.solved_at.is_(None),
+                        tuple_(AnswerModel.solved_at, AnswerModel.id)
+                        > tuple_(after_solved_at, after_id),
+                    )
+                )
+        if limit:
+            stmt = stmt.limit(limit)
+
+        # 스트리밍은 응답 시작(요청 트랜잭션 commit) 뒤에도 이어지므로 요청 세션 대신 별도 세션 사용
+        with self.uow.session_factory() as db:
+            result = db.execute(stmt.execution_options(yield_per=batch_size))
+            for row in result.mappings():
+                yield dict(row)
+
     def find_by_user_id(self, user_id: str) -> list[AnswerDomain]:
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             models = db.query(AnswerModel).filter(AnswerModel.user_id == user_id).all()
             return [self._to_domain(model) for model in models]
 
     def find_corrected_by_game_id(self, game_id: str, limit: int = 10) -> list[AnswerDomain]:
         try:
-            with SessionLocal() as db:
+            with self.uow.session() as db:
                 from user.infra.db_models.user import User
                 from common.auth import Role
 
@@ -182,7 +442,7 @@ class AnswerRepository(IAnswerRepository):
     def find_unused_by_game_id_and_user_id(
         self, game_id: str, user_id: str
     ) -> list[AnswerDomain] | AnswerDomain:
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             models = (
                 db.query(AnswerModel)
                 .filter(
@@ -197,7 +457,7 @@ class AnswerRepository(IAnswerRepository):
     def find_corrected_by_game_id_and_user_id(
         self, game_id: str, user_id: str
     ) -> AnswerDomain:
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             model = (
                 db.query(AnswerModel)
                 .filter(
@@ -214,7 +474,7 @@ class AnswerRepository(IAnswerRepository):
     def find_not_used_by_game_id_and_user_id(
         self, game_id: str, user_id: str
     ) -> AnswerDomain:
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             model = (
                 db.query(AnswerModel)
                 .filter(
@@ -230,8 +490,8 @@ class AnswerRepository(IAnswerRepository):
             return self._to_domain(model)
 
     def delete_by_id(self, id: str) -> None:
-        with SessionLocal() as db:
-            model = db.query(AnswerModel).filter(AnswerModel.id == id).first()
+        with self.uow.session() as db:
+            model = db.get(AnswerModel, id)
             if not model:
                 raise ValueError(f"Answer not found with id: {id}")
             db.delete(model)
@@ -1,10 +1,13 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
 import pytz
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from dependency_injector.wiring import inject, Provide
 
 from containers import Container
+from answer.application.answer_export import MEDIA_TYPES, ExportFormat
 from answer.application.answer_service import AnswerService
+from answer.application.game_ranking_cache import GameRankingCache
 from game.application.game_service import GameService
 from answer.interface.dtos.answer_dto import (
     AnswerRequestDTO,
@@ -12,8 +15,13 @@ from answer.interface.dtos.answer_dto import (
     AnswerResponseListDTO,
     AnswerUserResponseDTO,
     AnswerUpdateDTO,
+    PointDriftDTO,
+    PointReconcileResponseDTO,
 )
 from common.auth import get_current_user, get_admin_user, CurrentUser, Role
+from common.interface.dtos.task_dto import TaskAcceptedResponseDTO
+from common.tasks import TaskName, TaskQueue
+from common.unit_of_work import after_commit
 from user.application.user_service import UserService
 from user.interface.dtos.user_dto import UserResponseDTO
 
@@ -23,40 +31,28 @@ router = APIRouter(prefix="/answer", tags=["answer"])
 
 @router.post("", response_model=AnswerResponseDTO)
 @inject
-async def submit_answer(
+def submit_answer(
     body: AnswerRequestDTO,
     user: CurrentUser = Depends(get_current_user),
     answer_service: AnswerService = Depends(Provide[Container.answer_service]),
     game_service: GameService = Depends(Provide[Container.game_service]),
+    ranking_cache: GameRankingCache = Depends(Provide[Container.game_ranking_cache]),
 ):
-    submitted_answers = answer_service.get_unused_answers_by_game_and_user(
-        body.game_id, user.id
-    )
-    if not submitted_answers:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="You have already submitted an answer for this game",
-        )
-
-    for submitted_answer in submitted_answers:
-        if submitted_answer.is_correct:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="You have already correctly submitted an answer for this game",
-            )
-
+    """답변 제출 (정상 경로: 슬롯 선점 + 제출 UPDATE 한 번)"""
     try:
         answer = answer_service.submit_answer(
             game_id=body.game_id,
             user_id=user.id,
             answer_text=body.answer,
         )
-        if answer.is_correct and game_service.get_game(body.game_id).closed_at is None:
-            game = game_service.update_game_closing_time(
+        if answer.is_correct:
+            # 첫 정답자가 나오면 종료 시각 설정 (이미 설정되어 있으면 DB 를 거치지 않음)
+            game_service.set_closing_time_if_unset(
                 game_id=body.game_id,
                 closed_at=answer.solved_at.astimezone(tz=pytz.timezone("Asia/Seoul"))
                 + timedelta(hours=11),
             )
+            after_commit(lambda: ranking_cache.on_correct_answer(body.game_id))
 
         return AnswerResponseDTO(
             id=answer.id,
@@ -70,6 +66,8 @@ async def submit_answer(
             point=answer.point,
         )
 
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -78,7 +76,7 @@ async def submit_answer(
 
 @router.get("/{answer_id}", response_model=AnswerResponseDTO)
 @inject
-async def get_answer(
+def get_answer(
     answer_id: str,
     _: CurrentUser = Depends(get_current_user),  # 인증된 사용자만 접근 가능
     answer_service: AnswerService = Depends(Provide[Container.answer_service]),
@@ -104,7 +102,7 @@ async def get_answer(
 
 @router.get("/game/{game_id}")
 @inject
-async def get_answers_by_game(
+def get_answers_by_game(
     game_id: str,
     _: CurrentUser = Depends(get_current_user),  # 인증된 사용자만 접근 가능
     answer_service: AnswerService = Depends(Provide[Container.answer_service]),
@@ -146,9 +144,46 @@ async def get_answers_by_game(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/game/{game_id}/export")
+@inject
+def export_answers_by_game(
+    game_id: str,
+    format: ExportFormat = ExportFormat.NDJSON,
+    after_solved_at: datetime | None = None,
+    after_id: str | None = None,
+    limit: int | None = Query(default=None, gt=0),
+    current_user: CurrentUser = Depends(get_admin_user),
+    answer_service: AnswerService = Depends(Provide[Container.answer_service]),
+):
+    """게임 답변 내보내기 (NDJSON / CSV 스트리밍)
+
+    (solved_at, id) 순서. 마지막 행의 solved_at / id 를 after_solved_at / after_id 로
+    넘기면 이어서 받는다 (solved_at 이 없는 행이면 after_id 만).
+    after_id 없이 after_solved_at 만 넘기면 400.
+    """
+    try:
+        chunks = answer_service.export_answers_by_game(
+            game_id,
+            fmt=format,
+            after_solved_at=after_solved_at,
+            after_id=after_id,
+            limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="answers-{game_id}.{format}"'
+        },
+    )
+
+
 @router.get("/user/{user_id}", response_model=AnswerResponseListDTO)
 @inject
-async def get_answers_by_user(
+def get_answers_by_user(
     current_user: CurrentUser = Depends(get_current_user),
     answer_service: AnswerService = Depends(Provide[Container.answer_service]),
 ):
@@ -179,7 +214,7 @@ async def get_answers_by_user(
 
 @router.get("/game/{game_id}/user", response_model=AnswerUserResponseDTO | None)
 @inject
-async def get_corrected_answer_by_game_and_user(
+def get_corrected_answer_by_game_and_user(
     game_id: str,
     current_user: CurrentUser = Depends(get_current_user),
     answer_service: AnswerService = Depends(Provide[Container.answer_service]),
@@ -192,7 +227,7 @@ async def get_corrected_answer_by_game_and_user(
 
 @router.get("/game/{game_id}/user/unused", response_model=list[AnswerResponseDTO])
 @inject
-async def get_unused_answer_by_game_and_user(
+def get_unused_answer_by_game_and_user(
     game_id: str,
     current_user: CurrentUser = Depends(get_current_user),
     answer_service: AnswerService = Depends(Provide[Container.answer_service]),
@@ -220,7 +255,7 @@ async def get_unused_answer_by_game_and_user(
 
 @router.delete("/game/current/user")
 @inject
-async def delete_answer_by_game_and_user(
+def delete_answer_by_game_and_user(
     current_user: CurrentUser = Depends(get_current_user),
     answer_service: AnswerService = Depends(Provide[Container.answer_service]),
     game_service: GameService = Depends(Provide[Container.game_service]),
@@ -244,7 +279,7 @@ async def delete_answer_by_game_and_user(
 
 @router.post("/empty", response_model=AnswerResponseDTO)
 @inject
-async def create_empty_answer(
+def create_empty_answer(
     game_id: str,
     user_id: str,
     answer_service: AnswerService = Depends(Provide[Container.answer_service]),
@@ -267,23 +302,39 @@ async def create_empty_answer(
     )
 
 
-@router.post("/all")
+@router.post(
+    "/all",
+    response_model=TaskAcceptedResponseDTO,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 @inject
 def create_answer_for_all_users_per_game(
     game_id: str,
-    answer_service: AnswerService = Depends(Provide[Container.answer_service]),
+    task_queue: TaskQueue = Depends(Provide[Container.task_queue]),
     count: int = 1,
+    active_within_days: int | None = None,
 ):
     """
     Create Answers for every users.
-    If you want make 2 chances, you need to use this api twice.
+    count sets how many chances each user gets (existing slots count toward it,
+    so running it again only tops users up).
+    If active_within_days is given, only users who logged in within that many days get answers.
+    백그라운드 작업으로 실행된다. 결과(game_id, user_count, answer_count, elapsed_ms)는
+    GET /tasks/{task_id} 로 조회한다.
     """
-    res = answer_service.create_answer_for_all_users_per_game(game_id, count)
-
-    # TODO Response 수정해두기
-    if res:
-        return {200: "Success"}
-    return {500: "Failed"}
+    active_since = None
+    if active_within_days is not None:
+        active_since = datetime.now() - timedelta(days=active_within_days)
+
+    task_id = task_queue.submit(
+        TaskName.ANSWER_PROVISION,
+        {
+            "game_id": game_id,
+            "count": count,
+            "active_since": active_since.isoformat() if active_since else None,
+        },
+    )
+    return TaskAcceptedResponseDTO(task_id=task_id)
 
 
 @router.put("/{answer_id}")
@@ -326,44 +377,61 @@ def update_answer(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/{game_id}/ranking")
+@router.get("/{game_id}/ranking", response_model=list[AnswerUserResponseDTO])
 @inject
 def get_game_ranking(
     game_id: str,
-    answer_service: AnswerService = Depends(Provide[Container.answer_service]),
-) -> list[AnswerUserResponseDTO]:
-    domain_answers = answer_service.get_corrected_answers_by_game(
-        game_id=game_id,
-        limit=10,
-    )
-
-    # 도메인 모델을 DTO로 변환
-    answer_dtos = []
-    for answer in domain_answers:
-        answer_dict = answer.__dict__.copy()
-
-        # user 정보가 있으면 처리
-        if hasattr(answer, "user") and answer.user is not None:
-            from user.interface.dtos.user_dto import UserResponseDTO
+    request: Request,
+    ranking_cache: GameRankingCache = Depends(Provide[Container.game_ranking_cache]),
+):
+    """게임 정답자 랭킹 (캐시된 JSON, If-None-Match 가 일치하면 304)"""
+    body, etag = ranking_cache.get(game_id)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
 
-            user_dto = UserResponseDTO(
-                id=answer.user.get("id"),
-                name="",  # 이름 정보가 없으므로 빈 문자열로 설정
-                nickname=answer.user.get("nickname"),
-            )
-            answer_dict["user"] = user_dto
-            answer_dtos.append(AnswerUserResponseDTO.model_validate(answer_dict))
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-    return answer_dtos
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
-@router.post("/user/calculate")
+@router.post(
+    "/user/calculate",
+    response_model=TaskAcceptedResponseDTO,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 @inject
-async def calculate_total_user_point(
+def calculate_total_user_point(
     game_id: str,
-    answer_service: AnswerService = Depends(Provide[Container.answer_service]),
+    task_queue: TaskQueue = Depends(Provide[Container.task_queue]),
     current_user: CurrentUser = Depends(get_admin_user),
 ):
-    answer_service.update_total_user_point(game_id=game_id)
+    """게임 포인트 반영 (백그라운드 작업, 결과는 GET /tasks/{task_id})"""
+    task_id = task_queue.submit(TaskName.ANSWER_CALCULATE_POINTS, {"game_id": game_id})
+    return TaskAcceptedResponseDTO(task_id=task_id)
+
 
-    return {"message": "Total user point calculated successfully"}
+@router.post("/user/reconcile", response_model=PointReconcileResponseDTO)
+@inject
+def reconcile_user_points(
+    fix: bool = False,
+    answer_service: AnswerService = Depends(Provide[Container.answer_service]),
+    current_user: CurrentUser = Depends(get_admin_user),
+) -> PointReconcileResponseDTO:
+    """
+    Recompute every user's point total from the answer table and report drift.
+    With fix=true, drifted totals are overwritten with the recomputed value.
+    """
+    drifts = answer_service.reconcile_user_points(fix=fix)
+    return PointReconcileResponseDTO(
+        fixed=fix,
+        drift_count=len(drifts),
+        drifts=[
+            PointDriftDTO(
+                user_id=drift.user_id,
+                stored_point=drift.stored_point,
+                expected_point=drift.expected_point,
+            )
+            for drift in drifts
+        ],
+    )
@@ -46,3 +46,22 @@ class AnswerUserResponseDTO(BaseModel):
 class AnswerResponseListDTO(BaseModel):
     total_count: int
     answers: List[AnswerResponseDTO]
+
+
+class AnswerProvisionResponseDTO(BaseModel):
+    game_id: str
+    user_count: int
+    answer_count: int
+    elapsed_ms: int
+
+
+class PointDriftDTO(BaseModel):
+    user_id: str
+    stored_point: int
+    expected_point: int
+
+
+class PointReconcileResponseDTO(BaseModel):
+    fixed: bool
+    drift_count: int
+    drifts: List[PointDriftDTO]
@@ -1,12 +1,16 @@
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import StrEnum
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 
+from common.metrics import metrics
 from config import get_settings
 
 settings = get_settings()
@@ -29,11 +33,64 @@ class CurrentUser:
     email: str | None = None
 
 
+class TokenCache:
+    """검증된 토큰 claims 의 LRU 캐시 (프로세스 단위)
+
+    같은 토큰을 반복해서 검증하지 않도록 한다. exp 가 지난 항목은 사용하지 않는다.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._items: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = metrics.counter("auth_token_cache_hits_total", "Verified JWT cache hits")
+        self._misses = metrics.counter("auth_token_cache_misses_total", "Verified JWT cache misses")
+
+    def get(self, token: str) -> dict | None:
+        with self._lock:
+            claims = self._items.get(token)
+            if claims is not None and claims.get("exp", 0) <= time.time():
+                del self._items[token]
+                claims = None
+            if claims is None:
+                self._misses.inc()
+                return None
+            self._items.move_to_end(token)
+        self._hits.inc()
+        return claims
+
+    def set(self, token: str, claims: dict) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._items[token] = claims
+            self._items.move_to_end(token)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+
+token_cache = TokenCache(settings.JWT_CACHE_SIZE)
+
+
 def decode_access_token(token: str):
+    """토큰 검증 후 claims 반환 (반환된 dict 는 캐시와 공유되므로 수정하지 않는다)"""
+    claims = token_cache.get(token)
+    if claims is not None:
+        return claims
     try:
-        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+    token_cache.set(token, claims)
+    return claims
+
+
+def get_token_claims(request: Request, token: str) -> dict:
+    """요청에서 이미 검증한 claims 가 있으면 재사용 (ActiveUserMiddleware 가 저장)"""
+    state = request.scope.get("state") or {}
+    if state.get("auth_token") == token:
+        return state["auth_claims"]
+    return decode_access_token(token=token)
 
 
 def create_access_token(
@@ -55,8 +112,8 @@ def create_access_token(
     return encoded_jwt
 
 
-def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]):
-    payload = decode_access_token(token=token)
+def get_current_user(request: Request, token: Annotated[str, Depends(oauth2_scheme)]):
+    payload = get_token_claims(request, token)
 
     user_id = payload.get("sub")
     role = payload.get("role")
@@ -66,8 +123,8 @@ def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]):
     return CurrentUser(id=user_id, role=Role(role))
 
 
-def get_admin_user(token: Annotated[str, Depends(oauth2_scheme)]):
-    payload = decode_access_token(token=token)
+def get_admin_user(request: Request, token: Annotated[str, Depends(oauth2_scheme)]):
+    payload = get_token_claims(request, token)
 
     user_id = payload.get("sub")
     role = payload.get("role")
@@ -27,7 +27,8 @@ async def quiz_app_exception_handler(request: Request, exc: QuizAppException):
             "success": False,
             "message": exc.message,
             "detail": exc.detail
-        }
+        },
+        headers=getattr(exc, "headers", None),
     )
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -66,3 +66,14 @@ class ExternalServiceError(QuizAppException):
         detail: Optional[Dict[str, Any]] = None
     ):
         super().__init__(message=message, status_code=502, detail=detail)
+
+class TooManyRequestsError(QuizAppException):
+    """처리 용량을 초과했을 때 발생하는 예외 (Retry-After 헤더 포함)"""
+    def __init__(
+        self,
+        message: str = "Too many requests",
+        retry_after: int = 1,
+        detail: Optional[Dict[str, Any]] = None
+    ):
+        super().__init__(message=message, status_code=429, detail=detail)
+        self.headers = {"Retry-After": str(retry_after)}
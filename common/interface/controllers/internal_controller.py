@@ -0,0 +1,25 @@
+import secrets
+
+from fastapi import APIRouter, Header, HTTPException, Response, status
+
+from common.metrics import metrics
+from config import get_settings
+
+settings = get_settings()
+
+router = APIRouter(prefix="/internal", tags=["internal"], include_in_schema=False)
+
+
+@router.get("/metrics")
+def get_metrics(authorization: str | None = Header(default=None)):
+    """프로세스 메트릭 (Prometheus text format)
+
+    nginx 에서 외부 접근을 막는다. METRICS_TOKEN 이 설정되어 있으면 Bearer 토큰도 확인한다.
+    """
+    if settings.METRICS_TOKEN and not secrets.compare_digest(
+        authorization or "", f"Bearer {settings.METRICS_TOKEN}"
+    ):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+    return Response(
+        content=metrics.render(), media_type="text/plain; version=0.0.4"
+    )
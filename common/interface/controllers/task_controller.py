@@ -0,0 +1,39 @@
+from datetime import datetime
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from common.auth import CurrentUser, get_admin_user
+from common.interface.dtos.task_dto import TaskResponseDTO
+from common.tasks import TaskQueue
+from containers import Container
+
+router = APIRouter(prefix="/tasks", tags=["tasks"])
+
+
+@router.get("/{task_id}", response_model=TaskResponseDTO)
+@inject
+def get_task(
+    task_id: str,
+    task_queue: TaskQueue = Depends(Provide[Container.task_queue]),
+    current_user: CurrentUser = Depends(get_admin_user),
+):
+    """백그라운드 작업 상태 / 결과 조회"""
+    task = task_queue.get(task_id)
+    if task is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+
+    def to_datetime(timestamp: float | None) -> datetime | None:
+        return datetime.fromtimestamp(timestamp) if timestamp else None
+
+    return TaskResponseDTO(
+        id=task.id,
+        name=task.name,
+        status=task.status,
+        attempts=task.attempts,
+        created_at=to_datetime(task.created_at),
+        started_at=to_datetime(task.started_at),
+        finished_at=to_datetime(task.finished_at),
+        result=task.result,
+        error=task.error,
+    )
@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+from common.tasks import TaskStatus
+
+
+class TaskAcceptedResponseDTO(BaseModel):
+    task_id: str
+    status: TaskStatus = TaskStatus.QUEUED
+
+
+class TaskResponseDTO(BaseModel):
+    id: str
+    name: str
+    status: TaskStatus
+    attempts: int
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    result: Any = None
+    error: str | None = None
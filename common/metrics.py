@@ -0,0 +1,182 @@
+"""프로세스 내부 메트릭 레지스트리
+
+Prometheus text format 으로 노출한다 (/internal/metrics).
+외부 의존성 없이 counter / gauge / summary 만 지원한다.
+uvicorn 워커마다 별도 레지스트리이므로 수집 시 pid 라벨로 구분한다.
+"""
+import os
+import secrets
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+
+class Counter:
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self.type = "counter"
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def samples(self) -> list[tuple[str, float]]:
+        return [(self.name, self._value)]
+
+    def families(self) -> list[tuple[str, str, str, list[tuple[str, float]]]]:
+        return [(self.name, self.type, self.help, self.samples())]
+
+
+class Gauge:
+    """값을 직접 설정하거나, 수집 시점에 callback 으로 계산하는 gauge"""
+
+    def __init__(self, name: str, help: str, callback: Callable[[], float] | None = None):
+        self.name = name
+        self.help = help
+        self.type = "gauge"
+        self._value = 0.0
+        self._callback = callback
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.inc(-amount)
+
+    @property
+    def value(self) -> float:
+        return self._callback() if self._callback else self._value
+
+    def samples(self) -> list[tuple[str, float]]:
+        return [(self.name, self.value)]
+
+    def families(self) -> list[tuple[str, str, str, list[tuple[str, float]]]]:
+        return [(self.name, self.type, self.help, self.samples())]
+
+
+class Summary:
+    """관측값의 개수 / 합계 / 최대값"""
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self.type = "summary"
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.sum += value
+            if value > self.max:
+                self.max = value
+
+    def samples(self) -> list[tuple[str, float]]:
+        return [
+            (f"{self.name}_count", self.count),
+            (f"{self.name}_sum", self.sum),
+            (f"{self.name}_max", self.max),
+        ]
+
+    def families(self) -> list[tuple[str, str, str, list[tuple[str, float]]]]:
+        # _max 는 summary 의 표준 sample 이 아니므로 별도 gauge 로 노출
+        return [
+            (self.name, self.type, self.help, self.samples()[:2]),
+            (f"{self.name}_max", "gauge", "", [(f"{self.name}_max", self.max)]),
+        ]
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: dict[str, Counter | Gauge | Summary] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str = "") -> Counter:
+        return self._get_or_create(Counter, name, help)
+
+    def gauge(
+        self, name: str, help: str = "", callback: Callable[[], float] | None = None
+    ) -> Gauge:
+        gauge = self._get_or_create(Gauge, name, help)
+        if callback:
+            gauge._callback = callback
+        return gauge
+
+    def summary(self, name: str, help: str = "") -> Summary:
+        return self._get_or_create(Summary, name, help)
+
+    def snapshot(self) -> dict[str, float]:
+        """{sample 이름: 값} (스크립트/테스트용)"""
+        return {
+            name: value
+            for metric in list(self._metrics.values())
+            for name, value in metric.samples()
+        }
+
+    def render(self) -> str:
+        """Prometheus text exposition format"""
+        labels = f'{{pid="{os.getpid()}"}}'
+        lines = []
+        for metric in list(self._metrics.values()):
+            for family, type, help, samples in metric.families():
+                if help:
+                    lines.append(f"# HELP {family} {help}")
+                lines.append(f"# TYPE {family} {type}")
+                for name, value in samples:
+                    lines.append(f"{name}{labels} {value}")
+        return "\n".join(lines) + "\n"
+
+    def _get_or_create(self, cls, name: str, help: str):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, help)
+                self._metrics[name] = metric
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} already registered as {metric.type}")
+            return metric
+
+
+metrics = MetricsRegistry()
+
+
+def serve_metrics(port: int, token: str | None = None) -> ThreadingHTTPServer:
+    """HTTP 서버가 없는 프로세스(워커)용 /metrics 엔드포인트를 백그라운드 스레드로 실행"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            if token and not secrets.compare_digest(
+                self.headers.get("Authorization", ""), f"Bearer {token}"
+            ):
+                self.send_error(401)
+                return
+            body = metrics.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("0.0.0.0", port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
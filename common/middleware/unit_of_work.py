@@ -0,0 +1,64 @@
+import logging
+
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from common.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+class UnitOfWorkMiddleware:
+    """요청마다 공유 세션을 열고 응답 시작 시점에 commit / rollback
+
+    - 상태 코드 < 400 이면 commit, 그 외 또는 예외 발생 시 rollback
+    - commit 이 실패하면 원래 응답 대신 500 을 보낸다
+    - after_commit 작업은 응답을 보낸 뒤 실행한다
+    """
+
+    def __init__(self, app: ASGIApp, uow: UnitOfWork | None = None):
+        self.app = app
+        self.uow = uow or UnitOfWork()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        unit, token = self.uow.begin()
+        commit_failed = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal commit_failed
+            if message["type"] == "http.response.start" and not unit.completed:
+                try:
+                    await run_in_threadpool(
+                        self.uow.complete, unit, message["status"] < 400
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to commit request transaction: {e}")
+                    commit_failed = True
+                    response = JSONResponse(
+                        status_code=500,
+                        content={
+                            "success": False,
+                            "message": "Internal server error",
+                            "detail": {},
+                        },
+                    )
+                    await response(scope, receive, send)
+                    return
+            if commit_failed:
+                return
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if not unit.completed:
+                await run_in_threadpool(self.uow.complete, unit, False)
+            self.uow.end(unit, token)
+
+        if unit.callbacks:
+            await run_in_threadpool(self.uow.run_callbacks, unit)
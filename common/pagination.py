@@ -0,0 +1,37 @@
+"""Keyset(커서) 페이지네이션
+
+커서는 마지막 행의 정렬 값과 id 를 담은 JSON 을 base64url 로 인코딩한 문자열이다.
+클라이언트는 내용을 해석하지 않고 next_cursor 를 그대로 다시 보낸다.
+"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from common.exceptions import ValidationError
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
+    has_more: bool = False
+
+
+def encode_cursor(data: dict[str, Any]) -> str:
+    raw = json.dumps(data, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValidationError("Invalid cursor")
+    if not isinstance(data, dict):
+        raise ValidationError("Invalid cursor")
+    return data
@@ -2,6 +2,7 @@ from redis import Redis
 from typing import Any
 import json
 from .config import RedisSettings
+from .reliable_queue import QueueJob, ReliableQueue
 
 
 class RedisClient:
@@ -14,6 +15,15 @@ class RedisClient:
             decode_responses=True,
         )
         self.settings = settings
+        # 점수 계산 작업 큐
+        self.queue = ReliableQueue(
+            self,
+            settings.QUEUE_NAME,
+            visibility_timeout=settings.QUEUE_VISIBILITY_TIMEOUT,
+            max_attempts=settings.QUEUE_MAX_ATTEMPTS,
+            retry_backoff=settings.QUEUE_RETRY_BACKOFF,
+            poll_timeout=settings.QUEUE_TIMEOUT,
+        )
 
     def get(self, key: str) -> Any:
         """캐시에서 값을 가져옴"""
@@ -29,13 +39,10 @@ class RedisClient:
         """캐시에서 값을 삭제"""
         self._redis.delete(key)
 
-    def enqueue(self, data: dict) -> None:
-        """작업을 큐에 추가"""
-        self._redis.lpush(self.settings.QUEUE_NAME, json.dumps(data))
+    def enqueue(self, data: dict, idempotency_key: str | None = None) -> bool:
+        """작업을 큐에 추가 (같은 idempotency_key 의 작업이 대기 중이면 추가하지 않음)"""
+        return self.queue.enqueue(data, idempotency_key=idempotency_key)
 
-    def dequeue(self) -> dict | None:
-        """큐에서 작업을 가져옴"""
-        data = self._redis.brpop(
-            self.settings.QUEUE_NAME, timeout=self.settings.QUEUE_TIMEOUT
-        )
-        return json.loads(data[1]) if data else None
+    def dequeue(self) -> QueueJob | None:
+        """큐에서 작업을 가져옴. 처리 후 queue.ack / queue.retry 를 호출해야 한다."""
+        return self.queue.reserve()
@@ -0,0 +1,127 @@
+import logging
+import threading
+import uuid
+from typing import Callable
+
+from common.metrics import metrics
+from common.redis.client import RedisClient
+
+logger = logging.getLogger(__name__)
+
+# 자신이 잡은 락일 때만 연장 / 해제
+EXTEND_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("pexpire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class ClusterJob:
+    """클러스터 전체에서 한 프로세스만 실행하는 주기 작업
+
+    모든 프로세스가 start() 하지만 Redis 락(SET NX PX)을 잡은 리더만 task 를 실행한다.
+    리더는 매 주기마다 락을 연장하고, 리더가 죽으면 lock_ttl 이 지난 뒤
+    다른 프로세스가 락을 잡아 이어서 실행한다.
+    """
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        name: str,
+        task: Callable[[], None],
+        interval: float = 30,
+        lock_ttl: float | None = None,
+    ):
+        self.redis_client = redis_client
+        self.name = name
+        self.task = task
+        self.interval = interval
+        self.lock_ttl = lock_ttl or interval * 3
+        self.lock_key = f"cluster_job:{name}:leader"
+        self.token = uuid.uuid4().hex
+        self.is_leader = False
+
+        self._extend_lock = redis_client._redis.register_script(EXTEND_LOCK_SCRIPT)
+        self._release_lock = redis_client._redis.register_script(RELEASE_LOCK_SCRIPT)
+        self._stop = threading.Event()
+        self._thread = None
+
+        metric_name = name.replace("-", "_")
+        self._leader_gauge = metrics.gauge(
+            f"cluster_job_{metric_name}_leader", f"1 if this process runs {name}"
+        )
+        self._runs = metrics.counter(f"cluster_job_{metric_name}_runs_total")
+        self._failures = metrics.counter(f"cluster_job_{metric_name}_failures_total")
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name=f"cluster-job-{self.name}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        if self.is_leader:
+            try:
+                self._release_lock(keys=[self.lock_key], args=[self.token])
+            except Exception as e:
+                logger.warning(f"Failed to release {self.name} leader lock: {e}")
+            self._set_leader(False)
+
+    def run_once(self) -> bool:
+        """리더라면 task 를 한 번 실행
+
+        Returns:
+            bool: 실행 여부
+        """
+        if not self._acquire_or_extend():
+            return False
+        try:
+            self.task()
+            self._runs.inc()
+        except Exception as e:
+            self._failures.inc()
+            logger.warning(f"Cluster job {self.name} failed: {e}")
+        return True
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                # Redis 장애 등. 다음 주기에 다시 시도
+                logger.warning(f"Cluster job {self.name} leader check failed: {e}")
+                self._set_leader(False)
+            self._stop.wait(self.interval)
+
+    def _acquire_or_extend(self) -> bool:
+        ttl_ms = int(self.lock_ttl * 1000)
+        if self.is_leader:
+            leader = bool(
+                self._extend_lock(keys=[self.lock_key], args=[self.token, ttl_ms])
+            )
+        else:
+            leader = bool(
+                self.redis_client._redis.set(self.lock_key, self.token, nx=True, px=ttl_ms)
+            )
+        if leader != self.is_leader:
+            logger.info(f"Cluster job {self.name}: leader={leader}")
+        self._set_leader(leader)
+        return leader
+
+    def _set_leader(self, leader: bool) -> None:
+        self.is_leader = leader
+        self._leader_gauge.set(1 if leader else 0)
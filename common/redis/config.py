@@ -15,5 +15,13 @@ class RedisSettings(BaseSettings):
     REDIS_PASSWORD: str | None = None
     EMAIL_VERIFICATION_TTL: int = 300  # 5 minutes
     CACHE_TTL: int = 3600  # 1 hour
+    CURRENT_GAME_LOCAL_TTL: float = 5.0  # 현재 게임 프로세스 메모리 캐시 (초)
+    ACTIVITY_RECORD_INTERVAL: float = 60  # 같은 사용자 활동은 이 간격(초)에 한 번만 기록
+    ACTIVITY_FLUSH_INTERVAL: float = 1  # 모인 활동 기록을 Redis 에 쓰는 주기 (초)
     QUEUE_NAME: str = "tasks_queue"
-    QUEUE_TIMEOUT: int = 0  # 0은 무한 대기
+    QUEUE_TIMEOUT: float = 1  # 작업 대기 시간 (초). 재시도 / 만료 작업도 이 주기로 확인
+    QUEUE_VISIBILITY_TIMEOUT: float = 300  # 이 시간 안에 끝나지 않은 작업은 실패로 보고 재시도
+    QUEUE_MAX_ATTEMPTS: int = 5  # 초과 시 {QUEUE_NAME}:dead 로 이동
+    QUEUE_RETRY_BACKOFF: float = 5  # 재시도 대기 (초). 실패할 때마다 두 배
+    TASK_QUEUE_NAME: str = "tasks"  # 백그라운드 작업 큐 (우선순위별로 {name}:high 등)
+    TASK_RESULT_TTL: int = 86400  # 작업 상태 / 결과 보관 시간 (초)
@@ -0,0 +1,278 @@
+"""재시도 / dead-letter 를 지원하는 Redis 작업 큐
+
+키 구성 ({name} = 큐 이름)
+- {name}             : 대기 중 작업 (LPUSH 로 추가, BLMOVE 로 꺼냄)
+- {name}:processing  : 처리 중 작업. 꺼낼 때 BLMOVE 로 원자적으로 옮겨지므로 워커가 죽어도 남는다
+- {name}:leases      : 처리 중 작업의 만료 시각 (ZSET). 만료되면 실패로 보고 다시 대기열로 보낸다
+- {name}:delayed     : 재시도 대기 중 작업 (ZSET, score = 실행 가능 시각)
+- {name}:dead        : max_attempts 번 실패한 작업
+- {name}:key:{key}   : 대기 중인 idempotency key. 같은 key 의 작업이 대기 중이면 다시 넣지 않는다
+
+작업은 at-least-once 로 처리되므로 작업 자체가 여러 번 실행되어도 결과가 같아야 한다.
+"""
+import json
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from common.redis.client import RedisClient
+
+logger = logging.getLogger(__name__)
+
+# idempotency key 가 이미 대기 중이면 추가하지 않음. ARGV[3] 이 있으면 그 시각에 실행 (delayed)
+ENQUEUE_SCRIPT = """
+if KEYS[2] ~= "" and not redis.call("set", KEYS[2], "1", "NX", "EX", ARGV[2]) then
+    return 0
+end
+if ARGV[3] ~= "" then
+    redis.call("zadd", KEYS[3], ARGV[3], ARGV[1])
+else
+    redis.call("lpush", KEYS[1], ARGV[1])
+end
+return 1
+"""
+
+# 실행 시각이 된 재시도 작업을 대기열로 이동
+PROMOTE_SCRIPT = """
+local due = redis.call("zrangebyscore", KEYS[1], "-inf", ARGV[1], "LIMIT", 0, ARGV[2])
+for _, raw in ipairs(due) do
+    redis.call("zrem", KEYS[1], raw)
+    redis.call("rpush", KEYS[2], raw)
+end
+return #due
+"""
+
+# 처리 중 작업을 끝내고 (재시도 / dead-letter 로) 이동. 이미 다른 곳에서 끝낸 작업이면 0
+FINISH_SCRIPT = """
+if redis.call("lrem", KEYS[1], 1, ARGV[1]) == 0 then
+    redis.call("zrem", KEYS[2], ARGV[1])
+    return 0
+end
+redis.call("zrem", KEYS[2], ARGV[1])
+if ARGV[3] ~= "" then
+    redis.call("zadd", KEYS[3], ARGV[3], ARGV[2])
+elseif ARGV[2] ~= "" then
+    redis.call("lpush", KEYS[3], ARGV[2])
+end
+return 1
+"""
+
+
+@dataclass
+class QueueJob:
+    id: str
+    data: dict
+    attempts: int
+    key: str | None
+    raw: str
+    enqueued_at: float | None = None
+
+
+class ReliableQueue:
+    def __init__(
+        self,
+        redis_client: "RedisClient",
+        name: str,
+        visibility_timeout: float = 300,
+        max_attempts: int = 5,
+        retry_backoff: float = 5,
+        max_retry_backoff: float = 300,
+        poll_timeout: float = 1,
+        key_ttl: int = 86400,
+    ):
+        self.redis_client = redis_client
+        self.name = name
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+        self.poll_timeout = poll_timeout
+        self.key_ttl = key_ttl
+
+        self.processing_key = f"{name}:processing"
+        self.leases_key = f"{name}:leases"
+        self.delayed_key = f"{name}:delayed"
+        self.dead_key = f"{name}:dead"
+
+        redis = redis_client._redis
+        self._enqueue = redis.register_script(ENQUEUE_SCRIPT)
+        self._promote = redis.register_script(PROMOTE_SCRIPT)
+        self._finish = redis.register_script(FINISH_SCRIPT)
+        self._next_maintenance = 0.0
+
+    def enqueue(
+        self, data: dict, idempotency_key: str | None = None, delay: float = 0
+    ) -> bool:
+        """작업 추가 (delay 초 뒤부터 실행 가능)
+
+        Returns:
+            bool: 추가 여부 (같은 idempotency_key 의 작업이 이미 대기 중이면 False)
+        """
+        raw = json.dumps(
+            {
+                "id": uuid.uuid4().hex,
+                "data": data,
+                "attempts": 0,
+                "key": idempotency_key,
+                "enqueued_at": time.time(),
+            }
+        )
+        marker = self._marker_key(idempotency_key) if idempotency_key else ""
+        run_at = time.time() + delay if delay > 0 else ""
+        return bool(
+            self._enqueue(
+                keys=[self.name, marker, self.delayed_key],
+                args=[raw, self.key_ttl, run_at],
+            )
+        )
+
+    def reserve(self, timeout: float | None = None, block: bool = True) -> QueueJob | None:
+        """작업을 꺼내 처리 중으로 표시 (최대 timeout 초 대기, block=False 면 대기하지 않음)
+
+        visibility_timeout 안에 ack / retry 하지 않으면 실패로 보고 다시 대기열로 보낸다.
+        """
+        if time.time() >= self._next_maintenance:
+            # 만료 / 재시도 작업 이동은 프로세스당 poll_timeout 마다 한 번
+            self._next_maintenance = time.time() + self.poll_timeout
+            self.requeue_expired()
+            self.promote_delayed()
+
+        redis = self.redis_client._redis
+        if block:
+            raw = redis.blmove(
+                self.name,
+                self.processing_key,
+                self.poll_timeout if timeout is None else timeout,
+                "RIGHT",
+                "LEFT",
+            )
+        else:
+            raw = redis.lmove(self.name, self.processing_key, "RIGHT", "LEFT")
+        if raw is None:
+            return None
+
+        redis.zadd(self.leases_key, {raw: time.time() + self.visibility_timeout})
+        job = self._decode(raw)
+        if job.key:
+            # 처리가 시작된 뒤 들어온 같은 key 의 작업은 다시 실행되어야 함
+            redis.delete(self._marker_key(job.key))
+        return job
+
+    def ack(self, job: QueueJob) -> bool:
+        """처리 완료
+
+        Returns:
+            bool: False 면 lease 가 만료되어 이미 다른 워커에게 넘어간 작업
+        """
+        return bool(
+            self._finish(
+                keys=[self.processing_key, self.leases_key, self.dead_key],
+                args=[job.raw, "", ""],
+            )
+        )
+
+    def retry(self, job: QueueJob, error: str) -> bool:
+        """처리 실패. 지수 backoff 후 다시 실행하거나, max_attempts 에 도달하면 dead-letter 로 이동
+
+        Returns:
+            bool: False 면 이미 다른 곳에서 끝낸 작업
+        """
+        attempts = job.attempts + 1
+        if attempts >= self.max_attempts:
+            return self.dead_letter(job, error)
+
+        delay = min(self.retry_backoff * 2 ** (attempts - 1), self.max_retry_backoff)
+        logger.warning(
+            f"Job {job.id} on {self.name} failed ({attempts}/{self.max_attempts}), "
+            f"retry in {delay:.0f}s: {error}"
+        )
+        return bool(
+            self._finish(
+                keys=[self.processing_key, self.leases_key, self.delayed_key],
+                args=[job.raw, self._encode(job, attempts, error), time.time() + delay],
+            )
+        )
+
+    def dead_letter(self, job: QueueJob, error: str) -> bool:
+        """재시도하지 않고 dead-letter 로 이동 (잘못된 작업 등)"""
+        attempts = job.attempts + 1
+        logger.error(
+            f"Job {job.id} on {self.name} moved to dead-letter "
+            f"after {attempts} attempts: {error}"
+        )
+        return bool(
+            self._finish(
+                keys=[self.processing_key, self.leases_key, self.dead_key],
+                args=[job.raw, self._encode(job, attempts, error), ""],
+            )
+        )
+
+    def promote_delayed(self) -> int:
+        """실행 시각이 된 재시도 작업을 대기열로 이동"""
+        return self._promote(keys=[self.delayed_key, self.name], args=[time.time(), 100])
+
+    def requeue_expired(self) -> int:
+        """lease 가 만료된 작업(워커 중단 등)을 실패로 처리
+
+        Returns:
+            int: 재시도 / dead-letter 로 보낸 작업 수
+        """
+        redis = self.redis_client._redis
+        now = time.time()
+
+        # BLMOVE 후 lease 를 기록하기 전에 워커가 죽은 작업에도 lease 부여
+        processing = redis.lrange(self.processing_key, 0, -1)
+        if processing:
+            redis.zadd(
+                self.leases_key,
+                {raw: now + self.visibility_timeout for raw in processing},
+                nx=True,
+            )
+
+        count = 0
+        for raw in redis.zrangebyscore(self.leases_key, "-inf", now):
+            if self.retry(self._decode(raw), "visibility timeout expired"):
+                count += 1
+        return count
+
+    def size(self) -> dict[str, int]:
+        """상태별 작업 수"""
+        pipe = self.redis_client._redis.pipeline(transaction=False)
+        pipe.llen(self.name)
+        pipe.llen(self.processing_key)
+        pipe.zcard(self.delayed_key)
+        pipe.llen(self.dead_key)
+        ready, processing, delayed, dead = pipe.execute()
+        return {"ready": ready, "processing": processing, "delayed": delayed, "dead": dead}
+
+    def _marker_key(self, key: str) -> str:
+        return f"{self.name}:key:{key}"
+
+    def _encode(self, job: QueueJob, attempts: int, error: str) -> str:
+        return json.dumps(
+            {
+                "id": job.id,
+                "data": job.data,
+                "attempts": attempts,
+                "key": job.key,
+                "enqueued_at": job.enqueued_at,
+                "error": error,
+            }
+        )
+
+    def _decode(self, raw: str) -> QueueJob:
+        payload: Any = json.loads(raw)
+        if isinstance(payload, dict) and "id" in payload and "data" in payload:
+            return QueueJob(
+                id=payload["id"],
+                data=payload["data"],
+                attempts=payload.get("attempts", 0),
+                key=payload.get("key"),
+                raw=raw,
+                enqueued_at=payload.get("enqueued_at"),
+            )
+        # 이전 형식 (LPUSH 된 데이터 그대로)
+        return QueueJob(id=uuid.uuid4().hex, data=payload, attempts=0, key=None, raw=raw)
@@ -0,0 +1,230 @@
+"""Redis 기반 백그라운드 작업
+
+요청 안에서 처리하기엔 느린 작업(메일 발송, 답변 슬롯 생성, 포인트 계산)을 이름으로 등록해
+워커(workers/task_worker.py)에서 실행한다.
+
+- 우선순위별로 ReliableQueue 를 하나씩 사용한다 (high > default > low)
+- payload 는 JSON 으로 직렬화 가능한 dict
+- 작업 상태와 결과는 task:{id} hash 에 result_ttl 동안 보관한다
+"""
+import json
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, Callable
+
+from common.metrics import metrics
+from common.redis.client import RedisClient
+from common.redis.reliable_queue import QueueJob, ReliableQueue
+from common.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+class TaskName(StrEnum):
+    EMAIL_SEND = "email.send"
+    EMAIL_VERIFICATION = "email.verification"
+    ANSWER_PROVISION = "answer.provision"
+    ANSWER_CALCULATE_POINTS = "answer.calculate_points"
+
+
+class TaskPriority(StrEnum):
+    HIGH = "high"
+    DEFAULT = "default"
+    LOW = "low"
+
+
+class TaskStatus(StrEnum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    RETRYING = "RETRYING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+
+@dataclass
+class TaskInfo:
+    id: str
+    name: str
+    status: TaskStatus
+    attempts: int
+    created_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    result: Any = None
+    error: str | None = None
+
+
+class TaskQueue:
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        name: str = "tasks",
+        result_ttl: int = 86400,
+        max_attempts: int = 5,
+        visibility_timeout: float = 300,
+        retry_backoff: float = 5,
+        poll_timeout: float = 1,
+    ):
+        self.redis_client = redis_client
+        self.result_ttl = result_ttl
+        self.poll_timeout = poll_timeout
+        self.queues = {
+            priority: ReliableQueue(
+                redis_client,
+                f"{name}:{priority}",
+                visibility_timeout=visibility_timeout,
+                max_attempts=max_attempts,
+                retry_backoff=retry_backoff,
+                poll_timeout=poll_timeout,
+            )
+            for priority in TaskPriority
+        }
+
+    def submit(
+        self,
+        name: TaskName,
+        payload: dict,
+        priority: TaskPriority = TaskPriority.DEFAULT,
+        delay: float = 0,
+    ) -> str:
+        """작업 등록 (delay 초 뒤 실행)
+
+        Returns:
+            str: 작업 id (get() 으로 상태 조회)
+        """
+        task_id = uuid.uuid4().hex
+        self._update(
+            task_id,
+            name=name,
+            status=TaskStatus.QUEUED,
+            attempts=0,
+            created_at=time.time(),
+        )
+        self.queues[priority].enqueue(
+            {"task_id": task_id, "name": name, "payload": payload}, delay=delay
+        )
+        return task_id
+
+    def get(self, task_id: str) -> TaskInfo | None:
+        data = self.redis_client._redis.hgetall(self._key(task_id))
+        if not data:
+            return None
+        return TaskInfo(
+            id=task_id,
+            name=data["name"],
+            status=TaskStatus(data["status"]),
+            attempts=int(data.get("attempts", 0)),
+            created_at=float(data["created_at"]),
+            started_at=float(data["started_at"]) if data.get("started_at") else None,
+            finished_at=float(data["finished_at"]) if data.get("finished_at") else None,
+            result=json.loads(data["result"]) if data.get("result") else None,
+            error=data.get("error"),
+        )
+
+    def reserve(self) -> tuple[ReliableQueue, QueueJob] | None:
+        """우선순위가 높은 큐부터 작업을 꺼냄. 모두 비어 있으면 poll_timeout 동안 대기"""
+        for queue in self.queues.values():
+            job = queue.reserve(block=False)
+            if job:
+                return queue, job
+
+        # 대기는 high 큐에서. 다른 큐의 작업은 최대 poll_timeout 뒤에 처리된다
+        queue = self.queues[TaskPriority.HIGH]
+        job = queue.reserve()
+        return (queue, job) if job else None
+
+    def mark_running(self, task_id: str, attempts: int) -> None:
+        self._update(
+            task_id, status=TaskStatus.RUNNING, attempts=attempts, started_at=time.time()
+        )
+
+    def mark_succeeded(self, task_id: str, result: Any) -> None:
+        self._update(
+            task_id,
+            status=TaskStatus.SUCCEEDED,
+            result=json.dumps(result, default=str),
+            finished_at=time.time(),
+        )
+
+    def mark_failed(self, task_id: str, error: str, final: bool) -> None:
+        self._update(
+            task_id,
+            status=TaskStatus.FAILED if final else TaskStatus.RETRYING,
+            error=error,
+            finished_at=time.time() if final else "",
+        )
+
+    def _update(self, task_id: str, **fields) -> None:
+        key = self._key(task_id)
+        pipe = self.redis_client._redis.pipeline(transaction=True)
+        pipe.hset(key, mapping={k: str(v) for k, v in fields.items()})
+        pipe.expire(key, self.result_ttl)
+        pipe.execute()
+
+    def _key(self, task_id: str) -> str:
+        return f"task:{task_id}"
+
+
+class TaskWorker:
+    """등록된 이름의 작업을 실행
+
+    handler 는 payload dict 를 받아 JSON 으로 직렬화 가능한 결과를 반환한다.
+    handler 하나가 하나의 DB 트랜잭션으로 실행된다.
+    """
+
+    def __init__(
+        self,
+        task_queue: TaskQueue,
+        handlers: dict[TaskName, Callable[[dict], Any]],
+        uow: UnitOfWork | None = None,
+    ):
+        self.task_queue = task_queue
+        self.handlers = handlers
+        self.uow = uow or UnitOfWork()
+        self._completed = metrics.counter("tasks_completed_total")
+        self._failed = metrics.counter("tasks_failed_total")
+        self._duration = metrics.summary("task_seconds", "Background task processing time")
+
+    def run_once(self) -> bool:
+        """작업 하나 처리
+
+        Returns:
+            bool: 처리한 작업이 있었는지
+        """
+        reserved = self.task_queue.reserve()
+        if not reserved:
+            return False
+        queue, job = reserved
+        self.process(queue, job)
+        return True
+
+    def process(self, queue: ReliableQueue, job: QueueJob) -> None:
+        task_id = job.data.get("task_id")
+        name = job.data.get("name")
+        handler = self.handlers.get(name)
+        if not task_id or handler is None:
+            queue.dead_letter(job, f"unknown task: {name}")
+            if task_id:
+                self.task_queue.mark_failed(task_id, f"unknown task: {name}", final=True)
+            return
+
+        self.task_queue.mark_running(task_id, job.attempts + 1)
+        started = time.perf_counter()
+        try:
+            with self.uow.transaction():
+                result = handler(job.data.get("payload") or {})
+        except Exception as e:
+            self._failed.inc()
+            logger.error(f"Task {name} ({task_id}) failed: {str(e)}")
+            final = job.attempts + 1 >= queue.max_attempts
+            queue.retry(job, str(e))
+            self.task_queue.mark_failed(task_id, str(e), final=final)
+        else:
+            self._completed.inc()
+            queue.ack(job)
+            self.task_queue.mark_succeeded(task_id, result)
+        finally:
+            self._duration.observe(time.perf_counter() - started)
@@ -0,0 +1,122 @@
+"""요청 단위 Unit of Work
+
+요청 하나가 하나의 세션 / 트랜잭션을 공유하도록 한다.
+
+- 리포지토리는 `with self.uow.session() as db:` 로 세션을 얻는다.
+  요청(또는 transaction()) 범위 안이면 공유 세션을, 밖(워커/스크립트)이면 새 세션을 준다.
+- 공유 세션의 commit() 은 flush 만 하고, 실제 commit 은 범위가 끝날 때 한 번 한다.
+- Redis 캐시 갱신처럼 commit 이후에 실행되어야 하는 작업은 after_commit() 으로 등록한다.
+"""
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class ScopedSession(Session):
+    """범위 안에서 공유되는 세션. commit() 은 flush 로 대체된다."""
+
+    def commit(self) -> None:
+        self.flush()
+
+    def commit_scope(self) -> None:
+        super().commit()
+
+
+@dataclass
+class _Scope:
+    session: ScopedSession
+    callbacks: list[Callable[[], None]] = field(default_factory=list)
+    completed: bool = False
+    committed: bool = False
+
+
+_current_scope: ContextVar[_Scope | None] = ContextVar("unit_of_work", default=None)
+
+
+class UnitOfWork:
+    def __init__(self, session_factory: sessionmaker = SessionLocal):
+        self.session_factory = session_factory
+
+    @contextmanager
+    def session(self) -> Iterator[Session]:
+        scope = _current_scope.get()
+        if scope is not None:
+            yield scope.session
+            return
+        with self.session_factory() as db:
+            yield db
+
+    @contextmanager
+    def transaction(self) -> Iterator[Session]:
+        """블록 전체를 하나의 트랜잭션으로 묶음 (요청 밖: 워커, 스크립트)
+
+        이미 범위 안이면 기존 트랜잭션에 참여한다.
+        """
+        if _current_scope.get() is not None:
+            with self.session() as db:
+                yield db
+            return
+
+        scope, token = self.begin()
+        try:
+            yield scope.session
+        except BaseException:
+            self.complete(scope, commit=False)
+            raise
+        else:
+            self.complete(scope, commit=True)
+        finally:
+            self.end(scope, token)
+        self.run_callbacks(scope)
+
+    def begin(self):
+        scope = _Scope(session=ScopedSession(**self.session_factory.kw))
+        return scope, _current_scope.set(scope)
+
+    def complete(self, scope: _Scope, commit: bool) -> None:
+        """commit 또는 rollback (한 번만 수행)"""
+        if scope.completed:
+            return
+        scope.completed = True
+        if commit:
+            try:
+                scope.session.commit_scope()
+            except Exception:
+                scope.session.rollback()
+                raise
+            scope.committed = True
+        else:
+            scope.session.rollback()
+
+    def end(self, scope: _Scope, token) -> None:
+        """세션을 닫고 범위 종료 (begin 과 같은 context 에서 호출)"""
+        if not scope.completed:
+            self.complete(scope, commit=False)
+        scope.session.close()
+        _current_scope.reset(token)
+
+    def run_callbacks(self, scope: _Scope) -> None:
+        """commit 되었다면 after_commit 작업 실행"""
+        if scope.committed:
+            for callback in scope.callbacks:
+                try:
+                    callback()
+                except Exception as e:
+                    logger.warning(f"after_commit callback failed: {e}")
+
+
+def after_commit(callback: Callable[[], None]) -> None:
+    """현재 범위가 commit 된 뒤 실행. 범위 밖이면 즉시 실행."""
+    scope = _current_scope.get()
+    if scope is None:
+        callback()
+    else:
+        scope.callbacks.append(callback)
@@ -12,6 +12,9 @@ class Settings(BaseSettings):
     APP_ENV: str = "development"
     DEBUG: bool = True
     LOG_LEVEL: str = "INFO"
+    # 동기 핸들러를 실행하는 스레드풀 크기 (워커 프로세스당)
+    # DB_POOL_SIZE + DB_MAX_OVERFLOW 보다 크면 남는 스레드는 커넥션 대기만 한다
+    THREADPOOL_SIZE: int = 40
 
     # Database Settings
     DATABASE_USERNAME: str = "postgres"
@@ -19,6 +22,12 @@ class Settings(BaseSettings):
     DB_HOST: str = "db"
     DB_PORT: int = 5432
     DB_NAME: str = "quizapp"
+    # Connection pool (워커 프로세스당). 최대 연결 수 = (POOL_SIZE + MAX_OVERFLOW) * 워커 수
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30  # 커넥션 대기 최대 시간 (초)
+    DB_POOL_RECYCLE: int = 1800  # 초 단위, -1 이면 재사용 제한 없음
+    DB_POOL_PRE_PING: bool = True
 
     @property
     def database_url(self) -> str:
@@ -28,6 +37,13 @@ class Settings(BaseSettings):
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    JWT_CACHE_SIZE: int = 10000  # 검증된 토큰 LRU 캐시 크기 (0 이면 사용 안 함)
+
+    # Password hashing
+    # cost 를 바꾸면 기존 해시는 다음 로그인 시 새 cost 로 다시 저장된다
+    BCRYPT_ROUNDS: int = 12
+    BCRYPT_MAX_WORKERS: int = 4  # 해시 전용 스레드 수 (보통 CPU 코어 수)
+    BCRYPT_MAX_QUEUE: int = 32  # 초과 시 429
 
     # Redis Settings
     REDIS_HOST: str = "localhost"
@@ -39,6 +55,14 @@ class Settings(BaseSettings):
     # Frontend Settings
     FRONTEND_URL: str
 
+    # Metrics
+    # 설정하면 /internal/metrics 호출 시 Authorization: Bearer <token> 필요
+    METRICS_TOKEN: str | None = None
+
+    # Worker
+    WORKER_CONCURRENCY: int = 4  # 워커 프로세스당 동시에 처리하는 작업 수
+    WORKER_METRICS_PORT: int = 9100  # 워커 /metrics 포트 (0 이면 사용 안 함)
+
 
 @lru_cache
 def get_settings():
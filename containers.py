@@ -1,19 +1,27 @@
 from dependency_injector import containers, providers
 
 from user.application.user_service import UserService
+from utils.crypto import Crypto
 from user.infra.repository.user_repo import UserRepository
 from user.infra.repository.user_repo import LoginHistoryRepository
 from user.infra.repository.coin_repo import CoinWalletRepository, CoinRepository
 from user.application.coin_service import CoinService
 from game.application.game_service import GameService
+from game.application.current_game_cache import CurrentGameCache
 from game.infra.repository.game_repo import GameRepository
 from answer.application.answer_service import AnswerService
 from answer.infra.repository.answer_repo import AnswerRepository
+from answer.application.game_ranking_cache import GameRankingCache
 from inquiry.application.inquiry_service import InquiryService
 from inquiry.infra.repository.inquiry_repo import InquiryRepository
+from common.unit_of_work import UnitOfWork
 from common.redis.client import RedisClient
+from common.redis.cluster_job import ClusterJob
 from common.redis.config import RedisSettings
+from common.tasks import TaskQueue
 from user.application.active_user_service import ActiveUserService
+from user.application.activity_recorder import ActivityRecorder
+from user.application.leaderboard_service import LeaderboardService
 
 
 class Container(containers.DeclarativeContainer):
@@ -27,21 +35,48 @@ class Container(containers.DeclarativeContainer):
             "answer.application",
             "inquiry.interface.controllers",
             "inquiry.application",
+            "common.interface.controllers",
         ],
     )
 
+    # Database
+    unit_of_work = providers.Singleton(UnitOfWork)
+
+    # Redis
+    redis_settings = providers.Singleton(RedisSettings)
+    redis_client = providers.Singleton(RedisClient, settings=redis_settings)
+    task_queue = providers.Singleton(
+        TaskQueue,
+        redis_client=redis_client,
+        name=redis_settings.provided.TASK_QUEUE_NAME,
+        result_ttl=redis_settings.provided.TASK_RESULT_TTL,
+        max_attempts=redis_settings.provided.QUEUE_MAX_ATTEMPTS,
+        visibility_timeout=redis_settings.provided.QUEUE_VISIBILITY_TIMEOUT,
+        retry_backoff=redis_settings.provided.QUEUE_RETRY_BACKOFF,
+        poll_timeout=redis_settings.provided.QUEUE_TIMEOUT,
+    )
+
     # User
-    user_repo = providers.Singleton(UserRepository)
-    login_history_repo = providers.Singleton(LoginHistoryRepository)
+    crypto = providers.Singleton(Crypto)
+    user_repo = providers.Singleton(UserRepository, uow=unit_of_work)
+    login_history_repo = providers.Singleton(LoginHistoryRepository, uow=unit_of_work)
+    leaderboard_service = providers.Singleton(
+        LeaderboardService,
+        redis_client=redis_client,
+        user_repo=user_repo,
+    )
     user_service = providers.Singleton(
         UserService,
         user_repo=user_repo,
         login_history_repo=login_history_repo,
+        leaderboard=leaderboard_service,
+        crypto=crypto,
+        task_queue=task_queue,
     )
 
     # CoinWallet
-    coin_wallet_repo = providers.Singleton(CoinWalletRepository)
-    coin_repo = providers.Singleton(CoinRepository)
+    coin_wallet_repo = providers.Singleton(CoinWalletRepository, uow=unit_of_work)
+    coin_repo = providers.Singleton(CoinRepository, uow=unit_of_work)
     coin_service = providers.Factory(
         CoinService,
         wallet_repository=coin_wallet_repo,
@@ -49,24 +84,38 @@ class Container(containers.DeclarativeContainer):
     )
 
     # Game
-    game_repo = providers.Singleton(GameRepository)
-    redis_settings = providers.Singleton(RedisSettings)
-    redis_client = providers.Singleton(RedisClient, settings=redis_settings)
+    game_repo = providers.Singleton(GameRepository, uow=unit_of_work)
+    current_game_cache = providers.Singleton(
+        CurrentGameCache,
+        redis_client=redis_client,
+        game_repo=game_repo,
+        local_ttl=redis_settings.provided.CURRENT_GAME_LOCAL_TTL,
+    )
     game_service = providers.Factory(
-        GameService, game_repo=game_repo, redis_client=redis_client
+        GameService,
+        game_repo=game_repo,
+        redis_client=redis_client,
+        current_game_cache=current_game_cache,
     )
 
     # Answer
-    answer_repo = providers.Singleton(AnswerRepository)
+    answer_repo = providers.Singleton(AnswerRepository, uow=unit_of_work)
     answer_service = providers.Singleton(
         AnswerService,
         answer_repo=answer_repo,
         game_repo=game_repo,
         user_repo=user_repo,
+        leaderboard=leaderboard_service,
+        current_game_cache=current_game_cache,
+    )
+    game_ranking_cache = providers.Singleton(
+        GameRankingCache,
+        redis_client=redis_client,
+        answer_repo=answer_repo,
     )
 
     # Inquiry
-    inquiry_repo = providers.Singleton(InquiryRepository)
+    inquiry_repo = providers.Singleton(InquiryRepository, uow=unit_of_work)
     inquiry_service = providers.Singleton(
         InquiryService,
         inquiry_repo=inquiry_repo,
@@ -75,5 +124,20 @@ class Container(containers.DeclarativeContainer):
     # Active Users
     active_user_service = providers.Singleton(
         ActiveUserService,
-        redis_client=redis_client
+        redis_client=redis_client,
+        user_repo=user_repo,
+    )
+    activity_recorder = providers.Singleton(
+        ActivityRecorder,
+        active_user_service=active_user_service,
+        record_interval=redis_settings.provided.ACTIVITY_RECORD_INTERVAL,
+        flush_interval=redis_settings.provided.ACTIVITY_FLUSH_INTERVAL,
+    )
+    # 클러스터에서 한 프로세스만 실행
+    active_users_job = providers.Singleton(
+        ClusterJob,
+        redis_client=redis_client,
+        name="active-users",
+        task=active_user_service.provided.refresh,
+        interval=active_user_service.provided.update_interval,
     )
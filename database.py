@@ -1,20 +1,82 @@
+import time
 from typing import Generator
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import QueuePool
 
+from common.metrics import metrics
 from config import get_settings
 
 settings = get_settings()
 
 SQLALCHEMY_DATABASE_URL = settings.database_url
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+
+class InstrumentedQueuePool(QueuePool):
+    """커넥션 checkout 대기 시간과 대기/타임아웃 횟수를 기록하는 QueuePool"""
+
+    def _do_get(self):
+        # size + overflow 를 모두 사용 중이면 반환될 때까지 대기하게 된다
+        if self._max_overflow > -1 and self.checkedout() >= self.size() + self._max_overflow:
+            metrics.counter(
+                "db_pool_waits_total", "Checkouts that had to wait for a free connection"
+            ).inc()
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            metrics.counter(
+                "db_pool_timeouts_total", "Checkouts that hit DB_POOL_TIMEOUT"
+            ).inc()
+            raise
+        finally:
+            metrics.summary(
+                "db_pool_checkout_seconds", "Time spent waiting for a pooled connection"
+            ).observe(time.perf_counter() - started)
+
+
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    poolclass=InstrumentedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
 
+def register_pool_metrics(engine) -> None:
+    pool = engine.pool
+    metrics.gauge("db_pool_size", "Configured pool size", callback=pool.size)
+    metrics.gauge(
+        "db_pool_checked_out", "Connections currently in use", callback=pool.checkedout
+    )
+    metrics.gauge(
+        "db_pool_checked_in", "Idle connections in the pool", callback=pool.checkedin
+    )
+    metrics.gauge(
+        "db_pool_overflow", "Connections opened beyond pool_size", callback=pool.overflow
+    )
+    checkouts = metrics.counter("db_pool_checkouts_total", "Connection checkouts")
+    connects = metrics.counter("db_pool_connects_total", "New DB connections opened")
+    invalidated = metrics.counter(
+        "db_pool_invalidated_total", "Connections invalidated (e.g. failed pre-ping)"
+    )
+
+    event.listen(engine, "checkout", lambda *args: checkouts.inc())
+    event.listen(engine, "connect", lambda *args: connects.inc())
+    event.listen(engine, "invalidate", lambda *args: invalidated.inc())
+
+
+register_pool_metrics(engine)
+
+
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
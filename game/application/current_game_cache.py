@@ -0,0 +1,105 @@
+import json
+import logging
+import time
+from dataclasses import asdict
+from datetime import datetime
+
+from common.redis.client import RedisClient
+from game.domain.game import Game, GameStatus
+from game.domain.repository.game_repo import IGameRepository
+
+logger = logging.getLogger(__name__)
+
+_DATETIME_FIELDS = ("created_at", "modified_at", "opened_at", "closed_at")
+
+
+class CurrentGameCache:
+    """현재 게임 2단계 캐시 (프로세스 메모리 + Redis)
+
+    Redis 의 버전 카운터를 기준으로 캐시 키를 만든다.
+    게임이 변경되면 invalidate() 로 버전을 올리고, 다른 프로세스는
+    메모리 캐시가 만료되는 시점(local_ttl)에 새 버전을 확인한다.
+    """
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        game_repo: IGameRepository,
+        local_ttl: float = 5.0,
+    ):
+        self.redis_client = redis_client
+        self.game_repo = game_repo
+        self.local_ttl = local_ttl
+        self.version_key = "game:current:version"
+        self.key_prefix = "game:current:"
+        # (version, game, expires_at)
+        self._local: tuple[str, Game | None, float] | None = None
+
+    def get(self) -> Game | None:
+        """현재 게임 조회 (없으면 None)"""
+        local = self._local
+        now = time.monotonic()
+        if local and local[2] > now:
+            return local[1]
+
+        try:
+            version = self.redis_client._redis.get(self.version_key) or "0"
+        except Exception as e:
+            logger.warning(f"Failed to read current game version: {e}")
+            return self.game_repo.find_latest()
+
+        if local and local[0] == version:
+            # 버전이 같으면 메모리 캐시를 연장
+            self._local = (version, local[1], now + self.local_ttl)
+            return local[1]
+
+        game = self._load(version)
+        self._local = (version, game, now + self.local_ttl)
+        return game
+
+    def get_game(self, game_id: str) -> Game | None:
+        """게임 조회. 현재 게임이면 캐시에서, 아니면 DB 에서"""
+        game = self.get()
+        if game and game.id == game_id:
+            return game
+        return self.game_repo.find_by_id(game_id)
+
+    def invalidate(self) -> None:
+        """게임 변경 시 호출. 버전을 올려 모든 프로세스의 캐시를 무효화"""
+        self._local = None
+        try:
+            self.redis_client._redis.incr(self.version_key)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate current game cache: {e}")
+
+    def _load(self, version: str) -> Game | None:
+        key = f"{self.key_prefix}{version}"
+        cached = self.redis_client._redis.get(key)
+        if cached is not None:
+            return self._deserialize(cached)
+
+        game = self.game_repo.find_latest()
+        self.redis_client._redis.setex(
+            key, self.redis_client.settings.CACHE_TTL, self._serialize(game)
+        )
+        return game
+
+    def _serialize(self, game: Game | None) -> str:
+        if game is None:
+            return "null"
+        data = asdict(game)
+        for field in _DATETIME_FIELDS:
+            if data[field]:
+                data[field] = data[field].isoformat()
+        data["status"] = game.status.value
+        return json.dumps(data, ensure_ascii=False)
+
+    def _deserialize(self, value: str) -> Game | None:
+        data = json.loads(value)
+        if data is None:
+            return None
+        for field in _DATETIME_FIELDS:
+            if data[field]:
+                data[field] = datetime.fromisoformat(data[field])
+        data["status"] = GameStatus(data["status"])
+        return Game(**data)
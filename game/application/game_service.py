@@ -3,18 +3,26 @@ from ulid import ULID
 import pytz
 from dependency_injector.wiring import inject
 
+from game.domain.answer_matcher import clean_aliases
 from game.domain.game import Game, GameStatus
 from game.domain.repository.game_repo import IGameRepository
 from common.redis.client import RedisClient
+from common.unit_of_work import after_commit
+from game.application.current_game_cache import CurrentGameCache
 from datetime import timedelta
-from database import SessionLocal
 
 
 class GameService:
     @inject
-    def __init__(self, game_repo: IGameRepository, redis_client: RedisClient):
+    def __init__(
+        self,
+        game_repo: IGameRepository,
+        redis_client: RedisClient,
+        current_game_cache: CurrentGameCache | None = None,
+    ):
         self.game_repo = game_repo
         self.redis_client = redis_client
+        self.current_game_cache = current_game_cache
         self.ulid = ULID()
 
     def create_game(
@@ -26,6 +34,7 @@ class GameService:
         answer: str | None = None,
         question_link: str | None = None,
         answer_link: str | None = None,
+        answer_aliases: list[str] | None = None,
     ) -> Game:
         """
         Create a new game with the provided details and save it to the repository.
@@ -38,6 +47,7 @@ class GameService:
             answer (str | None, optional): The answer to the main question.
             question_link (str | None, optional): A link related to the question.
             answer_link (str | None, optional): A link related to the answer.
+            answer_aliases (list[str] | None, optional): Other spellings accepted as correct.
 
         Returns:
             Game: The created game object.
@@ -58,8 +68,10 @@ class GameService:
             answer=answer,
             question_link=question_link,
             answer_link=answer_link,
+            answer_aliases=clean_aliases(answer_aliases),
         )
         self.game_repo.save(game)
+        self._invalidate_current_game()
         return game
 
     def update_game(
@@ -72,6 +84,7 @@ class GameService:
         question_link: str | None = None,
         answer_link: str | None = None,
         status: GameStatus | None = None,
+        answer_aliases: list[str] | None = None,
     ):
         game = self.game_repo.find_by_id(id)
         if title:
@@ -88,10 +101,14 @@ class GameService:
             game.answer_link = answer_link
         if status:
             game.status = status
+        if answer_aliases is not None:
+            # 빈 리스트면 별칭 삭제
+            game.answer_aliases = clean_aliases(answer_aliases)
 
         game.modified_at = datetime.now(pytz.timezone("Asia/Seoul"))
 
         self.game_repo.update(game)
+        self._invalidate_current_game()
         return game
 
     def get_game(self, id: str) -> Game:
@@ -133,7 +150,10 @@ class GameService:
         # Raises:
         #     Exception: If no games found
         # """
-        game = self.game_repo.find_latest()
+        if self.current_game_cache:
+            game = self.current_game_cache.get()
+        else:
+            game = self.game_repo.find_latest()
         if not game:
             raise Exception("No current active game found")
         return game
@@ -144,8 +164,24 @@ class GameService:
             raise ValueError(f"Game not found: {game_id}")
         game.closed_at = closed_at
         self.game_repo.update(game)
+        self._invalidate_current_game()
         return game
 
+    def set_closing_time_if_unset(self, game_id: str, closed_at: datetime) -> bool:
+        """종료 시각이 아직 없을 때만 설정 (첫 정답자가 나왔을 때)
+
+        캐시된 게임에 이미 종료 시각이 있으면 DB 를 조회하지 않는다.
+        동시에 여러 요청이 들어와도 조건부 UPDATE 로 한 번만 설정된다.
+        """
+        if self.current_game_cache:
+            game = self.current_game_cache.get_game(game_id)
+            if game and game.closed_at is not None:
+                return False
+        updated = self.game_repo.set_closed_at_if_unset(game_id, closed_at)
+        if updated:
+            self._invalidate_current_game()
+        return updated
+
     def close_game(self, game_id: str) -> Game:
         """게임을 종료하고 점수 계산을 큐에 추가"""
         game = self.game_repo.find_by_id(game_id)
@@ -159,9 +195,14 @@ class GameService:
         game.status = GameStatus.CLOSED
         game.closed_at = datetime.now(pytz.timezone("Asia/Seoul")) + timedelta(hours=2)
         self.game_repo.update(game)
+        self._invalidate_current_game()
 
-        # 점수 계산 작업을 큐에 추가
-        self.redis_client.enqueue({"game_id": game_id})
+        # 점수 계산 작업을 큐에 추가 (이미 대기 중이면 한 번만)
+        after_commit(
+            lambda: self.redis_client.enqueue(
+                {"game_id": game_id}, idempotency_key=f"score:{game_id}"
+            )
+        )
 
         return game
 
@@ -170,12 +211,11 @@ class GameService:
         if not game:
             raise ValueError(f"Game not found: {game_id}")
         
-        # 게임과 관련된 답변 삭제
-        with SessionLocal() as db:
-            from answer.infra.db_models.answer import Answer
-            # 관련된 답변 먼저 삭제
-            db.query(Answer).filter(Answer.game_id == game_id).delete()
-            db.commit()
-            
+        # 관련된 답변도 함께 삭제된다
         self.game_repo.delete(game)
+        self._invalidate_current_game()
         return game
+
+    def _invalidate_current_game(self) -> None:
+        if self.current_game_cache:
+            after_commit(self.current_game_cache.invalidate)
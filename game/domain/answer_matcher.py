@@ -0,0 +1,45 @@
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Iterable
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_answer(text: str | None) -> str:
+    """비교용 정규화
+
+    - NFKC: 전각 문자(Ａ, １) -> 반각, 분리된 한글 자모 -> 완성형
+    - casefold: 대소문자 구분 없이 (lower 보다 넓은 범위)
+    - 공백 제거: "퀵 소트" == "퀵소트"
+    """
+    if not text:
+        return ""
+    return _WHITESPACE.sub("", unicodedata.normalize("NFKC", text).casefold())
+
+
+def clean_aliases(aliases: Iterable[str] | None) -> list[str]:
+    """빈 값과 정규화 후 중복인 별칭 제거 (입력 순서 유지)"""
+    cleaned: dict[str, str] = {}
+    for alias in aliases or []:
+        normalized = normalize_answer(alias)
+        if normalized and normalized not in cleaned:
+            cleaned[normalized] = alias.strip()
+    return list(cleaned.values())
+
+
+@dataclass(frozen=True)
+class AnswerMatcher:
+    """정답 + 별칭을 정규화한 집합. 제출 답변은 정규화 한 번과 set 조회 한 번으로 채점한다."""
+
+    accepted: frozenset[str]
+
+    @classmethod
+    def compile(cls, answer: str | None, aliases: Iterable[str] | None = None) -> "AnswerMatcher":
+        accepted = {normalize_answer(answer)}
+        accepted.update(normalize_answer(alias) for alias in aliases or [])
+        accepted.discard("")
+        return cls(accepted=frozenset(accepted))
+
+    def matches(self, submitted: str | None) -> bool:
+        return normalize_answer(submitted) in self.accepted
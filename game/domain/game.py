@@ -1,6 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
+
+from game.domain.answer_matcher import AnswerMatcher
 
 
 class GameStatus(str, Enum):
@@ -25,3 +28,9 @@ class Game:
     answer: str
     question_link: str | None
     answer_link: str | None
+    answer_aliases: list[str] = field(default_factory=list)
+
+    @cached_property
+    def matcher(self) -> AnswerMatcher:
+        # 게임 객체당 한 번만 만든다 (CurrentGameCache 에 캐시된 게임과 함께 재사용)
+        return AnswerMatcher.compile(self.answer, self.answer_aliases)
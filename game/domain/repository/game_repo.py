@@ -1,4 +1,5 @@
 from abc import ABCMeta, abstractmethod
+from datetime import datetime
 from game.domain.game import Game
 
 
@@ -19,6 +20,15 @@ class IGameRepository(metaclass=ABCMeta):
     def update(self, game: Game) -> Game:
         raise NotImplementedError
 
+    @abstractmethod
+    def set_closed_at_if_unset(self, id: str, closed_at: datetime) -> bool:
+        """Set closed_at only if it is still NULL (single conditional UPDATE)
+
+        Returns:
+            bool: True if this call set it
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def find_latest(self) -> Game | None:
         """Find the game with the highest number
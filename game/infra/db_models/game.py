@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Text, Integer, Enum
+from sqlalchemy import Column, String, DateTime, Text, Integer, Enum, JSON
 from sqlalchemy.orm import Mapped, relationship
 
 from database import Base
@@ -32,6 +32,10 @@ class Game(Base):
     answer: Mapped[str] = Column(Text, nullable=False)
     question_link: Mapped[str] = Column(String(256), nullable=True)
     answer_link: Mapped[str] = Column(String(256), nullable=True)
+    # 정답으로 인정하는 다른 표기 (채점 시 정규화해서 비교)
+    answer_aliases: Mapped[list[str]] = Column(
+        JSON, nullable=False, default=list, server_default="[]"
+    )
 
     # Relationships
     answers = relationship(
@@ -1,12 +1,19 @@
+from datetime import datetime
+
 from fastapi import HTTPException, status
+from sqlalchemy import update
 
-from database import SessionLocal
+from common.unit_of_work import UnitOfWork
 from game.domain.repository.game_repo import IGameRepository
 from game.domain.game import Game as GameVO
 from game.infra.db_models.game import Game, GameStatus
+from answer.infra.db_models.answer import Answer
 
 
 class GameRepository(IGameRepository):
+    def __init__(self, uow: UnitOfWork | None = None):
+        self.uow = uow or UnitOfWork()
+
     def save(self, game: GameVO):
         db_game = Game(
             id=game.id,
@@ -23,15 +30,16 @@ class GameRepository(IGameRepository):
             answer=game.answer,
             question_link=game.question_link,
             answer_link=game.answer_link,
+            answer_aliases=list(game.answer_aliases or []),
         )
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             db.add(db_game)
             db.commit()
             db.refresh(db_game)
             game.number = db_game.number  # 자동 생성된 number를 도메인 객체에 반영
 
     def find_all(self) -> list[GameVO]:
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             games = db.query(Game).all()
             return [
                 GameVO(
@@ -49,13 +57,14 @@ class GameRepository(IGameRepository):
                     answer=game.answer,
                     question_link=game.question_link,
                     answer_link=game.answer_link,
+                    answer_aliases=list(game.answer_aliases or []),
                 )
                 for game in games
             ]
 
     def find_by_id(self, id: str) -> GameVO | None:
-        with SessionLocal() as db:
-            db_game = db.query(Game).filter(Game.id == id).first()
+        with self.uow.session() as db:
+            db_game = db.get(Game, id)
             if not db_game:
                 return None
             return GameVO(
@@ -73,11 +82,23 @@ class GameRepository(IGameRepository):
                 answer=db_game.answer,
                 question_link=db_game.question_link,
                 answer_link=db_game.answer_link,
+                answer_aliases=list(db_game.answer_aliases or []),
             )
 
+    def set_closed_at_if_unset(self, id: str, closed_at: datetime) -> bool:
+        with self.uow.session() as db:
+            result = db.execute(
+                update(Game)
+                .where(Game.id == id, Game.closed_at.is_(None))
+                .values(closed_at=closed_at)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            return result.rowcount == 1
+
     def update(self, game: GameVO) -> GameVO:
-        with SessionLocal() as db:
-            db_game = db.query(Game).filter(Game.id == game.id).first()
+        with self.uow.session() as db:
+            db_game = db.get(Game, game.id)
             if not db_game:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -95,6 +116,7 @@ class GameRepository(IGameRepository):
             db_game.answer = game.answer
             db_game.question_link = game.question_link
             db_game.answer_link = game.answer_link
+            db_game.answer_aliases = list(game.answer_aliases)
 
             db.commit()
             db.refresh(db_game)
@@ -114,6 +136,7 @@ class GameRepository(IGameRepository):
                 answer=db_game.answer,
                 question_link=db_game.question_link,
                 answer_link=db_game.answer_link,
+                answer_aliases=list(db_game.answer_aliases or []),
             )
 
     def find_latest(self) -> GameVO | None:
@@ -122,7 +145,7 @@ class GameRepository(IGameRepository):
         Returns:
             GameVO | None: The game with the highest number, or None if no games exist
         """
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             # TODO
             db_game = (
                 db.query(Game)
@@ -147,10 +170,13 @@ class GameRepository(IGameRepository):
                 answer=db_game.answer,
                 question_link=db_game.question_link,
                 answer_link=db_game.answer_link,
+                answer_aliases=list(db_game.answer_aliases or []),
             )
 
     def delete(self, game: GameVO):
-        with SessionLocal() as db:
+        with self.uow.session() as db:
+            # 관련된 답변 먼저 삭제
+            db.query(Answer).filter(Answer.game_id == game.id).delete()
             db.query(Game).filter(Game.id == game.id).delete()
             db.commit()
         return game
@@ -159,7 +185,7 @@ class GameRepository(IGameRepository):
         raise NotImplementedError
 
     def find_by_status(self, status):
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             games = db.query(Game).filter(Game.status == status).all()
             return [
                 GameVO(
@@ -177,6 +203,7 @@ class GameRepository(IGameRepository):
                     answer=game.answer,
                     question_link=game.question_link,
                     answer_link=game.answer_link,
+                    answer_aliases=list(game.answer_aliases or []),
                 )
                 for game in games
             ]
@@ -19,7 +19,7 @@ router = APIRouter(prefix="/game", tags=["game"])
 
 @router.post("", status_code=status.HTTP_201_CREATED)
 @inject
-async def create_game(
+def create_game(
     body: GameCreateDTO,
     game_service: GameService = Depends(Provide[Container.game_service]),
     current_user: CurrentUser = Depends(get_admin_user),
@@ -33,6 +33,7 @@ async def create_game(
         answer=body.answer,
         question_link=body.question_link,
         answer_link=body.answer_link,
+        answer_aliases=body.answer_aliases,
     )
 
     return GameResponseDTO(
@@ -55,7 +56,7 @@ async def create_game(
 
 @router.put("/{game_id}")
 @inject
-async def update_game(
+def update_game(
     game_id: str,
     body: GameUpdateDTO,
     game_service: GameService = Depends(Provide[Container.game_service]),
@@ -70,6 +71,7 @@ async def update_game(
         question_link=body.question_link,
         answer_link=body.answer_link,
         status=body.status,
+        answer_aliases=body.answer_aliases,
     )
 
 
@@ -106,7 +108,7 @@ def get_current_game(
 
 @router.get("/{game_id}", response_model=GameResponseDTO)
 @inject
-async def get_game(
+def get_game(
     game_id: str,
     current_user: CurrentUser = Depends(get_admin_user),
     game_service: GameService = Depends(Provide[Container.game_service]),
@@ -136,12 +138,13 @@ async def get_game(
         answer=game.answer,
         question_link=game.question_link,
         answer_link=game.answer_link,
+        answer_aliases=game.answer_aliases,
     )
 
 
 @router.get("", response_model=list[GameResponseDTO])
 @inject
-async def get_games(
+def get_games(
     status: str | None = None,
     current_user: CurrentUser = Depends(get_admin_user),
     game_service: GameService = Depends(Provide[Container.game_service]),
@@ -174,6 +177,7 @@ async def get_games(
             answer=game.answer,
             question_link=game.question_link,
             answer_link=game.answer_link,
+            answer_aliases=game.answer_aliases,
         )
         for game in games
     ]
@@ -181,7 +185,7 @@ async def get_games(
 
 @router.post("/{game_id}/close", response_model=GameResponseDTO)
 @inject
-async def close_game(
+def close_game(
     game_id: str,
     game_service: GameService = Depends(Provide[Container.game_service]),
     current_user: CurrentUser = Depends(get_admin_user),
@@ -202,6 +206,7 @@ async def close_game(
         answer=game.answer,
         question_link=game.question_link,
         answer_link=game.answer_link,
+        answer_aliases=game.answer_aliases,
     )
 
 
@@ -21,6 +21,7 @@ class GameCreateDTO(GameBase):
     answer: str = Field(max_length=64)
     question_link: str = Field(max_length=128)
     answer_link: str = Field(max_length=128)
+    answer_aliases: list[str] = Field(default_factory=list, max_length=32)
 
 
 class GameUpdateDTO(GameBase):
@@ -31,6 +32,7 @@ class GameUpdateDTO(GameBase):
     question_link: str = Field(max_length=128)
     answer_link: str = Field(max_length=128)
     status: str = Field(max_length=16)
+    answer_aliases: list[str] | None = Field(default=None, max_length=32)
 
 
 class GameResponseDTO(GameBase):
@@ -48,6 +50,7 @@ class GameResponseDTO(GameBase):
     answer: str | None
     question_link: str | None
     answer_link: str | None
+    answer_aliases: list[str] | None = None
 
 class CurrentGameResponseDTO(GameBase):
     id: str
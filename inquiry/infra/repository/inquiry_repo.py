@@ -1,10 +1,13 @@
-from database import SessionLocal
+from common.unit_of_work import UnitOfWork
 from inquiry.domain.repository.inquiry_repo import IInquiryRepository
 from inquiry.domain.inquiry import Inquiry as InquiryVO
 from inquiry.infra.db_models.inquiry import Inquiry
 
 
 class InquiryRepository(IInquiryRepository):
+    def __init__(self, uow: UnitOfWork | None = None):
+        self.uow = uow or UnitOfWork()
+
     def save(self, inquiry: InquiryVO):
         inquiry = Inquiry(
             id=inquiry.id,
@@ -14,14 +17,14 @@ class InquiryRepository(IInquiryRepository):
             is_replied=inquiry.is_replied,
             created_at=inquiry.created_at,
         )
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             db.add(inquiry)
             db.commit()
             db.refresh(inquiry)
             inquiry.id = inquiry.id
 
     def find_all(self) -> list[InquiryVO]:
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             inquiries = db.query(Inquiry).all()
             return [
                 InquiryVO(
@@ -36,8 +39,8 @@ class InquiryRepository(IInquiryRepository):
             ]
 
     def find_by_id(self, id: str) -> InquiryVO:
-        with SessionLocal() as db:
-            inquiry = db.query(Inquiry).filter(Inquiry.id == id).first()
+        with self.uow.session() as db:
+            inquiry = db.get(Inquiry, id)
             if not inquiry:
                 raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
             return InquiryVO(
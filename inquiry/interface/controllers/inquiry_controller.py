@@ -14,7 +14,7 @@ router = APIRouter(prefix="/inquiry", tags=["inquiry"])
 
 @router.post("", status_code=201, response_model=InquiryResponseDTO)
 @inject
-async def create_inquiry(
+def create_inquiry(
     body: InquiryCreateDTO,
     inquiry_service: InquiryService = Depends(Provide[Container.inquiry_service]),
 ) -> InquiryResponseDTO:
@@ -35,7 +35,7 @@ async def create_inquiry(
 
 @router.get("", response_model=list[InquiryResponseDTO])
 @inject
-async def find_all_inquiry(
+def find_all_inquiry(
     inquiry_service: InquiryService = Depends(Provide[Container.inquiry_service]),
 ) -> list[InquiryResponseDTO]:
     inquiries = inquiry_service.get_inquiries()
@@ -54,7 +54,7 @@ async def find_all_inquiry(
 
 @router.patch("/{inquiry_id}", status_code=200, response_model=InquiryResponseDTO)
 @inject
-async def update_inquiry(
+def update_inquiry(
     inquiry_id: str,
     body: InquiryCreateDTO,
     inquiry_service: InquiryService = Depends(Provide[Container.inquiry_service]),
@@ -77,7 +77,7 @@ async def update_inquiry(
 
 @router.delete("/{inquiry_id}", status_code=204)
 @inject
-async def delete_inquiry(
+def delete_inquiry(
     inquiry_id: str,
     inquiry_service: InquiryService = Depends(Provide[Container.inquiry_service]),
 ) -> None:
@@ -3,7 +3,9 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.exc import SQLAlchemyError
 import logging
+import anyio
 
+from config import get_settings
 from containers import Container
 from user.interface.controllers.user_controller import router as user_router
 from user.interface.controllers.coin_controller import router as coin_router
@@ -11,6 +13,8 @@ from game.interface.controllers.game_controller import router as game_router
 from answer.interface.controllers.answer_controller import router as answer_router
 from inquiry.interface.controllers.inquiry_controller import router as inquiry_router
 from user.interface.controllers.active_user_controller import router as active_user_router
+from common.interface.controllers.internal_controller import router as internal_router
+from common.interface.controllers.task_controller import router as task_router
 from common.exceptions import QuizAppException
 from common.error_handlers import (
     quiz_app_exception_handler,
@@ -19,10 +23,14 @@ from common.error_handlers import (
     unhandled_exception_handler,
 )
 from common.middleware.active_users import ActiveUserMiddleware
+from common.middleware.unit_of_work import UnitOfWorkMiddleware
+from common.metrics import metrics
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+settings = get_settings()
+
 app = FastAPI(
     title="Quiz App API",
     description="Quiz Application API",
@@ -41,9 +49,13 @@ app.include_router(router=game_router)
 app.include_router(router=answer_router)
 app.include_router(router=inquiry_router)
 app.include_router(router=active_user_router)
+app.include_router(router=internal_router)
+app.include_router(router=task_router)
 
 # 미들웨어 등록
 app.add_middleware(ActiveUserMiddleware)
+# 요청 단위 DB 세션 / 트랜잭션
+app.add_middleware(UnitOfWorkMiddleware, uow=container.unit_of_work())
 
 # # CORS 설정
 # app.add_middleware(
@@ -61,17 +73,31 @@ app.add_exception_handler(SQLAlchemyError, sqlalchemy_exception_handler)
 app.add_exception_handler(Exception, unhandled_exception_handler)
 
 
-# 애플리케이션 시작 시 활성 사용자 서비스의 백그라운드 업데이터 시작
+# 동기 핸들러 / 의존성이 실행되는 스레드풀 크기 설정
+@app.on_event("startup")
+async def configure_threadpool():
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = settings.THREADPOOL_SIZE
+    metrics.gauge("threadpool_size", "Threads available for sync handlers").set(
+        limiter.total_tokens
+    )
+    metrics.gauge(
+        "threadpool_in_use",
+        "Threads currently running sync handlers",
+        callback=lambda: limiter.borrowed_tokens,
+    )
+
+
+# 애플리케이션 시작 시 활성 사용자 갱신 작업 시작 (리더로 선출된 프로세스만 실제 실행)
 @app.on_event("startup")
 def startup_event():
-    active_user_service = container.active_user_service()
-    active_user_service.start_background_updater()
-    logger.info("활성 사용자 서비스 백그라운드 업데이터 시작")
+    container.active_users_job().start()
+    logger.info("활성 사용자 갱신 작업 시작")
 
 
-# 애플리케이션 종료 시 활성 사용자 서비스의 백그라운드 업데이터 중지
+# 애플리케이션 종료 시 활성 사용자 갱신 작업 중지 (리더였다면 락 해제)
 @app.on_event("shutdown")
 def shutdown_event():
-    active_user_service = container.active_user_service()
-    active_user_service.stop_background_updater()
-    logger.info("활성 사용자 서비스 백그라운드 업데이터 중지")
+    container.active_users_job().stop()
+    container.activity_recorder().stop()
+    logger.info("활성 사용자 갱신 작업 중지")
@@ -0,0 +1,69 @@
+"""add answer query indexes
+
+Revision ID: b7d2c4e91a05
+Revises: 6fc92e0b84e5
+Create Date: 2026-10-18 14:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2c4e91a05'
+down_revision: Union[str, None] = '6fc92e0b84e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 운영 중인 answer 테이블의 쓰기를 막지 않도록 CONCURRENTLY 로 생성 (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_answer_game_id_user_id_status',
+            'answer',
+            ['game_id', 'user_id', 'status'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_answer_game_id_solved_at_correct',
+            'answer',
+            ['game_id', 'solved_at'],
+            postgresql_where=sa.text(
+                "is_correct AND status = 'SUBMITTED' AND solved_at IS NOT NULL"
+            ),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_answer_user_id',
+            'answer',
+            ['user_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_answer_user_id',
+            table_name='answer',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_answer_game_id_solved_at_correct',
+            table_name='answer',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_answer_game_id_user_id_status',
+            table_name='answer',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
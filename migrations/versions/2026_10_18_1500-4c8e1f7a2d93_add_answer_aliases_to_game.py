@@ -0,0 +1,29 @@
+"""add answer_aliases to game
+
+Revision ID: 4c8e1f7a2d93
+Revises: b7d2c4e91a05
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c8e1f7a2d93'
+down_revision: Union[str, None] = 'b7d2c4e91a05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'game',
+        sa.Column('answer_aliases', sa.JSON(), server_default='[]', nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('game', 'answer_aliases')
@@ -0,0 +1,60 @@
+"""add user listing indexes
+
+Revision ID: 9e3a6b1d5f27
+Revises: 4c8e1f7a2d93
+Create Date: 2026-10-18 15:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e3a6b1d5f27'
+down_revision: Union[str, None] = '4c8e1f7a2d93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 관리자 목록 keyset 페이지네이션 (정렬 컬럼, id)
+KEYSET_INDEXES = {
+    'ix_user_point_id': ['point', 'id'],
+    'ix_user_nickname_id': ['nickname', 'id'],
+    'ix_user_created_at_id': ['created_at', 'id'],
+}
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        for name, columns in KEYSET_INDEXES.items():
+            op.create_index(
+                name,
+                'user',
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        # 닉네임 부분 검색 (ILIKE '%...%')
+        op.create_index(
+            'ix_user_nickname_trgm',
+            'user',
+            ['nickname'],
+            postgresql_using='gin',
+            postgresql_ops={'nickname': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    # pg_trgm 확장은 다른 곳에서 쓸 수 있으므로 남겨 둔다
+    with op.get_context().autocommit_block():
+        for name in ['ix_user_nickname_trgm', *reversed(KEYSET_INDEXES)]:
+            op.drop_index(
+                name,
+                table_name='user',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
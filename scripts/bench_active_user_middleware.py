@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""ActiveUserMiddleware 요청당 오버헤드 벤치마크
+
+빈 엔드포인트 하나만 있는 앱을 만들어 ASGI 로 직접 호출하고,
+미들웨어 없음 / 기존 BaseHTTPMiddleware 방식 / 현재 pure ASGI 방식의 요청당 시간을 비교합니다.
+Redis 는 사용하지 않습니다 (기록기는 호출 횟수만 세는 stub).
+
+    python scripts/bench_active_user_middleware.py --requests 20000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from common.auth import Role, create_access_token, decode_access_token
+from common.middleware.active_users import ActiveUserMiddleware
+
+
+class StubRecorder:
+    def __init__(self):
+        self.count = 0
+
+    def record(self, user_id: str) -> None:
+        self.count += 1
+
+
+class StubContainer:
+    def __init__(self):
+        self.recorder = StubRecorder()
+
+    def activity_recorder(self):
+        return self.recorder
+
+
+class LegacyActiveUserMiddleware(BaseHTTPMiddleware):
+    """변경 전 구현 (BaseHTTPMiddleware + Request 객체)"""
+
+    async def dispatch(self, request: Request, call_next):
+        auth_header = request.headers.get("Authorization")
+        if auth_header and auth_header.startswith("Bearer "):
+            token = auth_header.replace("Bearer ", "")
+            try:
+                payload = decode_access_token(token)
+                user_id = payload.get("sub")
+                if user_id:
+                    request.app.container.activity_recorder().record(user_id)
+            except Exception:
+                pass
+        return await call_next(request)
+
+
+async def ok(request):
+    return PlainTextResponse("ok")
+
+
+def build_app(middleware_class=None) -> Starlette:
+    middleware = [Middleware(middleware_class)] if middleware_class else []
+    app = Starlette(routes=[Route("/", ok)], middleware=middleware)
+    app.container = StubContainer()
+    return app
+
+
+async def run(app, requests: int, token: str | None) -> float:
+    headers = [(b"host", b"bench")]
+    if token:
+        headers.append((b"authorization", f"Bearer {token}".encode()))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/",
+        "raw_path": b"/",
+        "root_path": "",
+        "query_string": b"",
+        "headers": headers,
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(min(requests, 500)):  # warm up
+        await app(dict(scope), receive, send)
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - started) / requests * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ActiveUserMiddleware overhead benchmark")
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    token = create_access_token({"sub": "bench-user"}, role=Role.USER)
+    variants = [
+        ("no middleware", None),
+        ("BaseHTTPMiddleware (before)", LegacyActiveUserMiddleware),
+        ("pure ASGI (after)", ActiveUserMiddleware),
+    ]
+
+    baseline = {}
+    for label, middleware_class in variants:
+        for auth in (False, True):
+            app = build_app(middleware_class)
+            us = asyncio.run(run(app, args.requests, token if auth else None))
+            kind = "authenticated" if auth else "anonymous"
+            overhead = ""
+            if middleware_class is None:
+                baseline[auth] = us
+            else:
+                overhead = f"  ({us - baseline[auth]:+.1f} us vs no middleware)"
+            print(f"{label:<30} {kind:<14} {us:8.1f} us/request{overhead}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""answer 테이블 인덱스 벤치마크
+
+AnswerRepository 의 주요 쿼리를 answer 인덱스가 없을 때 / 있을 때로 나눠
+EXPLAIN (ANALYZE) 계획과 지연 시간(p50, p95)을 비교합니다.
+
+- 인덱스 없음: 트랜잭션 안에서 인덱스를 DROP 하고 측정한 뒤 rollback 합니다 (인덱스를 다시 만들지 않음).
+  측정하는 동안 answer 테이블이 잠기므로 운영 DB 에서 실행하지 마세요.
+- 쓰기 쿼리(claim_and_submit, score_game)는 매 실행을 savepoint 안에서 rollback 합니다.
+- --users / --games 를 주면 generate_dummy_users / generate_dummy_games 로 데이터를 만들고,
+  새 게임마다 유저당 --slots 개의 슬롯을 bulk 생성한 뒤 일부를 제출 / 정답 처리합니다.
+
+    python scripts/bench_answer_indexes.py --users 2000 --games 20 --slots 3
+    python scripts/bench_answer_indexes.py --iterations 200 --plans
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+
+from containers import Container
+from database import engine
+import database_models  # noqa: F401  모든 모델 등록 (relationship 문자열 참조)
+from answer.domain.answer import AnswerStatus
+from answer.infra.db_models.answer import Answer as AnswerModel
+from answer.infra.repository.answer_repo import CLAIM_AND_SUBMIT_SQL, SCORE_GAME_SQL
+from common.auth import Role
+from user.infra.db_models.user import User
+
+# 제출 시뮬레이션: 슬롯 일부를 SUBMITTED 로, 그중 일부를 정답으로
+SIMULATE_SUBMISSIONS_SQL = text(
+    """
+    WITH picked AS (
+        SELECT id, random() < :correct_ratio AS correct,
+               now() - random() * interval '7 days' AS submitted_at
+        FROM answer
+        WHERE game_id = ANY(:game_ids) AND random() < :submit_ratio
+    )
+    UPDATE answer
+    SET status = 'SUBMITTED',
+        answer = 'bench',
+        is_correct = picked.correct,
+        solved_at = CASE WHEN picked.correct THEN picked.submitted_at END,
+        updated_at = picked.submitted_at
+    FROM picked
+    WHERE answer.id = picked.id
+    """
+)
+
+
+def seed(args) -> None:
+    from scripts.generate_dummy_games import generate_dummy_games
+    from scripts.generate_dummy_users import generate_dummy_users
+
+    container = Container()
+    game_service = container.game_service()
+    answer_service = container.answer_service()
+
+    if args.users:
+        generate_dummy_users(args.users)
+
+    before = {game.id for game in game_service.get_games()}
+    if args.games:
+        generate_dummy_games(args.games)
+    game_ids = [game.id for game in game_service.get_games() if game.id not in before]
+
+    started = time.perf_counter()
+    for game_id in game_ids:
+        answer_service.create_answer_for_all_users_per_game(game_id, args.slots)
+    with engine.begin() as conn:
+        conn.execute(
+            SIMULATE_SUBMISSIONS_SQL,
+            {
+                "game_ids": game_ids,
+                "submit_ratio": args.submit_ratio,
+                "correct_ratio": args.correct_ratio,
+            },
+        )
+        conn.execute(text("ANALYZE answer"))
+    print(f"seeded {len(game_ids)} games in {time.perf_counter() - started:.1f}s")
+
+
+def pick_target(conn) -> tuple[str, str]:
+    """답변이 가장 많은 게임과, 그 게임에 남은 슬롯이 있는 유저"""
+    game_id = conn.execute(
+        text("SELECT game_id FROM answer GROUP BY game_id ORDER BY count(*) DESC LIMIT 1")
+    ).scalar()
+    if game_id is None:
+        sys.exit("answer 데이터가 없습니다. --users / --games 로 먼저 생성하세요.")
+    user_id = conn.execute(
+        text(
+            "SELECT user_id FROM answer WHERE game_id = :game_id "
+            "ORDER BY (status = 'NOT_USED') DESC LIMIT 1"
+        ),
+        {"game_id": game_id},
+    ).scalar()
+    return game_id, user_id
+
+
+def compile_sql(stmt) -> str:
+    return str(
+        stmt.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def build_queries(game_id: str, user_id: str) -> list[tuple[str, str, dict]]:
+    """(이름, SQL, 파라미터). 리포지토리와 같은 SQL / 조건을 사용"""
+    corrected_by_game = (
+        select(AnswerModel)
+        .join(User, AnswerModel.user_id == User.id)
+        .where(
+            AnswerModel.game_id == game_id,
+            AnswerModel.is_correct == True,  # noqa: E712
+            AnswerModel.solved_at != None,  # noqa: E711
+            AnswerModel.status == AnswerStatus.SUBMITTED,
+            User.role == Role.USER,
+        )
+        .order_by(AnswerModel.solved_at)
+        .limit(10)
+    )
+    unused_by_game_and_user = select(AnswerModel).where(
+        AnswerModel.game_id == game_id,
+        AnswerModel.user_id == user_id,
+        AnswerModel.status == AnswerStatus.NOT_USED,
+    )
+    corrected_by_game_and_user = (
+        select(AnswerModel)
+        .where(
+            AnswerModel.game_id == game_id,
+            AnswerModel.user_id == user_id,
+            AnswerModel.is_correct == True,  # noqa: E712
+        )
+        .limit(1)
+    )
+    by_user = select(AnswerModel).where(AnswerModel.user_id == user_id)
+
+    return [
+        (
+            "claim_and_submit",
+            CLAIM_AND_SUBMIT_SQL.text,
+            {
+                "game_id": game_id,
+                "user_id": user_id,
+                "answer": "bench",
+                "is_correct": False,
+                "solved_at": None,
+                "submitted_at": datetime.now(),
+            },
+        ),
+        (
+            "score_game",
+            SCORE_GAME_SQL.text,
+            {"game_id": game_id, "multiplier": 50, "limit": 10},
+        ),
+        ("corrected_by_game", compile_sql(corrected_by_game), {}),
+        ("unused_by_game_and_user", compile_sql(unused_by_game_and_user), {}),
+        ("corrected_by_game_and_user", compile_sql(corrected_by_game_and_user), {}),
+        ("by_user", compile_sql(by_user), {}),
+    ]
+
+
+def measure(conn, queries, iterations: int) -> dict[str, dict]:
+    results = {}
+    for name, sql, params in queries:
+        timings = []
+        for _ in range(iterations):
+            savepoint = conn.begin_nested()
+            started = time.perf_counter()
+            conn.execute(text(sql), params).all()
+            timings.append((time.perf_counter() - started) * 1000)
+            savepoint.rollback()
+
+        savepoint = conn.begin_nested()
+        plan = conn.execute(
+            text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"), params
+        ).scalars().all()
+        savepoint.rollback()
+
+        timings.sort()
+        results[name] = {
+            "p50": statistics.median(timings),
+            "p95": timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+            "plan": plan,
+        }
+    return results
+
+
+def scan_nodes(plan: list[str]) -> str:
+    """계획에서 answer 테이블을 읽는 방식만 요약"""
+    nodes = [
+        line.strip().lstrip("-> ").split("  (")[0]
+        for line in plan
+        if " on answer" in line
+    ]
+    return "; ".join(dict.fromkeys(nodes)) or "-"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Answer index benchmark")
+    parser.add_argument("--users", type=int, default=0, help="생성할 더미 유저 수")
+    parser.add_argument("--games", type=int, default=0, help="생성할 더미 게임 수")
+    parser.add_argument("--slots", type=int, default=3, help="게임별 유저당 슬롯 수")
+    parser.add_argument("--submit-ratio", type=float, default=0.6)
+    parser.add_argument("--correct-ratio", type=float, default=0.2)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--plans", action="store_true", help="EXPLAIN 결과 전체 출력")
+    args = parser.parse_args()
+
+    if args.users or args.games:
+        seed(args)
+
+    index_names = [index.name for index in AnswerModel.__table__.indexes]
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT count(*) FROM answer")).scalar()
+        game_id, user_id = pick_target(conn)
+        queries = build_queries(game_id, user_id)
+        print(f"answer rows={rows:,} game={game_id} user={user_id}")
+
+        existing = set(
+            conn.execute(
+                text("SELECT indexname FROM pg_indexes WHERE tablename = 'answer'")
+            ).scalars()
+        )
+        missing = [name for name in index_names if name not in existing]
+        if missing:
+            print(f"인덱스가 없습니다: {', '.join(missing)} (alembic upgrade head 후 다시 실행)")
+        conn.rollback()
+
+        with conn.begin() as transaction:
+            for name in index_names:
+                conn.execute(text(f'DROP INDEX IF EXISTS "{name}"'))
+            before = measure(conn, queries, args.iterations)
+            transaction.rollback()
+
+        with conn.begin() as transaction:
+            after = measure(conn, queries, args.iterations)
+            transaction.rollback()
+
+    print(f"\n{'query':<28} {'before p50/p95 ms':>20} {'after p50/p95 ms':>20} {'speedup':>8}")
+    for name, _, _ in queries:
+        b, a = before[name], after[name]
+        print(
+            f"{name:<28} {b['p50']:>9.2f} / {b['p95']:<8.2f} "
+            f"{a['p50']:>9.2f} / {a['p95']:<8.2f} {b['p50'] / max(a['p50'], 1e-6):>7.1f}x"
+        )
+        print(f"  before: {scan_nodes(b['plan'])}")
+        print(f"  after : {scan_nodes(a['plan'])}")
+
+    if args.plans:
+        for name, _, _ in queries:
+            for label, result in (("before", before[name]), ("after", after[name])):
+                print(f"\n== {name} ({label})")
+                print("\n".join(result["plan"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""답변 슬롯 bulk 생성 벤치마크
+
+임시 게임을 하나 만들어 전체 유저 대상으로 슬롯을 생성하고 소요 시간을 출력한 뒤 삭제합니다.
+--legacy-sample 을 주면 기존 방식(row 단위 save) 으로 N개를 만들어 전체 유저 기준 예상 시간을 함께 출력합니다.
+
+    python scripts/bench_answer_provisioning.py --count 3 --legacy-sample 200
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from containers import Container
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Answer slot provisioning benchmark")
+    parser.add_argument("--count", type=int, default=1, help="유저당 슬롯 수")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--legacy-sample", type=int, default=0)
+    args = parser.parse_args()
+
+    container = Container()
+    answer_service = container.answer_service()
+    game_service = container.game_service()
+    user_repo = container.user_repo()
+
+    game = game_service.create_game(
+        title="bench",
+        number=0,
+        question="bench",
+        answer="bench",
+    )
+    try:
+        result = answer_service.create_answer_for_all_users_per_game(
+            game.id, args.count, chunk_size=args.chunk_size
+        )
+        rows_per_sec = result.answer_count / max(result.elapsed_ms / 1000, 1e-6)
+        print(f"users={result.user_count} answers={result.answer_count}")
+        print(f"bulk: {result.elapsed_ms} ms ({rows_per_sec:,.0f} rows/s)")
+
+        if args.legacy_sample:
+            user_ids = user_repo.find_ids()[: args.legacy_sample]
+            started = time.perf_counter()
+            for user_id in user_ids:
+                answer_service.create_answer(game.id, user_id)
+            per_row = (time.perf_counter() - started) / max(len(user_ids), 1)
+            estimated = per_row * result.answer_count
+            print(
+                f"legacy: {per_row * 1000:.2f} ms/row, "
+                f"estimated {estimated:,.1f} s for {result.answer_count} answers"
+            )
+    finally:
+        game_service.delete_game(game.id)
+
+
+if __name__ == "__main__":
+    main()
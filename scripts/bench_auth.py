@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""인증 오버헤드 벤치마크 (폴링 엔드포인트 기준)
+
+ActiveUserMiddleware + get_current_user 의존성을 가진 빈 엔드포인트를 ASGI 로 직접 호출해
+요청당 시간과 JWT 검증 횟수를 비교합니다. Redis / DB 는 사용하지 않습니다.
+
+- before: 미들웨어와 의존성이 각각 토큰을 검증 (요청당 2회)
+- request state: 미들웨어가 검증한 claims 를 의존성이 재사용 (요청당 1회)
+- request state + LRU: 검증된 토큰 캐시까지 사용 (토큰당 1회)
+
+    python scripts/bench_auth.py --requests 20000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Annotated
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import Depends, FastAPI
+from jose import jwt
+
+from common import auth
+from common.auth import CurrentUser, Role, TokenCache, create_access_token, get_current_user
+from common.middleware.active_users import ActiveUserMiddleware
+
+
+class StubRecorder:
+    def record(self, user_id: str) -> None:
+        pass
+
+
+class StubContainer:
+    def activity_recorder(self):
+        return StubRecorder()
+
+
+def build_app(share_state: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/poll")
+    def poll(current_user: Annotated[CurrentUser, Depends(get_current_user)]):
+        return {"ok": True}
+
+    if not share_state:
+        # 미들웨어가 저장한 claims 를 지워 의존성이 다시 검증하도록 함
+        app.add_middleware(ClearStateMiddleware)
+    app.add_middleware(ActiveUserMiddleware)
+    app.container = StubContainer()
+    return app
+
+
+class ClearStateMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        scope.pop("state", None)
+        await self.app(scope, receive, send)
+
+
+async def run(app, requests: int, token: str) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/poll",
+        "raw_path": b"/poll",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"bench"),
+            (b"authorization", f"Bearer {token}".encode()),
+        ],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(min(requests, 500)):  # warm up
+        await app(dict(scope), receive, send)
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - started) / requests * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Auth overhead benchmark")
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    token = create_access_token({"sub": "bench-user"}, role=Role.USER)
+    decode_calls = 0
+    jwt_decode = jwt.decode
+
+    def counting_decode(*a, **kw):
+        nonlocal decode_calls
+        decode_calls += 1
+        return jwt_decode(*a, **kw)
+
+    jwt.decode = counting_decode
+
+    variants = [
+        ("before", False, 0),
+        ("request state", True, 0),
+        ("request state + LRU", True, 10000),
+    ]
+    baseline = None
+    for label, share_state, cache_size in variants:
+        auth.token_cache = TokenCache(cache_size)
+        app = build_app(share_state)
+        decode_calls = 0
+        us = asyncio.run(run(app, args.requests, token))
+        per_request = decode_calls / (args.requests + min(args.requests, 500))
+        delta = "" if baseline is None else f"  ({us - baseline:+.1f} us vs before)"
+        baseline = us if baseline is None else baseline
+        print(f"{label:<22} {us:8.1f} us/request  {per_request:.2f} decodes/request{delta}")
+
+
+if __name__ == "__main__":
+    main()
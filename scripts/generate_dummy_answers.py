@@ -44,7 +44,7 @@ def generate_dummy_answers(num_answers=50):
         return
     
     # 사용자 목록 가져오기
-    users = user_service.get_users()
+    users = user_service.get_users(limit=10000).items
     if not users:
         print("사용자가 없습니다. 먼저 사용자를 생성해주세요.")
         return
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""Redis 포인트 랭킹 재생성
+
+Redis 가 비었거나(cold start) DB 와 어긋났을 때 user 테이블 기준으로 랭킹을 다시 만듭니다.
+
+    python scripts/rebuild_leaderboard.py
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from containers import Container
+
+
+def main():
+    container = Container()
+    leaderboard = container.leaderboard_service()
+
+    started = time.perf_counter()
+    count = leaderboard.rebuild()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"랭킹 재생성 완료: {count}명 ({elapsed_ms:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
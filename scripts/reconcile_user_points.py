@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""user.point 정합성 점검
+
+answer 테이블의 포인트 합계와 user.point 를 비교해 차이가 나는 유저를 출력합니다.
+--fix 를 주면 차이가 나는 유저의 포인트를 재계산 값으로 덮어씁니다.
+
+    python scripts/reconcile_user_points.py [--fix]
+"""
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from containers import Container
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reconcile user point totals")
+    parser.add_argument("--fix", action="store_true", help="차이가 나는 포인트를 수정")
+    args = parser.parse_args()
+
+    container = Container()
+    answer_service = container.answer_service()
+
+    drifts = answer_service.reconcile_user_points(fix=args.fix)
+    for drift in drifts:
+        print(
+            f"{drift.user_id}: stored={drift.stored_point} "
+            f"expected={drift.expected_point} "
+            f"diff={drift.expected_point - drift.stored_point:+d}"
+        )
+
+    action = "수정" if args.fix else "발견"
+    print(f"포인트 불일치 {len(drifts)}건 {action}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import csv
+import io
+import json
+import pytest
+from datetime import datetime
+
+from answer.application.answer_export import ExportFormat, encode_rows
+from answer.application.answer_service import AnswerService
+from answer.domain.answer import AnswerStatus
+from common.exceptions import ValidationError
+
+
+def _rows(count: int):
+    for i in range(count):
+        yield {
+            "id": f"answer-{i}",
+            "game_id": "game-1",
+            "user_id": f"user-{i}",
+            "user_nickname": f"닉네임{i}",
+            "user_name": None,
+            "user_email": None,
+            "answer": "a, \"b\"",
+            "is_correct": i == 0,
+            "status": AnswerStatus.SUBMITTED,
+            "point": 0,
+            "solved_at": datetime(2025, 1, 1, 12, 0, 0) if i == 0 else None,
+            "created_at": datetime(2025, 1, 1),
+            "updated_at": datetime(2025, 1, 1),
+        }
+
+
+class TestAnswerExport:
+    def test_ndjson_chunks(self):
+        # When
+        chunks = list(encode_rows(_rows(5), ExportFormat.NDJSON, chunk_rows=2))
+
+        # Then
+        assert len(chunks) == 3
+        lines = b"".join(chunks).decode().splitlines()
+        first = json.loads(lines[0])
+        assert len(lines) == 5
+        assert first["user_nickname"] == "닉네임0"
+        assert first["status"] == "submitted"
+        assert first["solved_at"] == "2025-01-01T12:00:00"
+        assert json.loads(lines[1])["solved_at"] is None
+
+    def test_csv_header_and_quoting(self):
+        # When
+        body = b"".join(encode_rows(_rows(3), ExportFormat.CSV, chunk_rows=2))
+
+        # Then
+        rows = list(csv.DictReader(io.StringIO(body.decode("utf-8-sig"))))
+        assert [row["id"] for row in rows] == ["answer-0", "answer-1", "answer-2"]
+        assert rows[0]["answer"] == "a, \"b\""
+        assert rows[1]["solved_at"] == ""
+
+    def test_empty_export_has_csv_header_only(self):
+        body = b"".join(encode_rows(iter([]), ExportFormat.CSV))
+        assert body.decode("utf-8-sig").startswith("id,game_id,user_id")
+        assert b"".join(encode_rows(iter([]), ExportFormat.NDJSON)) == b""
+
+
+class TestAnswerServiceExport:
+    @pytest.fixture
+    def answer_service(self, mocker):
+        self.answer_repo = mocker.Mock()
+        self.game_repo = mocker.Mock()
+        return AnswerService(
+            answer_repo=self.answer_repo,
+            game_repo=self.game_repo,
+            user_repo=mocker.Mock(),
+        )
+
+    def test_export_passes_cursor(self, answer_service):
+        # Given
+        after = datetime(2025, 1, 1, 12, 0, 0)
+        self.answer_repo.iter_export_by_game_id.return_value = _rows(1)
+
+        # When
+        body = b"".join(
+            answer_service.export_answers_by_game(
+                "game-1", after_solved_at=after, after_id="answer-9", limit=100
+            )
+        )
+
+        # Then
+        self.answer_repo.iter_export_by_game_id.assert_called_once_with(
+            "game-1", after_solved_at=after, after_id="answer-9", limit=100
+        )
+        assert json.loads(body)["id"] == "answer-0"
+
+    def test_export_game_not_found(self, answer_service):
+        # Given
+        self.game_repo.find_by_id.return_value = None
+
+        # When / Then
+        with pytest.raises(ValueError):
+            answer_service.export_answers_by_game("missing")
+        self.answer_repo.iter_export_by_game_id.assert_not_called()
+
+    def test_export_rejects_solved_at_without_id(self, answer_service):
+        # When / Then: keyset 조건 없이 처음부터 다시 내보내지 않는다
+        with pytest.raises(ValidationError):
+            answer_service.export_answers_by_game(
+                "game-1", after_solved_at=datetime(2025, 1, 1, 12, 0, 0)
+            )
+        self.answer_repo.iter_export_by_game_id.assert_not_called()
@@ -0,0 +1,75 @@
+import pytest
+from datetime import datetime
+
+from answer.application.answer_service import AnswerService
+from answer.domain.answer import AnswerStatus
+
+
+class TestAnswerProvisioning:
+    @pytest.fixture
+    def answer_service(self, mocker):
+        self.answer_repo = mocker.Mock()
+        self.game_repo = mocker.Mock()
+        self.user_repo = mocker.Mock()
+        # bulk_create는 넘겨받은 iterable을 소비하고 개수를 반환
+        self.inserted = []
+
+        def bulk_create(answers, chunk_size=5000):
+            self.inserted.extend(answers)
+            return len(self.inserted)
+
+        self.answer_repo.bulk_create.side_effect = bulk_create
+        self.answer_repo.count_slots_by_game_id.return_value = {}
+        return AnswerService(
+            answer_repo=self.answer_repo,
+            game_repo=self.game_repo,
+            user_repo=self.user_repo,
+        )
+
+    def test_create_answer_for_all_users_per_game(self, answer_service):
+        # Given
+        self.user_repo.find_ids.return_value = ["user-1", "user-2", "user-3"]
+
+        # When
+        result = answer_service.create_answer_for_all_users_per_game("game-1", count=2)
+
+        # Then
+        assert result.game_id == "game-1"
+        assert result.user_count == 3
+        assert result.answer_count == 6
+        assert result.elapsed_ms >= 0
+        assert len({answer.id for answer in self.inserted}) == 6
+        assert all(answer.status == AnswerStatus.NOT_USED for answer in self.inserted)
+        assert sorted(answer.user_id for answer in self.inserted) == [
+            "user-1", "user-1", "user-2", "user-2", "user-3", "user-3"
+        ]
+        self.answer_repo.save.assert_not_called()
+
+    def test_create_answer_for_active_users_only(self, answer_service):
+        # Given
+        since = datetime(2025, 1, 1)
+        self.user_repo.find_ids.return_value = []
+
+        # When
+        result = answer_service.create_answer_for_all_users_per_game(
+            "game-1", active_since=since
+        )
+
+        # Then
+        self.user_repo.find_ids.assert_called_once_with(active_since=since)
+        assert result.answer_count == 0
+
+    def test_rerun_only_tops_up_missing_slots(self, answer_service):
+        # Given: 작업이 재전달되어 일부 유저는 이미 슬롯이 있음
+        self.user_repo.find_ids.return_value = ["user-1", "user-2", "user-3"]
+        self.answer_repo.count_slots_by_game_id.return_value = {"user-1": 2, "user-2": 1}
+
+        # When
+        result = answer_service.create_answer_for_all_users_per_game("game-1", count=2)
+
+        # Then
+        self.answer_repo.count_slots_by_game_id.assert_called_once_with("game-1")
+        assert result.answer_count == 3
+        assert sorted(answer.user_id for answer in self.inserted) == [
+            "user-2", "user-3", "user-3"
+        ]
@@ -0,0 +1,37 @@
+import pytest
+from datetime import datetime
+
+from answer.infra.repository.answer_repo import (
+    CLAIM_AND_SUBMIT_SQL,
+    LOCK_SUBMISSION_SQL,
+    AnswerRepository,
+)
+
+
+class TestClaimAndSubmit:
+    @pytest.fixture
+    def answer_repo(self, mocker):
+        self.db = mocker.MagicMock()
+        uow = mocker.MagicMock()
+        uow.session.return_value.__enter__.return_value = self.db
+        return AnswerRepository(uow=uow)
+
+    def test_locks_game_and_user_before_claim(self, answer_repo):
+        # Given
+        self.db.execute.return_value.one_or_none.return_value = None
+
+        # When
+        result = answer_repo.claim_and_submit(
+            "game-1", "user-1", "apple", True, datetime(2025, 1, 1, 12, 0, 0)
+        )
+
+        # Then: 같은 세션에서 잠금 -> 슬롯 claim 순서
+        assert result is None
+        lock_call, claim_call = self.db.execute.call_args_list
+        assert lock_call.args == (
+            LOCK_SUBMISSION_SQL,
+            {"game_id": "game-1", "user_id": "user-1"},
+        )
+        assert claim_call.args[0] is CLAIM_AND_SUBMIT_SQL
+        assert claim_call.args[1]["game_id"] == "game-1"
+        assert claim_call.args[1]["user_id"] == "user-1"
@@ -0,0 +1,75 @@
+import pytest
+
+from answer.application.answer_service import AnswerService
+
+
+class TestAnswerScoring:
+    @pytest.fixture
+    def answer_service(self, mocker):
+        self.answer_repo = mocker.Mock()
+        self.game_repo = mocker.Mock()
+        self.user_repo = mocker.Mock()
+        self.leaderboard = mocker.Mock()
+        # after_commit 콜백은 모아 두었다가 테스트에서 직접 실행
+        self.callbacks = []
+        mocker.patch(
+            "answer.application.answer_service.after_commit",
+            side_effect=self.callbacks.append,
+        )
+        return AnswerService(
+            answer_repo=self.answer_repo,
+            game_repo=self.game_repo,
+            user_repo=self.user_repo,
+            leaderboard=self.leaderboard,
+        )
+
+    def test_calculate_points_defers_leaderboard_update(self, answer_service):
+        # Given
+        deltas = {"user-1": 50, "user-2": 25}
+        self.answer_repo.score_game.return_value = deltas
+
+        # When
+        result = answer_service.calculate_points("game-1")
+
+        # Then: 커밋 전에는 Redis 랭킹을 건드리지 않는다
+        assert result == deltas
+        self.answer_repo.score_game.assert_called_once_with(
+            "game-1", multiplier=50, limit=10
+        )
+        self.leaderboard.apply_deltas.assert_not_called()
+        assert len(self.callbacks) == 1
+
+        self.callbacks[0]()
+        self.leaderboard.apply_deltas.assert_called_once_with(deltas)
+
+    def test_rescoring_scored_game_has_no_deltas(self, answer_service):
+        # Given: 이미 반영된 게임은 score_game 에서 바뀌는 행이 없다
+        self.answer_repo.score_game.side_effect = [{"user-1": 50}, {}]
+
+        # When
+        first = answer_service.update_total_user_point("game-1")
+        second = answer_service.update_total_user_point("game-1")
+
+        # Then: 두 번째 실행은 변화량이 없다
+        assert first == {"user-1": 50}
+        assert second == {}
+        for callback in self.callbacks:
+            callback()
+        self.leaderboard.apply_deltas.assert_called_once_with({"user-1": 50})
+
+    def test_rescoring_resyncs_leaderboard_from_db(self, answer_service):
+        # Given: 이전 실행이 커밋 후 apply_deltas 전에 중단되어 재전달됨
+        self.answer_repo.score_game.return_value = {}
+        self.answer_repo.find_scored_user_ids_by_game_id.return_value = ["user-1", "user-2"]
+
+        # When
+        result = answer_service.calculate_points("game-1")
+
+        # Then: 변화량 대신 DB 의 절대값으로 커밋 뒤에 다시 맞춘다
+        assert result == {}
+        self.answer_repo.find_scored_user_ids_by_game_id.assert_called_once_with("game-1")
+        self.leaderboard.sync_users.assert_not_called()
+        assert len(self.callbacks) == 1
+        self.callbacks[0]()
+        self.leaderboard.sync_users.assert_called_once_with(["user-1", "user-2"])
+        self.leaderboard.apply_deltas.assert_not_called()
@@ -0,0 +1,91 @@
+import pytest
+from datetime import datetime
+from fastapi import HTTPException
+
+from answer.application.answer_service import AnswerService
+from game.domain.game import Game, GameStatus
+
+
+class TestAnswerSubmission:
+    @pytest.fixture
+    def answer_service(self, mocker):
+        self.answer_repo = mocker.Mock()
+        self.game_repo = mocker.Mock()
+        self.user_repo = mocker.Mock()
+        self.current_game_cache = mocker.Mock()
+        now = datetime(2025, 1, 1, 12, 0, 0)
+        self.current_game_cache.get_game.return_value = Game(
+            id="game-1",
+            number=1,
+            created_at=now,
+            modified_at=now,
+            opened_at=now,
+            closed_at=None,
+            title="Test Game",
+            description=None,
+            status=GameStatus.OPEN,
+            memo=None,
+            question="Q",
+            answer=" Apple ",
+            question_link=None,
+            answer_link=None,
+            answer_aliases=["사과"],
+        )
+        return AnswerService(
+            answer_repo=self.answer_repo,
+            game_repo=self.game_repo,
+            user_repo=self.user_repo,
+            current_game_cache=self.current_game_cache,
+        )
+
+    def test_submit_answer_claims_slot(self, answer_service):
+        # When
+        result = answer_service.submit_answer("game-1", "user-1", "apple")
+
+        # Then
+        assert result == self.answer_repo.claim_and_submit.return_value
+        kwargs = self.answer_repo.claim_and_submit.call_args.kwargs
+        assert kwargs["is_correct"] is True
+        assert kwargs["answer_text"] == "apple"
+        self.current_game_cache.get_game.assert_called_once_with("game-1")
+        self.game_repo.find_by_id.assert_not_called()
+        self.user_repo.find_by_id.assert_not_called()
+        self.user_repo.update.assert_not_called()
+
+    @pytest.mark.parametrize("submitted", ["ＡＰＰＬＥ", "ap ple", "사 과"])
+    def test_submit_answer_matches_normalized_aliases(self, answer_service, submitted):
+        # When
+        answer_service.submit_answer("game-1", "user-1", submitted)
+
+        # Then
+        assert self.answer_repo.claim_and_submit.call_args.kwargs["is_correct"] is True
+
+    def test_submit_answer_already_correct(self, answer_service):
+        # Given
+        self.answer_repo.claim_and_submit.return_value = None
+
+        # When / Then
+        with pytest.raises(HTTPException) as exc:
+            answer_service.submit_answer("game-1", "user-1", "banana")
+        assert exc.value.status_code == 409
+        assert "correctly" in exc.value.detail
+
+    def test_submit_answer_no_chances_left(self, answer_service):
+        # Given
+        self.answer_repo.claim_and_submit.return_value = None
+        self.answer_repo.find_corrected_by_game_id_and_user_id.return_value = None
+
+        # When / Then
+        with pytest.raises(HTTPException) as exc:
+            answer_service.submit_answer("game-1", "user-1", "banana")
+        assert exc.value.status_code == 409
+        assert exc.value.detail == "You have already submitted an answer for this game"
+
+    def test_submit_answer_game_not_found(self, answer_service):
+        # Given
+        self.current_game_cache.get_game.return_value = None
+
+        # When / Then
+        with pytest.raises(ValueError):
+            answer_service.submit_answer("missing", "user-1", "apple")
+        self.answer_repo.claim_and_submit.assert_not_called()
@@ -0,0 +1,109 @@
+import json
+import pytest
+from datetime import datetime
+
+from answer.application.game_ranking_cache import GameRankingCache
+from answer.domain.answer import Answer, AnswerStatus
+
+
+class TestGameRankingCache:
+    @pytest.fixture
+    def ranking_cache(self, mocker):
+        self.redis_client = mocker.Mock()
+        self.redis_client.settings.CACHE_TTL = 60
+        self.redis = self.redis_client._redis
+        self.pipe = self.redis.pipeline.return_value
+        self.write = self.redis.register_script.return_value
+        self.redis.get.return_value = "3"  # 게임별 버전
+        self.answer_repo = mocker.Mock()
+        return GameRankingCache(
+            redis_client=self.redis_client, answer_repo=self.answer_repo
+        )
+
+    def _answer(self, user_id: str) -> Answer:
+        now = datetime(2025, 1, 1, 12, 0, 0)
+        answer = Answer(
+            id=f"answer-{user_id}",
+            game_id="game-1",
+            user_id=user_id,
+            answer="정답",
+            is_correct=True,
+            solved_at=now,
+            created_at=now,
+            updated_at=now,
+            point=0,
+            status=AnswerStatus.SUBMITTED,
+        )
+        answer.user = {"id": user_id, "nickname": f"nick-{user_id}"}
+        return answer
+
+    def test_get_returns_cached_body(self, ranking_cache):
+        # Given
+        self.redis.hgetall.return_value = {"body": "[]", "etag": '"abc"', "count": "0"}
+
+        # When
+        body, etag = ranking_cache.get("game-1")
+
+        # Then
+        assert (body, etag) == ("[]", '"abc"')
+        self.answer_repo.find_corrected_by_game_id.assert_not_called()
+
+    def test_get_builds_cache_on_miss(self, ranking_cache):
+        # Given
+        self.redis.hgetall.return_value = {}
+        self.answer_repo.find_corrected_by_game_id.return_value = [self._answer("u1")]
+
+        # When
+        body, etag = ranking_cache.get("game-1")
+
+        # Then
+        ranking = json.loads(body)
+        assert ranking[0]["user"]["nickname"] == "nick-u1"
+        assert etag.startswith('"') and etag.endswith('"')
+        self.write.assert_called_once_with(
+            keys=["game_ranking:game-1", "game_ranking:game-1:version"],
+            args=["3", body, etag, 1, 60],
+        )
+
+    def test_etag_is_stable_for_same_ranking(self, ranking_cache):
+        self.answer_repo.find_corrected_by_game_id.return_value = [self._answer("u1")]
+        _, first = ranking_cache.refresh("game-1")
+        _, second = ranking_cache.refresh("game-1")
+        assert first == second
+
+    def test_on_correct_answer_skips_full_ranking(self, ranking_cache):
+        # Given - 이미 10명이 채워진 경우
+        self.redis.hget.return_value = "10"
+
+        # When
+        ranking_cache.on_correct_answer("game-1")
+
+        # Then: 버전은 올려서 진행 중인 이전 계산이 저장되지 않게 한다
+        self.answer_repo.find_corrected_by_game_id.assert_not_called()
+        self.pipe.incr.assert_called_once_with("game_ranking:game-1:version")
+
+    def test_on_correct_answer_refreshes_partial_ranking(self, ranking_cache):
+        # Given
+        self.redis.hget.return_value = "3"
+        self.answer_repo.find_corrected_by_game_id.return_value = []
+
+        # When
+        ranking_cache.on_correct_answer("game-1")
+
+        # Then
+        self.answer_repo.find_corrected_by_game_id.assert_called_once_with(
+            "game-1", limit=10
+        )
+
+    def test_version_is_read_before_ranking_query(self, ranking_cache, mocker):
+        # Given
+        calls = mocker.Mock()
+        calls.attach_mock(self.redis.get, "get")
+        calls.attach_mock(self.answer_repo.find_corrected_by_game_id, "find")
+        self.answer_repo.find_corrected_by_game_id.return_value = []
+
+        # When
+        ranking_cache.refresh("game-1")
+
+        # Then
+        assert [c[0] for c in calls.mock_calls] == ["get", "find"]
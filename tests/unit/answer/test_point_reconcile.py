@@ -0,0 +1,60 @@
+import pytest
+
+from answer.application.answer_service import AnswerService
+from user.domain.user import PointDrift
+
+
+class TestPointReconcile:
+    @pytest.fixture
+    def answer_service(self, mocker):
+        self.answer_repo = mocker.Mock()
+        self.game_repo = mocker.Mock()
+        self.user_repo = mocker.Mock()
+        self.leaderboard = mocker.Mock()
+        self.after_commit = mocker.patch("answer.application.answer_service.after_commit")
+        return AnswerService(
+            answer_repo=self.answer_repo,
+            game_repo=self.game_repo,
+            user_repo=self.user_repo,
+            leaderboard=self.leaderboard,
+        )
+
+    @pytest.fixture
+    def drifts(self):
+        return [PointDrift(user_id="user-1", stored_point=30, expected_point=50)]
+
+    def test_fix_rebuilds_leaderboard_after_commit(self, answer_service, drifts):
+        # Given
+        self.user_repo.reconcile_points.return_value = drifts
+
+        # When
+        result = answer_service.reconcile_user_points(fix=True)
+
+        # Then: 커밋 뒤에 Redis 랭킹 재생성
+        assert result == drifts
+        self.user_repo.reconcile_points.assert_called_once_with(fix=True)
+        self.after_commit.assert_called_once_with(self.leaderboard.rebuild)
+        self.leaderboard.rebuild.assert_not_called()
+
+    def test_dry_run_does_not_rebuild(self, answer_service, drifts):
+        # Given
+        self.user_repo.reconcile_points.return_value = drifts
+
+        # When
+        result = answer_service.reconcile_user_points(fix=False)
+
+        # Then
+        assert result == drifts
+        self.user_repo.reconcile_points.assert_called_once_with(fix=False)
+        self.after_commit.assert_not_called()
+
+    def test_fix_without_drift_does_not_rebuild(self, answer_service):
+        # Given
+        self.user_repo.reconcile_points.return_value = []
+
+        # When
+        result = answer_service.reconcile_user_points(fix=True)
+
+        # Then
+        assert result == []
+        self.after_commit.assert_not_called()
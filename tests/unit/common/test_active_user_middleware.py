@@ -0,0 +1,37 @@
+import asyncio
+import pytest
+
+from common.auth import Role, create_access_token
+from common.middleware.active_users import ActiveUserMiddleware
+
+
+class TestActiveUserMiddleware:
+    @pytest.fixture
+    def middleware(self, mocker):
+        self.downstream = mocker.AsyncMock()
+        self.recorder = mocker.Mock()
+        app = mocker.Mock()
+        app.container.activity_recorder.return_value = self.recorder
+        self.app = app
+        return ActiveUserMiddleware(self.downstream)
+
+    def _call(self, middleware, headers):
+        scope = {"type": "http", "headers": headers, "app": self.app}
+        asyncio.run(middleware(scope, None, None))
+        return scope
+
+    def test_records_authenticated_user(self, middleware):
+        token = create_access_token({"sub": "user-1"}, role=Role.USER)
+
+        scope = self._call(middleware, [(b"authorization", f"Bearer {token}".encode())])
+
+        self.recorder.record.assert_called_once_with("user-1")
+        self.downstream.assert_awaited_once_with(scope, None, None)
+
+    def test_ignores_anonymous_and_invalid_tokens(self, middleware):
+        self._call(middleware, [(b"host", b"example.com")])
+        self._call(middleware, [(b"authorization", b"Bearer not-a-jwt")])
+        self._call(middleware, [(b"authorization", b"Basic abc")])
+
+        self.recorder.record.assert_not_called()
+        assert self.downstream.await_count == 3
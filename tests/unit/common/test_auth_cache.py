@@ -0,0 +1,72 @@
+import time
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from common import auth
+from common.auth import Role, TokenCache, create_access_token, get_current_user
+
+
+class TestTokenCache:
+    def test_evicts_least_recently_used(self):
+        cache = TokenCache(max_size=2)
+        exp = time.time() + 60
+        cache.set("a", {"sub": "a", "exp": exp})
+        cache.set("b", {"sub": "b", "exp": exp})
+        cache.get("a")
+        cache.set("c", {"sub": "c", "exp": exp})
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_ignores_expired_claims(self):
+        cache = TokenCache(max_size=2)
+        cache.set("a", {"sub": "a", "exp": time.time() - 1})
+
+        assert cache.get("a") is None
+
+    def test_disabled_when_size_is_zero(self):
+        cache = TokenCache(max_size=0)
+        cache.set("a", {"sub": "a", "exp": time.time() + 60})
+
+        assert cache.get("a") is None
+
+
+class TestDecodeAccessToken:
+    @pytest.fixture(autouse=True)
+    def token_cache(self, mocker):
+        cache = TokenCache(max_size=10)
+        mocker.patch.object(auth, "token_cache", cache)
+        return cache
+
+    def test_verifies_token_once(self, mocker):
+        token = create_access_token({"sub": "user-1"}, role=Role.USER)
+        decode = mocker.spy(auth.jwt, "decode")
+
+        auth.decode_access_token(token)
+        claims = auth.decode_access_token(token)
+
+        assert claims["sub"] == "user-1"
+        assert decode.call_count == 1
+
+    def test_expired_token_is_rejected(self, mocker):
+        token = create_access_token(
+            {"sub": "user-1"}, role=Role.USER, expires_delta=timedelta(seconds=-1)
+        )
+
+        with pytest.raises(HTTPException):
+            auth.decode_access_token(token)
+
+    def test_dependency_reuses_claims_from_request_state(self, mocker):
+        token = create_access_token({"sub": "user-1"}, role=Role.USER)
+        claims = auth.decode_access_token(token)
+        request = mocker.Mock()
+        request.scope = {"state": {"auth_token": token, "auth_claims": claims}}
+        decode = mocker.patch.object(auth, "decode_access_token")
+
+        current_user = get_current_user(request, token)
+
+        assert current_user.id == "user-1"
+        decode.assert_not_called()
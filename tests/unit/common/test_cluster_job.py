@@ -0,0 +1,75 @@
+import pytest
+
+from common.redis.cluster_job import ClusterJob
+
+
+class TestClusterJob:
+    @pytest.fixture
+    def job(self, mocker):
+        self.redis_client = mocker.Mock()
+        self.redis = self.redis_client._redis
+        self.extend_lock = mocker.Mock(return_value=1)
+        self.release_lock = mocker.Mock(return_value=1)
+        self.redis.register_script.side_effect = [self.extend_lock, self.release_lock]
+        self.task = mocker.Mock()
+        return ClusterJob(
+            redis_client=self.redis_client, name="test-job", task=self.task, interval=10
+        )
+
+    def test_leader_runs_task(self, job):
+        # Given
+        self.redis.set.return_value = True
+
+        # When
+        ran = job.run_once()
+
+        # Then
+        assert ran and job.is_leader
+        self.task.assert_called_once()
+        self.redis.set.assert_called_once_with(
+            "cluster_job:test-job:leader", job.token, nx=True, px=30000
+        )
+
+    def test_leader_extends_lock(self, job):
+        self.redis.set.return_value = True
+        job.run_once()
+
+        job.run_once()
+
+        self.extend_lock.assert_called_once_with(
+            keys=["cluster_job:test-job:leader"], args=[job.token, 30000]
+        )
+        assert self.task.call_count == 2
+
+    def test_follower_skips_task(self, job):
+        self.redis.set.return_value = None
+
+        assert not job.run_once()
+        self.task.assert_not_called()
+
+    def test_lost_lock_stops_running(self, job):
+        self.redis.set.return_value = True
+        job.run_once()
+        self.extend_lock.return_value = 0
+
+        assert not job.run_once()
+        assert not job.is_leader
+        self.task.assert_called_once()
+
+    def test_task_failure_keeps_leadership(self, job):
+        self.redis.set.return_value = True
+        self.task.side_effect = RuntimeError("boom")
+
+        assert job.run_once()
+        assert job.is_leader
+
+    def test_stop_releases_lock(self, job):
+        self.redis.set.return_value = True
+        job.run_once()
+
+        job.stop()
+
+        self.release_lock.assert_called_once_with(
+            keys=["cluster_job:test-job:leader"], args=[job.token]
+        )
+        assert not job.is_leader
@@ -0,0 +1,43 @@
+import pytest
+
+from common.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    @pytest.fixture
+    def registry(self):
+        return MetricsRegistry()
+
+    def test_counter_and_summary(self, registry):
+        # When
+        registry.counter("requests_total").inc()
+        registry.counter("requests_total").inc(2)
+        summary = registry.summary("checkout_seconds")
+        summary.observe(0.1)
+        summary.observe(0.3)
+
+        # Then
+        snapshot = registry.snapshot()
+        assert snapshot["requests_total"] == 3
+        assert snapshot["checkout_seconds_count"] == 2
+        assert snapshot["checkout_seconds_sum"] == pytest.approx(0.4)
+        assert snapshot["checkout_seconds_max"] == 0.3
+
+    def test_gauge_callback_is_evaluated_on_render(self, registry):
+        # Given
+        in_use = [1]
+        registry.gauge("pool_in_use", "in use", callback=lambda: in_use[0])
+
+        # When
+        in_use[0] = 4
+        text = registry.render()
+
+        # Then
+        assert "# TYPE pool_in_use gauge" in text
+        assert 'pool_in_use{pid="' in text
+        assert text.rstrip().endswith(" 4")
+
+    def test_name_conflict(self, registry):
+        registry.counter("jobs")
+        with pytest.raises(ValueError):
+            registry.gauge("jobs")
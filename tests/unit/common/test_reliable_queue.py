@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from common.redis.reliable_queue import QueueJob, ReliableQueue
+
+
+class TestReliableQueue:
+    @pytest.fixture
+    def queue(self, mocker):
+        self.redis_client = mocker.Mock()
+        self.redis = self.redis_client._redis
+        self.enqueue_script = mocker.Mock(return_value=1)
+        self.promote_script = mocker.Mock(return_value=0)
+        self.finish_script = mocker.Mock(return_value=1)
+        self.redis.register_script.side_effect = [
+            self.enqueue_script,
+            self.promote_script,
+            self.finish_script,
+        ]
+        self.redis.lrange.return_value = []
+        self.redis.zrangebyscore.return_value = []
+        return ReliableQueue(
+            self.redis_client, "jobs", visibility_timeout=60, max_attempts=3, retry_backoff=5
+        )
+
+    def _job(self, attempts=0):
+        raw = json.dumps({"id": "job-1", "data": {"game_id": "g"}, "attempts": attempts, "key": "k"})
+        return QueueJob(id="job-1", data={"game_id": "g"}, attempts=attempts, key="k", raw=raw)
+
+    def test_enqueue_with_idempotency_key(self, queue):
+        assert queue.enqueue({"game_id": "g"}, idempotency_key="score:g")
+
+        keys = self.enqueue_script.call_args.kwargs["keys"]
+        assert keys == ["jobs", "jobs:key:score:g", "jobs:delayed"]
+
+    def test_reserve_moves_job_to_processing_with_lease(self, queue):
+        job = self._job()
+        self.redis.blmove.return_value = job.raw
+
+        reserved = queue.reserve()
+
+        assert reserved.data == {"game_id": "g"}
+        self.redis.blmove.assert_called_once_with("jobs", "jobs:processing", 1, "RIGHT", "LEFT")
+        assert job.raw in self.redis.zadd.call_args.args[1]
+        self.redis.delete.assert_called_once_with("jobs:key:k")
+
+    def test_reserve_accepts_legacy_payload(self, queue):
+        self.redis.blmove.return_value = json.dumps({"game_id": "g"})
+
+        reserved = queue.reserve()
+
+        assert reserved.data == {"game_id": "g"}
+        assert reserved.attempts == 0
+
+    def test_retry_schedules_with_backoff(self, queue):
+        queue.retry(self._job(attempts=1), "boom")
+
+        kwargs = self.finish_script.call_args.kwargs
+        assert kwargs["keys"] == ["jobs:processing", "jobs:leases", "jobs:delayed"]
+        retried = json.loads(kwargs["args"][1])
+        assert retried["attempts"] == 2
+        assert retried["error"] == "boom"
+
+    def test_retry_dead_letters_after_max_attempts(self, queue):
+        queue.retry(self._job(attempts=2), "boom")
+
+        kwargs = self.finish_script.call_args.kwargs
+        assert kwargs["keys"][2] == "jobs:dead"
+
+    def test_expired_lease_is_retried(self, queue):
+        job = self._job()
+        self.redis.zrangebyscore.return_value = [job.raw]
+
+        assert queue.requeue_expired() == 1
+
+        args = self.finish_script.call_args.kwargs["args"]
+        assert args[0] == job.raw
+        assert json.loads(args[1])["error"] == "visibility timeout expired"
@@ -0,0 +1,98 @@
+import pytest
+
+from common.redis.reliable_queue import QueueJob
+from common.tasks import TaskName, TaskPriority, TaskQueue, TaskWorker
+
+
+class TestTaskQueue:
+    @pytest.fixture
+    def task_queue(self, mocker):
+        self.redis_client = mocker.Mock()
+        queue = TaskQueue(self.redis_client)
+        for priority, reliable_queue in queue.queues.items():
+            mocker.patch.object(reliable_queue, "enqueue")
+            mocker.patch.object(reliable_queue, "reserve", return_value=None)
+        return queue
+
+    def test_submit_records_status_and_enqueues_by_priority(self, task_queue):
+        task_id = task_queue.submit(
+            TaskName.EMAIL_SEND, {"to_email": "a@b.c"}, priority=TaskPriority.HIGH, delay=10
+        )
+
+        task_queue.queues[TaskPriority.HIGH].enqueue.assert_called_once_with(
+            {"task_id": task_id, "name": TaskName.EMAIL_SEND, "payload": {"to_email": "a@b.c"}},
+            delay=10,
+        )
+        task_queue.queues[TaskPriority.DEFAULT].enqueue.assert_not_called()
+        pipe = self.redis_client._redis.pipeline.return_value
+        pipe.hset.assert_called_once()
+        assert pipe.hset.call_args.kwargs["mapping"]["status"] == "QUEUED"
+
+    def test_queue_settings_apply_to_every_priority(self, mocker):
+        queue = TaskQueue(mocker.Mock(), visibility_timeout=60, retry_backoff=2)
+
+        for reliable_queue in queue.queues.values():
+            assert reliable_queue.visibility_timeout == 60
+            assert reliable_queue.retry_backoff == 2
+
+    def test_reserve_prefers_higher_priority(self, task_queue, mocker):
+        job = mocker.Mock()
+        task_queue.queues[TaskPriority.DEFAULT].reserve.return_value = job
+
+        queue, reserved = task_queue.reserve()
+
+        assert queue is task_queue.queues[TaskPriority.DEFAULT]
+        assert reserved is job
+        task_queue.queues[TaskPriority.HIGH].reserve.assert_called_once_with(block=False)
+        task_queue.queues[TaskPriority.LOW].reserve.assert_not_called()
+
+
+class TestTaskWorker:
+    @pytest.fixture
+    def worker(self, mocker):
+        self.task_queue = mocker.Mock()
+        self.queue = mocker.Mock(max_attempts=3)
+        self.handler = mocker.Mock(return_value={"updated_users": 2})
+        return TaskWorker(
+            self.task_queue,
+            handlers={TaskName.ANSWER_CALCULATE_POINTS: self.handler},
+            uow=mocker.MagicMock(),
+        )
+
+    def _job(self, name, attempts=0):
+        return QueueJob(
+            id="job-1",
+            data={"task_id": "task-1", "name": name, "payload": {"game_id": "g"}},
+            attempts=attempts,
+            key=None,
+            raw="raw",
+        )
+
+    def test_success_stores_result(self, worker):
+        job = self._job(TaskName.ANSWER_CALCULATE_POINTS)
+
+        worker.process(self.queue, job)
+
+        self.handler.assert_called_once_with({"game_id": "g"})
+        self.queue.ack.assert_called_once_with(job)
+        self.task_queue.mark_succeeded.assert_called_once_with("task-1", {"updated_users": 2})
+
+    def test_failure_is_retried_then_marked_failed(self, worker):
+        self.handler.side_effect = RuntimeError("boom")
+
+        worker.process(self.queue, self._job(TaskName.ANSWER_CALCULATE_POINTS))
+        worker.process(self.queue, self._job(TaskName.ANSWER_CALCULATE_POINTS, attempts=2))
+
+        assert self.queue.retry.call_count == 2
+        assert [c.kwargs["final"] for c in self.task_queue.mark_failed.call_args_list] == [
+            False,
+            True,
+        ]
+
+    def test_unknown_task_is_dead_lettered(self, worker):
+        job = self._job("unknown")
+
+        worker.process(self.queue, job)
+
+        self.queue.dead_letter.assert_called_once()
+        self.handler.assert_not_called()
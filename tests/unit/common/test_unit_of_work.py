@@ -0,0 +1,57 @@
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from common.unit_of_work import ScopedSession, UnitOfWork, after_commit
+
+
+class TestUnitOfWork:
+    @pytest.fixture
+    def uow(self):
+        return UnitOfWork(session_factory=sessionmaker())
+
+    def test_session_outside_scope_is_new_each_time(self, uow):
+        with uow.session() as first, uow.session() as second:
+            assert first is not second
+            assert not isinstance(first, ScopedSession)
+
+    def test_transaction_shares_one_session(self, uow):
+        with uow.transaction() as db:
+            with uow.session() as first, uow.session() as second:
+                assert first is db
+                assert second is db
+            # 중첩된 transaction 은 기존 트랜잭션에 참여
+            with uow.transaction() as nested:
+                assert nested is db
+
+    def test_scoped_commit_is_deferred(self, uow, mocker):
+        commit_scope = mocker.patch.object(ScopedSession, "commit_scope")
+
+        with uow.transaction() as db:
+            db.commit()
+            commit_scope.assert_not_called()
+
+        commit_scope.assert_called_once()
+
+    def test_after_commit_runs_after_transaction(self, uow):
+        calls = []
+
+        with uow.transaction():
+            after_commit(lambda: calls.append("refresh"))
+            assert calls == []
+
+        assert calls == ["refresh"]
+
+    def test_after_commit_skipped_on_rollback(self, uow):
+        calls = []
+
+        with pytest.raises(RuntimeError):
+            with uow.transaction():
+                after_commit(lambda: calls.append("refresh"))
+                raise RuntimeError("boom")
+
+        assert calls == []
+
+    def test_after_commit_outside_scope_runs_immediately(self):
+        calls = []
+        after_commit(lambda: calls.append("refresh"))
+        assert calls == ["refresh"]
@@ -0,0 +1,38 @@
+import unicodedata
+
+import pytest
+
+from game.domain.answer_matcher import AnswerMatcher, clean_aliases, normalize_answer
+
+
+class TestAnswerMatcher:
+    @pytest.fixture
+    def matcher(self):
+        return AnswerMatcher.compile("Quick Sort", ["퀵소트", "qsort"])
+
+    @pytest.mark.parametrize(
+        "submitted",
+        [
+            "quicksort",
+            "  QUICK   SORT ",
+            "ＱＵＩＣＫ　ＳＯＲＴ",  # 전각 문자 / 전각 공백
+            "퀵 소트",
+            unicodedata.normalize("NFD", "퀵소트"),  # 분리된 자모 (macOS 입력 등)
+            "QSort",
+        ],
+    )
+    def test_matches_variants(self, matcher, submitted):
+        assert matcher.matches(submitted)
+
+    @pytest.mark.parametrize("submitted", ["merge sort", "", None, "퀵"])
+    def test_rejects_other_answers(self, matcher, submitted):
+        assert not matcher.matches(submitted)
+
+    def test_normalize_casefold(self):
+        assert normalize_answer("STRASSE") == normalize_answer("straße")
+
+    def test_clean_aliases_drops_empty_and_duplicates(self):
+        assert clean_aliases([" 퀵소트 ", "퀵 소트", "", "  ", "QSort", "qsort"]) == [
+            "퀵소트",
+            "QSort",
+        ]
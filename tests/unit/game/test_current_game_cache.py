@@ -0,0 +1,90 @@
+import pytest
+from datetime import datetime
+
+from game.application.current_game_cache import CurrentGameCache
+from game.domain.game import Game, GameStatus
+
+
+class TestCurrentGameCache:
+    @pytest.fixture
+    def cache(self, mocker):
+        self.redis_client = mocker.Mock()
+        self.redis_client.settings.CACHE_TTL = 60
+        self.redis = self.redis_client._redis
+        self.game_repo = mocker.Mock()
+        return CurrentGameCache(
+            redis_client=self.redis_client, game_repo=self.game_repo, local_ttl=60
+        )
+
+    def _game(self) -> Game:
+        now = datetime(2025, 1, 1, 12, 0, 0)
+        return Game(
+            id="game-1",
+            number=1,
+            created_at=now,
+            modified_at=now,
+            opened_at=now,
+            closed_at=None,
+            title="Test Game",
+            description=None,
+            status=GameStatus.OPEN,
+            memo=None,
+            question="Q",
+            answer="A",
+            question_link=None,
+            answer_link=None,
+        )
+
+    def test_miss_loads_from_repo_and_stores_in_redis(self, cache):
+        # Given
+        self.redis.get.side_effect = ["3", None]
+        self.game_repo.find_latest.return_value = self._game()
+
+        # When
+        game = cache.get()
+
+        # Then
+        assert game.id == "game-1"
+        key, ttl, value = self.redis.setex.call_args.args
+        assert (key, ttl) == ("game:current:3", 60)
+        assert cache._deserialize(value) == self._game()
+
+    def test_local_hit_skips_redis_and_db(self, cache):
+        # Given
+        self.redis.get.side_effect = ["1", None]
+        self.game_repo.find_latest.return_value = self._game()
+        cache.get()
+        self.redis.get.reset_mock()
+
+        # When
+        game = cache.get()
+
+        # Then
+        assert game.id == "game-1"
+        self.redis.get.assert_not_called()
+        self.game_repo.find_latest.assert_called_once()
+
+    def test_redis_hit_skips_db(self, cache):
+        # Given
+        self.redis.get.side_effect = ["2", cache._serialize(self._game())]
+
+        # When
+        game = cache.get()
+
+        # Then
+        assert game == self._game()
+        self.game_repo.find_latest.assert_not_called()
+
+    def test_invalidate_bumps_version(self, cache):
+        # Given
+        self.redis.get.side_effect = ["1", None, "2", None]
+        self.game_repo.find_latest.return_value = self._game()
+        cache.get()
+
+        # When
+        cache.invalidate()
+        cache.get()
+
+        # Then
+        self.redis.incr.assert_called_once_with("game:current:version")
+        assert self.game_repo.find_latest.call_count == 2
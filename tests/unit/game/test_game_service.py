@@ -271,7 +271,9 @@ class TestGameService:
         assert closed_game.status == GameStatus.CLOSED
         assert closed_game.closed_at is not None
         self.game_repo.update.assert_called_once()
-        self.redis_client.enqueue.assert_called_once_with({"game_id": game_id})
+        self.redis_client.enqueue.assert_called_once_with(
+            {"game_id": game_id}, idempotency_key=f"score:{game_id}"
+        )
 
     def test_close_already_closed_game(self, game_service):
         # Given
@@ -379,3 +381,20 @@ class TestGameService:
         assert len(games) == 3
         assert all(game.status == status for game in games)
         self.game_repo.find_by_status.assert_called_once_with(status)
+
+    def test_close_game_invalidates_current_game_cache(self, mocker):
+        # Given
+        game_repo = mocker.Mock()
+        current_game_cache = mocker.Mock()
+        game_service = GameService(
+            game_repo=game_repo,
+            redis_client=mocker.Mock(),
+            current_game_cache=current_game_cache,
+        )
+        game_repo.find_by_id.return_value = mocker.Mock(status=GameStatus.OPEN)
+
+        # When
+        game_service.close_game("game-1")
+
+        # Then
+        current_game_cache.invalidate.assert_called_once()
@@ -0,0 +1,81 @@
+import json
+import pytest
+
+from user.application.active_user_service import ActiveUserService
+
+
+class TestActiveUserService:
+    @pytest.fixture
+    def active_user_service(self, mocker):
+        self.redis_client = mocker.Mock()
+        self.redis = self.redis_client._redis
+        self.user_repo = mocker.Mock()
+        mocker.patch("user.application.active_user_service.time.time", return_value=1000.0)
+        return ActiveUserService(
+            redis_client=self.redis_client, user_repo=self.user_repo
+        )
+
+    def test_record_user_activity(self, active_user_service):
+        active_user_service.record_user_activity("user-1")
+        self.redis.zadd.assert_called_once_with("active_users", {"user-1": 1000.0})
+
+    def test_record_user_activity_without_user(self, active_user_service):
+        active_user_service.record_user_activity("")
+        self.redis.zadd.assert_not_called()
+
+    def test_get_active_users_count(self, active_user_service):
+        # Given
+        self.redis.zcount.return_value = 3
+
+        # When
+        count = active_user_service.get_active_users_count()
+
+        # Then
+        assert count == 3
+        self.redis.zcount.assert_called_once_with("active_users", 700.0, "+inf")
+        self.redis.keys.assert_not_called()
+
+    def test_sweep(self, active_user_service):
+        active_user_service.sweep()
+        self.redis.zremrangebyscore.assert_called_once_with(
+            "active_users", "-inf", "(700.0"
+        )
+
+    def test_refresh_snapshot_hydrates_in_one_query(self, active_user_service):
+        # Given
+        self.redis.zrevrangebyscore.return_value = [("u2", 990.0), ("u1", 980.0)]
+        self.user_repo.find_nicknames_by_ids.return_value = {"u1": "one", "u2": "two"}
+
+        # When
+        users = active_user_service.refresh_snapshot()
+
+        # Then
+        assert [(user["id"], user["nickname"]) for user in users] == [
+            ("u2", "two"), ("u1", "one")
+        ]
+        self.user_repo.find_nicknames_by_ids.assert_called_once_with(["u2", "u1"])
+        self.user_repo.find_by_id.assert_not_called()
+        key, ttl, value = self.redis.setex.call_args.args
+        assert (key, ttl) == ("active_users_list", 60)
+        assert json.loads(value) == users
+
+    def test_get_active_users_reads_snapshot(self, active_user_service):
+        # Given
+        snapshot = [{"id": f"u{i}", "nickname": f"n{i}"} for i in range(5)]
+        self.redis.get.return_value = json.dumps(snapshot)
+
+        # When
+        users = active_user_service.get_active_users(offset=1, limit=2)
+
+        # Then
+        assert users == snapshot[1:3]
+        self.user_repo.find_nicknames_by_ids.assert_not_called()
+
+    def test_refresh_sweeps_and_rebuilds_snapshot(self, active_user_service):
+        self.redis.zrevrangebyscore.return_value = []
+        self.user_repo.find_nicknames_by_ids.return_value = {}
+
+        active_user_service.refresh()
+
+        self.redis.zremrangebyscore.assert_called_once()
+        self.redis.setex.assert_called_once()
@@ -0,0 +1,54 @@
+import pytest
+
+from user.application.activity_recorder import ActivityRecorder
+
+
+class TestActivityRecorder:
+    @pytest.fixture
+    def recorder(self, mocker):
+        self.active_user_service = mocker.Mock()
+        self.clock = mocker.patch(
+            "user.application.activity_recorder.time.monotonic", return_value=100.0
+        )
+        mocker.patch("user.application.activity_recorder.time.time", return_value=5000.0)
+        recorder = ActivityRecorder(
+            active_user_service=self.active_user_service, record_interval=60
+        )
+        # 테스트에서는 백그라운드 스레드 없이 flush 를 직접 호출
+        mocker.patch.object(recorder, "start")
+        return recorder
+
+    def test_repeated_requests_are_coalesced(self, recorder):
+        # When
+        for _ in range(10):
+            recorder.record("u1")
+        recorder.record("u2")
+        flushed = recorder.flush()
+
+        # Then
+        assert flushed == 2
+        self.active_user_service.record_users.assert_called_once_with(
+            {"u1": 5000.0, "u2": 5000.0}
+        )
+        assert recorder._suppressed.value >= 9
+
+    def test_user_is_recorded_again_after_interval(self, recorder):
+        recorder.record("u1")
+        recorder.flush()
+
+        self.clock.return_value = 161.0
+        recorder.record("u1")
+
+        assert recorder.flush() == 1
+        assert self.active_user_service.record_users.call_count == 2
+
+    def test_flush_without_pending_does_nothing(self, recorder):
+        assert recorder.flush() == 0
+        self.active_user_service.record_users.assert_not_called()
+
+    def test_failed_flush_is_retried(self, recorder):
+        recorder.record("u1")
+        self.active_user_service.record_users.side_effect = [ConnectionError(), None]
+
+        assert recorder.flush() == 0
+        assert recorder.flush() == 1
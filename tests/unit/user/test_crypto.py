@@ -0,0 +1,89 @@
+import threading
+import pytest
+
+from common.auth import Role
+from common.exceptions import TooManyRequestsError
+from user.application.user_service import UserService
+from utils.crypto import Crypto
+
+
+class TestCrypto:
+    def test_encrypt_and_verify(self):
+        crypto = Crypto(rounds=4)
+        hashed = crypto.encrypt("Password1234!")
+        assert hashed.startswith("$2b$04$")
+        assert crypto.verify("Password1234!", hashed)
+        assert not crypto.verify("wrong", hashed)
+
+    def test_verify_and_update_rehashes_on_cost_change(self):
+        old_hash = Crypto(rounds=4).encrypt("Password1234!")
+
+        verified, new_hash = Crypto(rounds=5).verify_and_update("Password1234!", old_hash)
+
+        assert verified
+        assert new_hash.startswith("$2b$05$")
+
+    def test_verify_and_update_keeps_current_hash(self):
+        crypto = Crypto(rounds=4)
+        verified, new_hash = crypto.verify_and_update(
+            "Password1234!", crypto.encrypt("Password1234!")
+        )
+        assert verified
+        assert new_hash is None
+
+    def test_rejects_when_saturated(self):
+        # Given - 작업 하나가 유일한 스레드를 점유 중이고 대기열이 없는 상태
+        crypto = Crypto(rounds=4, max_workers=1, max_queue=0)
+        started, release = threading.Event(), threading.Event()
+
+        def blocking_hash(secret):
+            started.set()
+            release.wait()
+            return "hash"
+
+        crypto.pwd_context = type("Ctx", (), {"hash": staticmethod(blocking_hash)})()
+        worker = threading.Thread(target=crypto.encrypt, args=("a",))
+        worker.start()
+        started.wait()
+
+        # When / Then
+        with pytest.raises(TooManyRequestsError) as exc_info:
+            crypto.encrypt("b")
+        assert exc_info.value.status_code == 429
+
+        release.set()
+        worker.join()
+
+
+class TestLoginRehash:
+    @pytest.fixture
+    def user_service(self, mocker):
+        self.user_repo = mocker.Mock()
+        self.crypto = mocker.Mock()
+        return UserService(
+            user_repo=self.user_repo,
+            login_history_repo=mocker.Mock(),
+            crypto=self.crypto,
+        )
+
+    def test_login_stores_rehashed_password(self, user_service, mocker):
+        # Given
+        user = mocker.Mock(id="user-1", email="a@b.com", role=Role.USER, password="old")
+        self.user_repo.find_by_email.return_value = user
+        self.crypto.verify_and_update.return_value = (True, "new-hash")
+
+        # When
+        user_service.login("a@b.com", "Password1234!")
+
+        # Then
+        assert user.password == "new-hash"
+        self.user_repo.update.assert_called_once_with(user)
+
+    def test_login_without_rehash(self, user_service, mocker):
+        user = mocker.Mock(id="user-1", email="a@b.com", role=Role.USER, password="hash")
+        self.user_repo.find_by_email.return_value = user
+        self.crypto.verify_and_update.return_value = (True, None)
+
+        user_service.login("a@b.com", "Password1234!")
+
+        self.user_repo.update.assert_not_called()
@@ -0,0 +1,82 @@
+import socket
+import time
+
+import pytest
+
+from utils.email import EmailSender, RateLimiter
+
+
+class RecordingHandler:
+    def __init__(self):
+        self.messages = []
+        self.sessions = set()
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope)
+        self.sessions.add(id(session))
+        return "250 OK"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestEmailSender:
+    @pytest.fixture
+    def smtp(self):
+        aiosmtpd_controller = pytest.importorskip("aiosmtpd.controller")
+        handler = RecordingHandler()
+        controller = aiosmtpd_controller.Controller(
+            handler, hostname="127.0.0.1", port=_free_port()
+        )
+        controller.start()
+        yield controller, handler
+        controller.stop()
+
+    def _sender(self, controller, **kwargs):
+        return EmailSender(
+            smtp_server=controller.hostname,
+            smtp_port=controller.port,
+            smtp_username="",
+            use_tls=False,
+            **kwargs,
+        )
+
+    def test_reuses_connection_across_messages(self, smtp):
+        controller, handler = smtp
+        sender = self._sender(controller, rate_limit=0)
+
+        for i in range(3):
+            sender.send_email("user@example.com", f"subject {i}", "hello")
+        sender.close()
+
+        assert len(handler.messages) == 3
+        assert len(handler.sessions) == 1
+
+    def test_reconnects_after_server_drops_connection(self, smtp):
+        controller, handler = smtp
+        sender = self._sender(controller, rate_limit=0)
+        sender.send_email("user@example.com", "first", "hello")
+
+        # 서버가 idle 연결을 끊은 상황
+        server, _ = sender._idle.get_nowait()
+        server.close()
+        sender._idle.put((server, time.monotonic()))
+        sender.send_email("user@example.com", "second", "hello")
+        sender.close()
+
+        assert len(handler.messages) == 2
+
+
+class TestRateLimiter:
+    def test_limits_rate_after_burst(self):
+        limiter = RateLimiter(rate=50, burst=2)
+
+        started = time.monotonic()
+        for _ in range(4):
+            limiter.acquire()
+
+        # 2개는 바로, 나머지 2개는 1/50 초 간격
+        assert time.monotonic() - started >= 0.03
@@ -0,0 +1,184 @@
+import pytest
+
+from user.application.leaderboard_service import LeaderboardService
+
+
+class TestLeaderboardService:
+    @pytest.fixture
+    def leaderboard(self, mocker):
+        self.redis_client = mocker.Mock()
+        self.redis = self.redis_client._redis
+        self.pipe = self.redis.pipeline.return_value
+        self.user_repo = mocker.Mock()
+        self.redis.exists.return_value = 1
+        self.redis.mget.return_value = ["1", None]  # built, rebuild 락 없음
+        self.redis.spop.return_value = None
+        self.release_lock = self.redis.register_script.return_value
+        return LeaderboardService(redis_client=self.redis_client, user_repo=self.user_repo)
+
+    def test_get_top_shares_rank_on_ties(self, leaderboard):
+        # Given
+        self.redis.zrevrange.return_value = [("u1", 50.0), ("u2", 30.0), ("u3", 30.0), ("u4", 10.0)]
+        self.redis.hmget.return_value = ["a", "b", "c", "d"]
+        self.redis.zcount.return_value = 0
+
+        # When
+        ranked = leaderboard.get_top(limit=4)
+
+        # Then
+        assert [user.rank for user in ranked] == [1, 2, 2, 4]
+        assert [user.nickname for user in ranked] == ["a", "b", "c", "d"]
+        self.redis.zrevrange.assert_called_once_with(
+            "leaderboard:point", 0, 3, withscores=True
+        )
+
+    def test_get_rank(self, leaderboard):
+        # Given
+        self.redis.zscore.return_value = 30.0
+        self.redis.zcount.return_value = 4
+        self.redis.hget.return_value = "nick"
+
+        # When
+        ranked = leaderboard.get_rank("u2")
+
+        # Then
+        assert ranked.rank == 5
+        assert ranked.point == 30
+        self.redis.zcount.assert_called_once_with("leaderboard:point", "(30.0", "+inf")
+
+    def test_get_rank_unranked_user(self, leaderboard):
+        self.redis.zscore.return_value = None
+        assert leaderboard.get_rank("unknown") is None
+
+    def test_get_around(self, leaderboard):
+        # Given
+        self.redis.zrevrank.return_value = 1
+        self.redis.zrevrange.return_value = [("u1", 50.0), ("u2", 30.0), ("u3", 10.0)]
+        self.redis.hmget.return_value = ["a", "b", "c"]
+        self.redis.zcount.return_value = 0
+
+        # When
+        ranked = leaderboard.get_around("u2", window=2)
+
+        # Then
+        self.redis.zrevrange.assert_called_once_with(
+            "leaderboard:point", 0, 3, withscores=True
+        )
+        assert [user.rank for user in ranked] == [1, 2, 3]
+
+    def test_apply_deltas(self, leaderboard):
+        # When
+        leaderboard.apply_deltas({"u1": 10, "u2": -3})
+
+        # Then
+        self.pipe.zincrby.assert_any_call("leaderboard:point", 10, "u1")
+        self.pipe.zincrby.assert_any_call("leaderboard:point", -3, "u2")
+        self.pipe.execute.assert_called_once()
+
+    def test_rebuild_when_missing(self, leaderboard):
+        # Given
+        self.redis.exists.return_value = 0
+        self.redis.zrevrange.return_value = []
+        self.user_repo.find_points.return_value = [("u1", "a", 10), ("u2", "b", 0)]
+
+        # When
+        leaderboard.get_top()
+
+        # Then
+        self.user_repo.find_points.assert_called_once()
+        self.pipe.zadd.assert_called_once_with(
+            "leaderboard:point:rebuild", {"u1": 10, "u2": 0}
+        )
+        self.pipe.rename.assert_any_call("leaderboard:point:rebuild", "leaderboard:point")
+        self.pipe.set.assert_called_once_with("leaderboard:built", 1)
+
+    def test_signup_on_empty_redis_does_not_hide_existing_users(self, leaderboard):
+        # Given: Redis 가 비어 있는 상태에서 가입
+        self.redis.exists.return_value = 0
+        self.redis.mget.return_value = [None, None]
+        leaderboard.set_user("new", "newbie", point=0)
+        self.pipe.zadd.assert_not_called()
+
+        # When: 첫 조회
+        self.user_repo.find_points.return_value = [
+            ("u1", "a", 10), ("u2", "b", 5), ("new", "newbie", 0)
+        ]
+        self.redis.zrevrange.return_value = []
+        leaderboard.get_top()
+
+        # Then: 기존 DB 유저까지 모두 채워진다
+        self.pipe.zadd.assert_called_once_with(
+            "leaderboard:point:rebuild", {"u1": 10, "u2": 5, "new": 0}
+        )
+        self.pipe.rename.assert_any_call("leaderboard:point:rebuild", "leaderboard:point")
+
+    def test_apply_deltas_skipped_before_build(self, leaderboard):
+        self.redis.mget.return_value = [None, None]
+
+        leaderboard.apply_deltas({"u1": 10})
+
+        self.pipe.zincrby.assert_not_called()
+
+    def test_rebuild_skipped_while_another_rebuild_runs(self, leaderboard):
+        # Given
+        self.redis.set.return_value = None
+
+        # When
+        count = leaderboard.rebuild()
+
+        # Then
+        assert count is None
+        self.user_repo.find_points.assert_not_called()
+        self.release_lock.assert_not_called()
+
+    def test_deltas_during_rebuild_are_recorded(self, leaderboard):
+        # Given
+        self.redis.mget.return_value = ["1", "token"]
+
+        # When
+        leaderboard.apply_deltas({"u1": 10})
+
+        # Then
+        self.pipe.zincrby.assert_called_once_with("leaderboard:point", 10, "u1")
+        self.pipe.sadd.assert_called_once_with("leaderboard:rebuild:touched", "u1")
+
+    def test_rebuild_rereads_users_changed_during_rebuild(self, leaderboard):
+        # Given: rebuild 중 u1 의 점수가 바뀌고 gone 은 삭제됨
+        self.user_repo.find_points.return_value = [("u1", "a", 10), ("gone", "g", 5)]
+        self.redis.spop.side_effect = [["u1", "gone"], None]
+        self.user_repo.find_points_by_ids.return_value = [("u1", "a", 30)]
+
+        # When
+        count = leaderboard.rebuild()
+
+        # Then: RENAME 뒤에 DB 값으로 덮어쓰고 락 해제
+        assert count == 2
+        self.user_repo.find_points_by_ids.assert_called_once_with(["u1", "gone"])
+        self.pipe.zadd.assert_called_with("leaderboard:point", {"u1": 30})
+        self.pipe.zrem.assert_called_once_with("leaderboard:point", "gone")
+        self.pipe.hdel.assert_called_once_with("leaderboard:nickname", "gone")
+        token = self.redis.set.call_args.args[1]
+        self.release_lock.assert_called_once_with(
+            keys=["leaderboard:rebuild:lock"], args=[token]
+        )
+
+    def test_remove_user(self, leaderboard):
+        # When
+        leaderboard.remove_user("u1")
+
+        # Then
+        self.pipe.zrem.assert_called_once_with("leaderboard:point", "u1")
+        self.pipe.hdel.assert_called_once_with("leaderboard:nickname", "u1")
+        self.pipe.sadd.assert_not_called()
+
+    def test_sync_users_writes_absolute_points(self, leaderboard):
+        # Given
+        self.user_repo.find_points_by_ids.return_value = [("u1", "a", 40)]
+
+        # When
+        leaderboard.sync_users(["u1", "admin"])
+
+        # Then
+        self.pipe.zadd.assert_called_once_with("leaderboard:point", {"u1": 40})
+        self.pipe.zrem.assert_called_once_with("leaderboard:point", "admin")
+        self.pipe.zincrby.assert_not_called()
@@ -0,0 +1,95 @@
+import pytest
+from datetime import datetime
+
+from common.exceptions import ValidationError
+from common.pagination import decode_cursor, encode_cursor
+from user.application.user_service import UserService
+
+
+class TestUserPagination:
+    @pytest.fixture
+    def user_service(self, mocker):
+        self.user_repo = mocker.Mock()
+        return UserService(user_repo=self.user_repo, login_history_repo=mocker.Mock())
+
+    def _users(self, mocker, count: int):
+        return [
+            mocker.Mock(id=f"user-{i}", point=100 - i, created_at=datetime(2025, 1, i + 1))
+            for i in range(count)
+        ]
+
+    def test_first_page_returns_next_cursor(self, user_service, mocker):
+        # Given: limit + 1 개가 조회되면 다음 페이지가 있다
+        self.user_repo.get_users.return_value = self._users(mocker, 3)
+
+        # When
+        page = user_service.get_users(order_by="point", order="desc", limit=2)
+
+        # Then
+        assert [user.id for user in page.items] == ["user-0", "user-1"]
+        assert page.has_more is True
+        assert decode_cursor(page.next_cursor) == {
+            "order_by": "point",
+            "order": "desc",
+            "value": 99,
+            "id": "user-1",
+        }
+        assert self.user_repo.get_users.call_args.kwargs["limit"] == 3
+        assert self.user_repo.get_users.call_args.kwargs["after"] is None
+
+    def test_cursor_is_passed_as_keyset(self, user_service, mocker):
+        # Given
+        self.user_repo.get_users.return_value = self._users(mocker, 1)
+        cursor = encode_cursor(
+            {
+                "order_by": "created_at",
+                "order": "asc",
+                "value": "2025-01-02T00:00:00",
+                "id": "user-1",
+            }
+        )
+
+        # When
+        page = user_service.get_users(order_by="created_at", cursor=cursor, offset=50)
+
+        # Then
+        kwargs = self.user_repo.get_users.call_args.kwargs
+        assert kwargs["after"] == (datetime(2025, 1, 2), "user-1")
+        assert kwargs["offset"] is None
+        assert page.has_more is False
+        assert page.next_cursor is None
+
+    def test_cursor_for_other_order_is_rejected(self, user_service):
+        cursor = encode_cursor({"order_by": "point", "order": "asc", "value": 1, "id": "x"})
+        with pytest.raises(ValidationError):
+            user_service.get_users(order_by="nickname", cursor=cursor)
+
+    @pytest.mark.parametrize("cursor", ["!!!", encode_cursor([1, 2])])
+    def test_invalid_cursor(self, user_service, cursor):
+        with pytest.raises(ValidationError):
+            user_service.get_users(cursor=cursor)
+
+    @pytest.mark.parametrize(
+        "order_by, value, id",
+        [
+            ("point", "10", "user-1"),
+            ("point", None, "user-1"),
+            ("point", True, "user-1"),
+            ("nickname", 3, "user-1"),
+            ("created_at", "yesterday", "user-1"),
+            ("point", 10, None),
+            ("point", 10, ""),
+            (None, None, 5),
+        ],
+    )
+    def test_tampered_cursor_is_rejected(self, user_service, order_by, value, id):
+        # 타입이 맞지 않는 값이 DB 까지 가지 않는다
+        cursor = encode_cursor({"order_by": order_by, "order": "asc", "value": value, "id": id})
+        with pytest.raises(ValidationError, match="Invalid cursor"):
+            user_service.get_users(order_by=order_by, cursor=cursor)
+        self.user_repo.get_users.assert_not_called()
+
+    def test_unsupported_order_by(self, user_service):
+        with pytest.raises(ValidationError):
+            user_service.get_users(order_by="password")
+        self.user_repo.get_users.assert_not_called()
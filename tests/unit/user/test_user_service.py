@@ -348,3 +348,22 @@ class TestUserService:
         
         user_repo_mock.find_by_id.assert_called_once_with("nonexistent_id")
         user_repo_mock.delete.assert_not_called()
+
+    def test_delete_user_removes_from_leaderboard(
+        self, user_repo_mock, login_history_repo_mock, test_user
+    ):
+        # 설정
+        leaderboard = Mock()
+        user_service = UserService(
+            user_repo=user_repo_mock,
+            login_history_repo=login_history_repo_mock,
+            leaderboard=leaderboard,
+        )
+        user_repo_mock.find_by_id.return_value = test_user
+
+        # 실행
+        user_service.delete_user(test_user.id)
+
+        # 검증
+        user_repo_mock.delete.assert_called_once_with(test_user.id)
+        leaderboard.remove_user.assert_called_once_with(test_user.id)
@@ -0,0 +1,75 @@
+import threading
+
+import pytest
+
+from common.redis.reliable_queue import QueueJob
+from workers.score_worker import ScoreCalculationWorker
+
+
+class TestScoreCalculationWorker:
+    @pytest.fixture
+    def worker(self, mocker):
+        self.redis_client = mocker.Mock()
+        self.queue = self.redis_client.queue
+        self.queue.size.return_value = {"ready": 0, "processing": 0, "delayed": 0, "dead": 0}
+        self.answer_repo = mocker.Mock()
+        self.answer_repo.score_game.return_value = {"user-1": 10}
+        self.leaderboard = mocker.Mock()
+        return ScoreCalculationWorker(
+            redis_client=self.redis_client,
+            game_repo=mocker.Mock(),
+            answer_repo=self.answer_repo,
+            leaderboard=self.leaderboard,
+            ranking_cache=mocker.Mock(),
+        )
+
+    def _job(self, data):
+        return QueueJob(id="job-1", data=data, attempts=0, key=None, raw="raw")
+
+    def test_process_acks_scored_game(self, worker):
+        job = self._job({"game_id": "game-1"})
+
+        worker.process(job)
+
+        self.answer_repo.score_game.assert_called_once_with("game-1")
+        self.leaderboard.apply_deltas.assert_called_once_with({"user-1": 10})
+        self.queue.ack.assert_called_once_with(job)
+        self.queue.retry.assert_not_called()
+
+    def test_redelivered_job_resyncs_leaderboard(self, worker):
+        # Given: 이전 시도에서 점수는 커밋됐지만 랭킹 반영 전에 워커가 죽음
+        self.answer_repo.score_game.return_value = {}
+        self.answer_repo.find_scored_user_ids_by_game_id.return_value = ["user-1"]
+        job = QueueJob(id="job-1", data={"game_id": "game-1"}, attempts=1, key=None, raw="raw")
+
+        worker.process(job)
+
+        self.leaderboard.apply_deltas.assert_not_called()
+        self.leaderboard.sync_users.assert_called_once_with(["user-1"])
+        self.queue.ack.assert_called_once_with(job)
+
+    def test_process_retries_failed_game(self, worker):
+        self.answer_repo.score_game.side_effect = RuntimeError("db down")
+        job = self._job({"game_id": "game-1"})
+
+        worker.process(job)
+
+        self.queue.retry.assert_called_once_with(job, "db down")
+        self.queue.ack.assert_not_called()
+
+    def test_run_drains_queue_without_sleeping_and_stops(self, worker):
+        jobs = [self._job({"game_id": f"game-{i}"}) for i in range(3)]
+
+        def dequeue():
+            if jobs:
+                return jobs.pop()
+            worker.stop()
+            return None
+
+        self.redis_client.dequeue.side_effect = dequeue
+        runner = threading.Thread(target=worker.run, kwargs={"concurrency": 2})
+        runner.start()
+        runner.join(timeout=2)
+
+        assert not runner.is_alive()
+        assert self.queue.ack.call_count == 3
@@ -1,110 +1,95 @@
 from common.redis.client import RedisClient
+from user.domain.repository.user_repo import IUserRepository
+import json
 import time
-import threading
 from datetime import datetime
 import pytz
 
+
 class ActiveUserService:
-    def __init__(self, redis_client: RedisClient):
+    """활성 사용자 추적
+
+    sorted set (member: user_id, score: 마지막 활동 시각 epoch 초) 하나로 관리한다.
+    최근 active_window 초 안에 활동한 사용자를 활성 사용자로 본다.
+    비용은 Redis 전체 키 수가 아니라 활성 사용자 수에만 비례한다.
+
+    닉네임이 포함된 목록은 스냅샷(JSON 한 개)으로 Redis 에 저장해 모든 프로세스가 공유한다.
+    """
+
+    def __init__(self, redis_client: RedisClient, user_repo: IUserRepository):
         self.redis_client = redis_client
-        self.user_activity_prefix = "user_activity:"
-        self.active_users_count_key = "active_users_count"
+        self.user_repo = user_repo
+        self.active_users_key = "active_users"
         self.active_users_list_key = "active_users_list"
-        self.update_interval = 30  # 30초마다 업데이트
-        self._running = False
-        self._thread = None
-    
+        self.active_window = 300  # 300초(5분) 동안 활성 사용자로 간주
+        self.update_interval = 30  # 30초마다 정리 및 스냅샷 갱신
+
     def get_active_users_count(self) -> int:
         """현재 활성 사용자 수를 반환"""
-        count = self.redis_client.get(self.active_users_count_key)
-        if count is None:
-            # 캐시에 없으면 새로 계산
-            return self._update_active_users_count()
-        return count
-    
-    def get_active_users(self) -> list:
-        """현재 활성 사용자 목록을 반환"""
-        users = self.redis_client.get(self.active_users_list_key)
-        if users is None:
-            # 캐시에 없으면 새로 계산
-            return self._update_active_users_list()
+        return self.redis_client._redis.zcount(
+            self.active_users_key, self._window_start(), "+inf"
+        )
+
+    def get_active_users(self, offset: int = 0, limit: int = 100) -> list:
+        """최근 활동 순으로 활성 사용자 목록을 반환 (공유 스냅샷 기준)"""
+        snapshot = self.redis_client._redis.get(self.active_users_list_key)
+        users = json.loads(snapshot) if snapshot else self.refresh_snapshot()
+        return users[offset : offset + limit]
+
+    def refresh_snapshot(self) -> list:
+        """활성 사용자 목록 스냅샷을 다시 만들어 저장
+
+        ZREVRANGEBYSCORE 한 번으로 id 와 마지막 활동 시각을,
+        WHERE id IN (...) 쿼리 한 번으로 닉네임을 가져온다.
+        """
+        entries = self.redis_client._redis.zrevrangebyscore(
+            self.active_users_key, "+inf", self._window_start(), withscores=True
+        )
+        nicknames = self.user_repo.find_nicknames_by_ids(
+            [user_id for user_id, _ in entries]
+        )
+        users = [
+            {
+                "id": user_id,
+                "nickname": nicknames.get(user_id),
+                "last_activity": self._to_iso(last_seen),
+            }
+            for user_id, last_seen in entries
+        ]
+        # 갱신 주기의 두 배 동안 유지 (갱신이 한 번 실패해도 목록이 비지 않도록)
+        self.redis_client._redis.setex(
+            self.active_users_list_key, self.update_interval * 2, json.dumps(users)
+        )
         return users
-    
-    def _update_active_users_count(self) -> int:
-        """Redis에서 활성 사용자 수를 계산하여 캐시에 저장"""
-        # Redis의 키 패턴으로 활성 사용자 키를 모두 조회
-        keys = self.redis_client._redis.keys(f"{self.user_activity_prefix}*")
-        count = len(keys)
-        self.redis_client.set(self.active_users_count_key, count, 60)  # 60초 TTL
-        return count
-    
-    def _update_active_users_list(self) -> list:
-        """Redis에서 활성 사용자 목록을 가져와 캐시에 저장"""
-        # Redis의 키 패턴으로 활성 사용자 키를 모두 조회
-        keys = self.redis_client._redis.keys(f"{self.user_activity_prefix}*")
-        
-        # 사용자 ID 추출 및 활동 정보 가져오기
-        active_users = []
-        for key in keys:
-            user_id = key.replace(self.user_activity_prefix, "")
-            user_data = self.redis_client.get(key)
-            if user_data:
-                # 사용자 정보 조회 (옵션)
-                from user.infra.repository.user_repo import UserRepository
-                user_repo = UserRepository()
-                user = user_repo.find_by_id(user_id)
-                
-                if user:
-                    active_users.append({
-                        "id": user_id,
-                        "name": user.name if hasattr(user, 'name') else None,
-                        "nickname": user.nickname if hasattr(user, 'nickname') else None,
-                        "email": user.email if hasattr(user, 'email') else None,
-                        "last_activity": user_data.get("last_activity")
-                    })
-                else:
-                    active_users.append({
-                        "id": user_id,
-                        "last_activity": user_data.get("last_activity")
-                    })
-        
-        # 캐시에 저장 (60초 TTL)
-        self.redis_client.set(self.active_users_list_key, active_users, 60)
-        return active_users
-    
-    def start_background_updater(self):
-        """백그라운드에서 활성 사용자 수를 주기적으로 업데이트"""
-        if self._running:
-            return
-        
-        self._running = True
-        self._thread = threading.Thread(target=self._background_update_task)
-        self._thread.daemon = True
-        self._thread.start()
-    
-    def stop_background_updater(self):
-        """백그라운드 업데이트 작업 중지"""
-        self._running = False
-        if self._thread:
-            self._thread.join(timeout=1)
-    
-    def _background_update_task(self):
-        """백그라운드에서 실행되는 업데이트 작업"""
-        while self._running:
-            try:
-                self._update_active_users_count()
-                self._update_active_users_list()
-            except Exception as e:
-                print(f"활성 사용자 정보 업데이트 중 오류 발생: {e}")
-            time.sleep(self.update_interval)
-    
+
+    def sweep(self) -> int:
+        """활동 시간이 지난 사용자 제거
+
+        Returns:
+            int: 제거된 사용자 수
+        """
+        return self.redis_client._redis.zremrangebyscore(
+            self.active_users_key, "-inf", f"({self._window_start()}"
+        )
+
+    def refresh(self):
+        """만료된 사용자 정리 및 스냅샷 갱신 (리더 프로세스에서 주기적으로 실행)"""
+        self.sweep()
+        self.refresh_snapshot()
+
     def record_user_activity(self, user_id: str):
         """사용자 활동 기록"""
         if not user_id:
             return
-            
-        now = datetime.now(pytz.timezone('Asia/Seoul')).isoformat()
-        user_key = f"{self.user_activity_prefix}{user_id}"
-        
-        # Redis에 사용자 활동 정보 저장 (300초 TTL)
-        self.redis_client.set(user_key, {"last_activity": now}, 300)
+        self.redis_client._redis.zadd(self.active_users_key, {user_id: time.time()})
+
+    def record_users(self, last_seen: dict[str, float]):
+        """여러 사용자의 활동 시각을 한 번에 기록 (ActivityRecorder 에서 사용)"""
+        if last_seen:
+            self.redis_client._redis.zadd(self.active_users_key, last_seen)
+
+    def _window_start(self) -> float:
+        return time.time() - self.active_window
+
+    def _to_iso(self, timestamp: float) -> str:
+        return datetime.fromtimestamp(timestamp, pytz.timezone("Asia/Seoul")).isoformat()
@@ -0,0 +1,106 @@
+import logging
+import threading
+import time
+
+from common.metrics import metrics
+from user.application.active_user_service import ActiveUserService
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityRecorder:
+    """프로세스 단위로 활동 기록을 모아서 쓰기
+
+    같은 사용자는 record_interval 초에 한 번만 기록 대상으로 올리고,
+    모인 기록은 백그라운드 스레드가 flush_interval 마다 ZADD 한 번으로 저장한다.
+    Redis 쓰기 횟수는 요청 수가 아니라 활성 사용자 수에 비례한다.
+    """
+
+    def __init__(
+        self,
+        active_user_service: ActiveUserService,
+        record_interval: float = 60,
+        flush_interval: float = 1,
+    ):
+        self.active_user_service = active_user_service
+        self.record_interval = record_interval
+        self.flush_interval = flush_interval
+
+        self._pending: dict[str, float] = {}
+        self._last_recorded: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+        self._records = metrics.counter(
+            "activity_records_total", "Authenticated requests seen by the recorder"
+        )
+        self._suppressed = metrics.counter(
+            "activity_writes_suppressed_total", "Activity writes skipped by coalescing"
+        )
+        self._flushed = metrics.counter(
+            "activity_flushed_users_total", "User activity entries written to Redis"
+        )
+
+    def record(self, user_id: str) -> None:
+        now = time.monotonic()
+        self._records.inc()
+        with self._lock:
+            last = self._last_recorded.get(user_id)
+            if last is not None and now - last < self.record_interval:
+                self._suppressed.inc()
+                return
+            self._last_recorded[user_id] = now
+            self._pending[user_id] = time.time()
+
+        if self._thread is None or not self._thread.is_alive():
+            self.start()
+
+    def flush(self) -> int:
+        """모인 기록을 한 번에 저장
+
+        Returns:
+            int: 저장한 사용자 수
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            # 기록 간격이 지난 항목은 더 이상 필요 없으므로 정리
+            expire_before = time.monotonic() - self.record_interval
+            self._last_recorded = {
+                user_id: last
+                for user_id, last in self._last_recorded.items()
+                if last >= expire_before
+            }
+        if not pending:
+            return 0
+
+        try:
+            self.active_user_service.record_users(pending)
+        except Exception as e:
+            logger.warning(f"Failed to flush user activity: {e}")
+            with self._lock:
+                # 다음 flush 에서 다시 시도 (그 사이 새 기록이 있으면 그쪽이 우선)
+                self._pending = {**pending, **self._pending}
+            return 0
+        self._flushed.inc(len(pending))
+        return len(pending)
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._loop, name="activity-recorder", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        self.flush()
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
@@ -0,0 +1,242 @@
+import logging
+import uuid
+
+from common.redis.client import RedisClient
+from common.redis.cluster_job import RELEASE_LOCK_SCRIPT
+from user.domain.repository.user_repo import IUserRepository
+from user.domain.user import RankedUser
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderboardService:
+    """유저 포인트 랭킹 (Redis sorted set)
+
+    member 는 user_id, score 는 user.point.
+    닉네임은 별도 hash 에 저장해 목록 조회 시 DB 를 거치지 않는다.
+    순위는 동점자에게 같은 순위를 주는 방식 (1, 2, 2, 4 ...).
+    rebuild() 로 DB 에서 한 번 채운 뒤(built_key)부터 가입 / 점수 변경을 반영한다.
+    rebuild 중에 바뀐 유저는 touched_key 에 모아 두었다가 RENAME 뒤에 DB 에서 다시 읽는다.
+    """
+
+    def __init__(self, redis_client: RedisClient, user_repo: IUserRepository):
+        self.redis_client = redis_client
+        self.user_repo = user_repo
+        self.ranking_key = "leaderboard:point"
+        self.nickname_key = "leaderboard:nickname"
+        # rebuild() 만 설정. 가입 / 점수 반영으로 생긴 일부 유저만 있는 랭킹과 구분
+        self.built_key = "leaderboard:built"
+        self.rebuild_lock_key = "leaderboard:rebuild:lock"
+        self.touched_key = "leaderboard:rebuild:touched"
+        self.rebuild_lock_ttl = 60  # 초
+        self.rebuild_chunk_size = 10000
+        self._release_lock = redis_client._redis.register_script(RELEASE_LOCK_SCRIPT)
+
+    def get_top(self, limit: int = 10, offset: int = 0) -> list[RankedUser]:
+        """상위 랭킹 조회"""
+        self._ensure_built()
+        entries = self.redis_client._redis.zrevrange(
+            self.ranking_key, offset, offset + limit - 1, withscores=True
+        )
+        return self._to_ranked(entries, offset)
+
+    def get_rank(self, user_id: str) -> RankedUser | None:
+        """유저 본인의 순위 조회"""
+        self._ensure_built()
+        redis = self.redis_client._redis
+        point = redis.zscore(self.ranking_key, user_id)
+        if point is None:
+            return None
+        return RankedUser(
+            rank=redis.zcount(self.ranking_key, f"({point}", "+inf") + 1,
+            user_id=user_id,
+            nickname=redis.hget(self.nickname_key, user_id),
+            point=int(point),
+        )
+
+    def get_around(self, user_id: str, window: int = 5) -> list[RankedUser]:
+        """유저 앞뒤로 window 명씩 포함한 랭킹 조회"""
+        self._ensure_built()
+        position = self.redis_client._redis.zrevrank(self.ranking_key, user_id)
+        if position is None:
+            return []
+        start = max(position - window, 0)
+        entries = self.redis_client._redis.zrevrange(
+            self.ranking_key, start, position + window, withscores=True
+        )
+        return self._to_ranked(entries, start)
+
+    def apply_deltas(self, deltas: dict[str, int]) -> None:
+        """포인트 변화량 반영 (점수 계산 후 호출)"""
+        if not deltas:
+            return
+        try:
+            built, rebuilding = self._write_state()
+            if not (built or rebuilding):
+                return  # 첫 조회 시 rebuild 가 DB 에서 읽어 온다
+            pipe = self.redis_client._redis.pipeline(transaction=False)
+            for user_id, delta in deltas.items():
+                pipe.zincrby(self.ranking_key, delta, user_id)
+            if rebuilding:
+                pipe.sadd(self.touched_key, *deltas)
+            pipe.execute()
+        except Exception as e:
+            # DB 가 기준이므로 실패해도 rebuild 로 복구 가능
+            logger.warning(f"Failed to update leaderboard: {e}")
+
+    def set_user(self, user_id: str, nickname: str, point: int | None = None) -> None:
+        """유저 등록 또는 닉네임 변경 반영 (point 가 None 이면 점수는 유지)"""
+        try:
+            built, rebuilding = self._write_state()
+            if not (built or rebuilding):
+                return
+            pipe = self.redis_client._redis.pipeline(transaction=False)
+            pipe.hset(self.nickname_key, user_id, nickname)
+            if point is not None:
+                pipe.zadd(self.ranking_key, {user_id: point})
+            if rebuilding:
+                pipe.sadd(self.touched_key, user_id)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to update leaderboard user {user_id}: {e}")
+
+    def sync_users(self, user_ids: list[str]) -> None:
+        """유저 점수를 DB 값(절대값)으로 덮어씀
+
+        ZINCRBY 와 달리 여러 번 실행해도 결과가 같다.
+        점수는 커밋됐지만 apply_deltas 전에 작업이 중단된 경우 복구용.
+        """
+        if not user_ids:
+            return
+        try:
+            built, rebuilding = self._write_state()
+            if rebuilding:
+                self.redis_client._redis.sadd(self.touched_key, *user_ids)
+            if built:
+                self._write_absolute(list(user_ids))
+        except Exception as e:
+            logger.warning(f"Failed to sync leaderboard users: {e}")
+
+    def remove_user(self, user_id: str) -> None:
+        """탈퇴 / 삭제된 유저를 랭킹에서 제거"""
+        try:
+            _, rebuilding = self._write_state()
+            pipe = self.redis_client._redis.pipeline(transaction=False)
+            pipe.zrem(self.ranking_key, user_id)
+            pipe.hdel(self.nickname_key, user_id)
+            if rebuilding:
+                pipe.sadd(self.touched_key, user_id)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to remove leaderboard user {user_id}: {e}")
+
+    def rebuild(self) -> int | None:
+        """DB 기준으로 랭킹 재생성 (cold start 또는 정합성 복구용)
+
+        임시 키에 채운 뒤 RENAME 하므로 재생성 중에도 기존 랭킹을 계속 읽을 수 있다.
+        동시에 한 프로세스만 실행한다 (SET NX 락).
+
+        Returns:
+            int | None: 랭킹에 포함된 유저 수. 다른 곳에서 재생성 중이면 None
+        """
+        redis = self.redis_client._redis
+        token = uuid.uuid4().hex
+        if not redis.set(
+            self.rebuild_lock_key, token, nx=True, px=self.rebuild_lock_ttl * 1000
+        ):
+            logger.info("Leaderboard rebuild already in progress")
+            return None
+        try:
+            # 락을 잡기 전 변경은 아래 DB 조회에 포함된다
+            redis.delete(self.touched_key)
+            count = self._rebuild()
+            self._refresh_touched()
+            return count
+        finally:
+            self._release_lock(keys=[self.rebuild_lock_key], args=[token])
+
+    def _rebuild(self) -> int:
+        rows = self.user_repo.find_points()
+        redis = self.redis_client._redis
+        tmp_ranking_key = f"{self.ranking_key}:rebuild"
+        tmp_nickname_key = f"{self.nickname_key}:rebuild"
+        redis.delete(tmp_ranking_key, tmp_nickname_key)
+
+        for i in range(0, len(rows), self.rebuild_chunk_size):
+            chunk = rows[i : i + self.rebuild_chunk_size]
+            pipe = redis.pipeline(transaction=False)
+            pipe.zadd(tmp_ranking_key, {user_id: point for user_id, _, point in chunk})
+            pipe.hset(
+                tmp_nickname_key,
+                mapping={user_id: nickname or "" for user_id, nickname, _ in chunk},
+            )
+            pipe.execute()
+
+        pipe = redis.pipeline(transaction=True)
+        if rows:
+            pipe.rename(tmp_ranking_key, self.ranking_key)
+            pipe.rename(tmp_nickname_key, self.nickname_key)
+        else:
+            pipe.delete(self.ranking_key, self.nickname_key)
+        pipe.set(self.built_key, 1)
+        pipe.execute()
+        return len(rows)
+
+    def _refresh_touched(self) -> None:
+        """rebuild 중에 바뀐 유저를 DB 에서 다시 읽어 절대값으로 덮어씀"""
+        redis = self.redis_client._redis
+        while user_ids := redis.spop(self.touched_key, self.rebuild_chunk_size):
+            self._write_absolute(user_ids)
+
+    def _write_absolute(self, user_ids: list[str]) -> None:
+        """DB 에서 읽은 점수 / 닉네임으로 덮어쓰고, 랭킹 대상이 아닌 유저는 제거"""
+        redis = self.redis_client._redis
+        for i in range(0, len(user_ids), self.rebuild_chunk_size):
+            chunk = user_ids[i : i + self.rebuild_chunk_size]
+            rows = self.user_repo.find_points_by_ids(chunk)
+            found = {user_id for user_id, _, _ in rows}
+            removed = [user_id for user_id in chunk if user_id not in found]
+            pipe = redis.pipeline(transaction=False)
+            if rows:
+                pipe.zadd(self.ranking_key, {user_id: point for user_id, _, point in rows})
+                pipe.hset(
+                    self.nickname_key,
+                    mapping={user_id: nickname or "" for user_id, nickname, _ in rows},
+                )
+            if removed:
+                pipe.zrem(self.ranking_key, *removed)
+                pipe.hdel(self.nickname_key, *removed)
+            pipe.execute()
+
+    def _write_state(self) -> tuple[bool, bool]:
+        """(랭킹이 만들어졌는지, rebuild 중인지)"""
+        built, rebuilding = self.redis_client._redis.mget(
+            self.built_key, self.rebuild_lock_key
+        )
+        return bool(built), bool(rebuilding)
+
+    def _ensure_built(self) -> None:
+        # 다른 요청이 재생성 중이면 기다리지 않고 현재 랭킹을 그대로 보여 준다
+        if not self.redis_client._redis.exists(self.built_key):
+            self.rebuild()
+
+    def _to_ranked(
+        self, entries: list[tuple[str, float]], start: int
+    ) -> list[RankedUser]:
+        if not entries:
+            return []
+        redis = self.redis_client._redis
+        user_ids = [user_id for user_id, _ in entries]
+        nicknames = redis.hmget(self.nickname_key, user_ids)
+
+        # 첫 항목만 ZCOUNT 로 순위를 구하고 이후는 위치로 계산
+        first_point = entries[0][1]
+        rank = redis.zcount(self.ranking_key, f"({first_point}", "+inf") + 1
+        result = []
+        for i, ((user_id, point), nickname) in enumerate(zip(entries, nicknames)):
+            if i > 0 and point != entries[i - 1][1]:
+                rank = start + i + 1
+            result.append(
+                RankedUser(rank=rank, user_id=user_id, nickname=nickname, point=int(point))
+            )
+        return result
@@ -9,15 +9,20 @@ from fastapi import HTTPException, status
 from dependency_injector.wiring import inject
 
 from common.auth import Role, create_access_token
+from common.exceptions import NotFoundError, ValidationError
+from common.pagination import Page, decode_cursor, encode_cursor
 from user.infra.db_models.user import LoginHistory
 from utils.crypto import Crypto
 from utils.email import EmailSender
 from user.domain.repository.user_repo import IUserRepository, ILoginHistoryRepository
 from common.redis.client import RedisClient
 from common.redis.config import RedisSettings
+from common.unit_of_work import after_commit
+from common.tasks import TaskName, TaskPriority, TaskQueue
 from config import get_settings
 
 from user.domain.user import User
+from user.application.leaderboard_service import LeaderboardService
 import os
 import re
 import uuid
@@ -28,13 +33,21 @@ from utils.password import is_valid_password, InvalidPasswordFormatError
 class UserService:
     @inject
     def __init__(
-        self, user_repo: IUserRepository, login_history_repo: ILoginHistoryRepository
+        self,
+        user_repo: IUserRepository,
+        login_history_repo: ILoginHistoryRepository,
+        leaderboard: LeaderboardService | None = None,
+        crypto: Crypto | None = None,
+        task_queue: TaskQueue | None = None,
     ):
         self.user_repo = user_repo
         self.login_history_repo = login_history_repo
+        self.leaderboard = leaderboard
         self.redis_settings = RedisSettings()
-        self.crypto = Crypto()
+        self.crypto = crypto or Crypto()
         self.email_sender = EmailSender()
+        # 설정되어 있으면 메일은 백그라운드 작업으로 발송 (없으면 요청 안에서 바로 발송)
+        self.task_queue = task_queue
         self.redis = RedisClient(self.redis_settings)
         self.ulid = ULID()
 
@@ -83,6 +96,8 @@ class UserService:
             coin=coin,
         )
         self.user_repo.save(user)
+        if self.leaderboard and role == Role.USER:
+            after_commit(lambda: self.leaderboard.set_user(user.id, user.nickname, point=0))
         return user
 
     def update_user(
@@ -110,8 +125,41 @@ class UserService:
             user.nickname = nickname
         user.modified_at = datetime.now()
         self.user_repo.update(user)
+        if self.leaderboard and nickname and user.role == Role.USER:
+            after_commit(lambda: self.leaderboard.set_user(user.id, nickname))
         return user
 
+    def delete_user(self, user_id: str) -> None:
+        """유저와 답변 / 로그인 기록 / 코인 지갑을 삭제하고 랭킹에서 제거"""
+        user = self.user_repo.find_by_id(user_id)
+        if not user:
+            raise NotFoundError(f"User not found: {user_id}")
+        self.user_repo.delete(user.id)
+        if self.leaderboard:
+            after_commit(lambda: self.leaderboard.remove_user(user.id))
+
+    def _cursor_value(self, order_by: str | None, value):
+        """cursor 의 정렬 값을 컬럼 타입으로 변환
+
+        변조되거나 오래된 cursor 가 DB 오류(500)나 빈 페이지가 되지 않도록
+        타입이 맞지 않으면 ValidationError (정렬 컬럼은 모두 NOT NULL).
+        """
+        if order_by is None:
+            return None
+        if order_by == "point" and isinstance(value, int) and not isinstance(value, bool):
+            return value
+        if order_by == "nickname" and isinstance(value, str):
+            return value
+        if order_by == "created_at" and isinstance(value, str):
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                pass
+        raise ValidationError("Invalid cursor")
+
+    # 관리자 목록 정렬 가능 컬럼 (모두 id 와 묶인 인덱스가 있음)
+    USER_SORT_FIELDS = ("point", "nickname", "created_at")
+
     def get_users(
         self,
         nickname: str | None = None,
@@ -119,18 +167,62 @@ class UserService:
         max_point: int | None = None,
         order_by: str | None = None,
         order: str | None = "asc",
-        offset: int | None = 0,
-        limit: int | None = 10000,
-    ):
-        return self.user_repo.get_users(
+        offset: int | None = None,
+        limit: int | None = 100,
+        cursor: str | None = None,
+    ) -> Page[User]:
+        """유저 목록 (keyset 페이지네이션)
+
+        (order_by 컬럼, id) 순서로 정렬하고, 이전 페이지의 next_cursor 를 cursor 로 넘기면
+        마지막 행 다음부터 조회한다. 페이지 깊이와 상관없이 인덱스 범위 조회 한 번이다.
+        offset 은 이전 클라이언트 호환용 (cursor 가 있으면 무시).
+
+        Raises:
+            ValidationError: 지원하지 않는 정렬 컬럼이거나 cursor 가 잘못됐거나 정렬 조건과 맞지 않을 때
+        """
+        if order_by is not None and order_by not in self.USER_SORT_FIELDS:
+            raise ValidationError(f"Unsupported order_by: {order_by}")
+        order = "desc" if order == "desc" else "asc"
+        limit = limit or 100
+
+        after = None
+        if cursor:
+            data = decode_cursor(cursor)
+            if data.get("order_by") != order_by or data.get("order") != order:
+                raise ValidationError("Cursor does not match the requested order")
+            after_id = data.get("id")
+            if not isinstance(after_id, str) or not after_id:
+                raise ValidationError("Invalid cursor")
+            after = (self._cursor_value(order_by, data.get("value")), after_id)
+            offset = None
+
+        # 한 개 더 읽어 다음 페이지 유무 확인
+        users = self.user_repo.get_users(
             nickname=nickname,
             min_point=min_point,
             max_point=max_point,
             order_by=order_by,
             order=order,
             offset=offset,
-            limit=limit,
+            limit=limit + 1,
+            after=after,
         )
+        has_more = len(users) > limit
+        users = users[:limit]
+
+        next_cursor = None
+        if has_more:
+            last = users[-1]
+            value = getattr(last, order_by) if order_by else None
+            next_cursor = encode_cursor(
+                {
+                    "order_by": order_by,
+                    "order": order,
+                    "value": value.isoformat() if isinstance(value, datetime) else value,
+                    "id": last.id,
+                }
+            )
+        return Page(items=users, next_cursor=next_cursor, has_more=has_more)
 
     def get_user_by_id(self, user_id: str) -> User:
         return self.user_repo.find_by_id(user_id)
@@ -169,11 +261,14 @@ class UserService:
                 return False
             raise e
 
-    def send_verification_email(self, email: str) -> None:
+    def send_verification_email(self, email: str) -> str | None:
         """Send verification email to the given email address
 
         Args:
             email (str): Email address to send verification to
+
+        Returns:
+            str | None: 백그라운드 작업 id (task_queue 가 없으면 None)
         """
         # Generate verification token
         token = secrets.token_urlsafe(8)
@@ -188,6 +283,12 @@ class UserService:
         )
 
         # Send verification email
+        if self.task_queue:
+            return self.task_queue.submit(
+                TaskName.EMAIL_VERIFICATION,
+                {"email": email, "token": token},
+                priority=TaskPriority.HIGH,
+            )
         try:
             self.email_sender.send_verification_email(email, token)
         except Exception as e:
@@ -225,7 +326,8 @@ class UserService:
     def login(self, email: str, password: str) -> dict:
         try:
             user = self.user_repo.find_by_email(email)
-            if not self.crypto.verify(password, user.password):
+            verified, new_hash = self.crypto.verify_and_update(password, user.password)
+            if not verified:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid credentials",
@@ -243,6 +345,10 @@ class UserService:
             },
             role=user.role,
         )
+        if new_hash:
+            # bcrypt cost 가 바뀐 경우 새 cost 로 다시 저장
+            user.password = new_hash
+            self.user_repo.update(user)
         if access_token:
             login_history = LoginHistory(
                 id=self.ulid.generate(),
@@ -291,12 +397,15 @@ class UserService:
         user.password = hashed_password
         self.user_repo.update(user)
 
-    def request_password_reset(self, email: str) -> None:
+    def request_password_reset(self, email: str) -> str | None:
         """비밀번호 재설정 요청
 
         Args:
             email: 사용자 이메일
 
+        Returns:
+            str | None: 메일 발송 작업 id (task_queue 가 없으면 None)
+
         Raises:
             HTTPException: 사용자가 존재하지 않는 경우
         """
@@ -419,12 +528,17 @@ class UserService:
         </html>
         """
 
-        self.email_sender.send_email(
-            to_email=email,
-            subject="비밀번호 재설정",
-            content=html_content,
-            is_html=True,
-        )
+        message = {
+            "to_email": email,
+            "subject": "비밀번호 재설정",
+            "content": html_content,
+            "is_html": True,
+        }
+        if self.task_queue:
+            return self.task_queue.submit(
+                TaskName.EMAIL_SEND, message, priority=TaskPriority.HIGH
+            )
+        self.email_sender.send_email(**message)
 
     def verify_password_reset_token(self, email: str, token: str) -> bool:
         """비밀번호 재설정 토큰 검증
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from user.domain.user import User, LoginHistory
+from datetime import datetime
+from user.domain.user import User, LoginHistory, PointDrift
 
 
 class IUserRepository(ABC):
@@ -31,6 +32,71 @@ class IUserRepository(ABC):
     def find_all(self) -> list[User]:
         pass
 
+    @abstractmethod
+    def find_ids(self, active_since: datetime | None = None) -> list[str]:
+        """
+        Return user ids only.
+        If active_since is given, only users who logged in after it are returned.
+        """
+        pass
+
+    @abstractmethod
+    def find_points(self) -> list[tuple[str, str, int]]:
+        """
+        Return (id, nickname, point) of every ranked user (role USER).
+        """
+        pass
+
+    @abstractmethod
+    def find_points_by_ids(self, ids: list[str]) -> list[tuple[str, str, int]]:
+        """
+        Return (id, nickname, point) of the given ranked users (role USER).
+        Unknown or non-ranked ids are omitted.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, id: str) -> None:
+        """
+        Delete the user with their answers, login history and coin wallet.
+        """
+        pass
+
+    @abstractmethod
+    def find_nicknames_by_ids(self, ids: list[str]) -> dict[str, str | None]:
+        """
+        Return {id: nickname} for the given ids in a single query.
+        Unknown ids are omitted.
+        """
+        pass
+
+    @abstractmethod
+    def reconcile_points(self, fix: bool = False) -> list[PointDrift]:
+        """
+        Compare user.point with the sum of the user's answer points.
+        Returns users whose totals drifted; if fix is True, their totals are overwritten.
+        """
+        pass
+
+    @abstractmethod
+    def get_users(
+        self,
+        nickname: str | None = None,
+        min_point: int | None = None,
+        max_point: int | None = None,
+        order_by: str | None = None,
+        order: str | None = "asc",
+        limit: int | None = None,
+        offset: int | None = None,
+        after: tuple | None = None,
+    ) -> list[User]:
+        """
+        Filtered users ordered by (order_by, id), or by id alone if order_by is None.
+        after is the (order_by value, id) of the last row of the previous page;
+        only rows strictly after it in that order are returned.
+        """
+        pass
+
 
 class ILoginHistoryRepository(ABC):
     @abstractmethod
@@ -55,3 +55,18 @@ class Coin:
     updated_at: datetime
     status: CoinStatus = CoinStatus.ACTIVE
     memo: str | None = None
+
+
+@dataclass
+class PointDrift:
+    user_id: str
+    stored_point: int  # user.point
+    expected_point: int  # sum(answer.point)
+
+
+@dataclass
+class RankedUser:
+    rank: int
+    user_id: str
+    nickname: str | None
+    point: int
@@ -10,6 +10,9 @@ from sqlalchemy import (
     Integer,
     Boolean,
     ForeignKey,
+    DDL,
+    Index,
+    event,
 )
 from sqlalchemy.orm import Mapped, relationship
 
@@ -20,6 +23,19 @@ from user.domain.user import CoinStatus
 
 class User(Base):
     __tablename__ = "user"
+    __table_args__ = (
+        # 관리자 목록 keyset 페이지네이션 (정렬 컬럼, id)
+        Index("ix_user_point_id", "point", "id"),
+        Index("ix_user_nickname_id", "nickname", "id"),
+        Index("ix_user_created_at_id", "created_at", "id"),
+        # 닉네임 부분 검색 (ILIKE '%...%')
+        Index(
+            "ix_user_nickname_trgm",
+            "nickname",
+            postgresql_using="gin",
+            postgresql_ops={"nickname": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[str] = Column(String(36), primary_key=True)
     name: Mapped[str] = Column(String(32), nullable=False)
@@ -43,6 +59,14 @@ class User(Base):
     )
 
 
+# create_all 로 테이블을 만들 때도 trigram 인덱스를 만들 수 있도록
+event.listen(
+    User.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
 class LoginHistory(Base):
     __tablename__ = "login_history"
 
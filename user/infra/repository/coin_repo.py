@@ -3,7 +3,7 @@ from typing import List, Optional
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from database import SessionLocal
+from common.unit_of_work import UnitOfWork
 from user.domain.repository.coin_repo import ICoinWalletRepository, ICoinRepository
 from user.domain.user import CoinWallet, Coin
 from user.infra.db_models.user import CoinWallet as CoinWalletModel
@@ -11,6 +11,9 @@ from user.infra.db_models.user import Coin as CoinModel
 
 
 class CoinWalletRepository(ICoinWalletRepository):
+    def __init__(self, uow: UnitOfWork | None = None):
+        self.uow = uow or UnitOfWork()
+
     def _to_domain(self, model: CoinWalletModel) -> CoinWallet:
         return CoinWallet(
             id=model.id,
@@ -33,32 +36,35 @@ class CoinWalletRepository(ICoinWalletRepository):
 
     def create(self, wallet: CoinWallet) -> CoinWallet:
         model = self._to_model(wallet)
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             db.add(model)
             db.commit()
             return self._to_domain(model)
 
     def find_by_id(self, wallet_id: str) -> Optional[CoinWallet]:
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             stmt = select(CoinWalletModel).where(CoinWalletModel.id == wallet_id)
             result = db.execute(stmt).scalar_one_or_none()
             return self._to_domain(result) if result else None
 
     def find_by_user_id(self, user_id: str) -> Optional[CoinWallet]:
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             stmt = select(CoinWalletModel).where(CoinWalletModel.user_id == user_id)
             result = db.execute(stmt).scalar_one_or_none()
             return self._to_domain(result) if result else None
 
     def update(self, wallet: CoinWallet) -> CoinWallet:
         model = self._to_model(wallet)
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             db.merge(model)
             db.commit()
             return wallet
 
 
 class CoinRepository(ICoinRepository):
+    def __init__(self, uow: UnitOfWork | None = None):
+        self.uow = uow or UnitOfWork()
+
     def _to_domain(self, model: CoinModel) -> Coin:
         return Coin(
             id=model.id,
@@ -81,26 +87,26 @@ class CoinRepository(ICoinRepository):
 
     def create(self, coin: Coin) -> Coin:
         model = self._to_model(coin)
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             db.add(model)
             db.commit()
             return self._to_domain(model)
 
     def find_by_id(self, coin_id: str) -> Optional[Coin]:
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             stmt = select(CoinModel).where(CoinModel.id == coin_id)
             result = db.execute(stmt).scalar_one_or_none()
             return self._to_domain(result) if result else None
 
     def find_by_wallet_id(self, wallet_id: str) -> List[Coin]:
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             stmt = select(CoinModel).where(CoinModel.wallet_id == wallet_id)
             results = db.execute(stmt).scalars().all()
             return [self._to_domain(result) for result in results]
 
     def update(self, coin: Coin) -> Coin:
         model = self._to_model(coin)
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             db.merge(model)
             db.commit()
             return coin
@@ -1,13 +1,51 @@
+from datetime import datetime
+
 from fastapi import HTTPException, status
-from sqlalchemy import desc
-from database import SessionLocal
+from sqlalchemy import delete, desc, exists, select, text, tuple_
+from common.auth import Role
+from common.unit_of_work import UnitOfWork
 from user.domain.repository.user_repo import IUserRepository, ILoginHistoryRepository
 from user.domain.user import User as UserVO
 from user.domain.user import LoginHistory as LoginHistoryVO
-from user.infra.db_models.user import User, LoginHistory
+from user.domain.user import PointDrift
+from answer.infra.db_models.answer import Answer
+from user.infra.db_models.user import Coin, CoinWallet, LoginHistory, User
+
+
+# answer.point 합계와 user.point 비교
+POINT_TOTALS_CTE = """
+    WITH totals AS (
+        SELECT u.id, u.point AS stored_point, coalesce(sum(a.point), 0)::integer AS expected_point
+        FROM "user" u
+        LEFT JOIN answer a ON a.user_id = u.id
+        GROUP BY u.id
+    )
+"""
+FIND_POINT_DRIFT_SQL = text(
+    POINT_TOTALS_CTE
+    + """
+    SELECT id AS user_id, stored_point, expected_point
+    FROM totals
+    WHERE stored_point <> expected_point
+    """
+)
+FIX_POINT_DRIFT_SQL = text(
+    POINT_TOTALS_CTE
+    + """
+    UPDATE "user"
+    SET point = totals.expected_point
+    FROM totals
+    WHERE "user".id = totals.id
+      AND totals.stored_point <> totals.expected_point
+    RETURNING "user".id AS user_id, totals.stored_point, totals.expected_point
+    """
+)
 
 
 class UserRepository(IUserRepository):
+    def __init__(self, uow: UnitOfWork | None = None):
+        self.uow = uow or UnitOfWork()
+
     def save(self, user: UserVO):
 
         db_user = User(
@@ -25,12 +63,12 @@ class UserRepository(IUserRepository):
             memo=user.memo,
             coin=user.coin,
         )
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             db.add(db_user)
             db.commit()
 
     def find_by_email(self, email: str) -> UserVO:
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             user = db.query(User).filter(User.email == email).first()
             if not user:
                 raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
@@ -52,8 +90,8 @@ class UserRepository(IUserRepository):
             )
 
     def find_by_id(self, id: str) -> UserVO:
-        with SessionLocal() as db:
-            user = db.query(User).filter(User.id == id).first()
+        with self.uow.session() as db:
+            user = db.get(User, id)
             if not user:
                 raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
             return UserVO(
@@ -74,7 +112,7 @@ class UserRepository(IUserRepository):
             )
 
     def find_by_nickname(self, nickname: str) -> UserVO:
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             user = db.query(User).filter(User.nickname == nickname).first()
             if not user:
                 raise HTTPException(
@@ -99,7 +137,7 @@ class UserRepository(IUserRepository):
             )
 
     def find_by_verification_token(self, token: str) -> UserVO:
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             user = db.query(User).filter(User.email_verification_token == token).first()
             if not user:
                 raise HTTPException(
@@ -126,7 +164,7 @@ class UserRepository(IUserRepository):
             )
 
     def find_all(self) -> list[UserVO]:
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             users = db.query(User).all()
             return [
                 UserVO(
@@ -148,9 +186,74 @@ class UserRepository(IUserRepository):
                 for user in users
             ]
 
+    def find_ids(self, active_since: datetime | None = None) -> list[str]:
+        with self.uow.session() as db:
+            stmt = select(User.id)
+            if active_since is not None:
+                # 기간 내 로그인 기록이 있는 유저만
+                stmt = stmt.where(
+                    exists().where(
+                        LoginHistory.user_id == User.id,
+                        LoginHistory.login_at >= active_since,
+                    )
+                )
+            return list(db.execute(stmt).scalars())
+
+    def find_points(self) -> list[tuple[str, str, int]]:
+        with self.uow.session() as db:
+            rows = db.execute(
+                select(User.id, User.nickname, User.point).where(User.role == Role.USER)
+            ).all()
+            return [(row.id, row.nickname, row.point) for row in rows]
+
+    def find_points_by_ids(self, ids: list[str]) -> list[tuple[str, str, int]]:
+        if not ids:
+            return []
+        with self.uow.session() as db:
+            rows = db.execute(
+                select(User.id, User.nickname, User.point).where(
+                    User.id.in_(ids), User.role == Role.USER
+                )
+            ).all()
+            return [(row.id, row.nickname, row.point) for row in rows]
+
+    def delete(self, id: str) -> None:
+        with self.uow.session() as db:
+            wallet_ids = select(CoinWallet.id).where(CoinWallet.user_id == id)
+            db.execute(delete(Coin).where(Coin.wallet_id.in_(wallet_ids)))
+            db.execute(delete(CoinWallet).where(CoinWallet.user_id == id))
+            db.execute(delete(Answer).where(Answer.user_id == id))
+            db.execute(delete(LoginHistory).where(LoginHistory.user_id == id))
+            db.execute(delete(User).where(User.id == id))
+            db.commit()
+
+    def find_nicknames_by_ids(self, ids: list[str]) -> dict[str, str | None]:
+        if not ids:
+            return {}
+        with self.uow.session() as db:
+            rows = db.execute(
+                select(User.id, User.nickname).where(User.id.in_(ids))
+            ).all()
+            return {row.id: row.nickname for row in rows}
+
+    def reconcile_points(self, fix: bool = False) -> list[PointDrift]:
+        with self.uow.session() as db:
+            rows = db.execute(FIX_POINT_DRIFT_SQL if fix else FIND_POINT_DRIFT_SQL).all()
+            if fix:
+                db.expire_all()
+                db.commit()
+            return [
+                PointDrift(
+                    user_id=row.user_id,
+                    stored_point=row.stored_point,
+                    expected_point=row.expected_point,
+                )
+                for row in rows
+            ]
+
     def update(self, user_vo: UserVO):
-        with SessionLocal() as db:
-            user = db.query(User).filter(User.id == user_vo.id).first()
+        with self.uow.session() as db:
+            user = db.get(User, user_vo.id)
             if not user:
                 raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
 
@@ -179,11 +282,12 @@ class UserRepository(IUserRepository):
         order: str | None = "asc",
         limit: int | None = None,
         offset: int | None = None,
+        after: tuple | None = None,
     ) -> list[UserVO]:
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             query = db.query(User)
 
-            # 필터 적용
+            # 필터 적용 (nickname 부분 검색은 pg_trgm GIN 인덱스 사용)
             if nickname:
                 query = query.filter(User.nickname.ilike(f"%{nickname}%"))
             if min_point is not None:
@@ -191,16 +295,22 @@ class UserRepository(IUserRepository):
             if max_point is not None:
                 query = query.filter(User.point <= max_point)
 
-            # 정렬 적용
-            if order_by:
-                print(f"Ordering by {order_by} in {order} order")  # 디버그 로그
-                order_column = getattr(User, order_by)
+            # (정렬 컬럼, id) 로 정렬해 순서를 고정하고, after 가 있으면 그 다음 행부터
+            columns = [getattr(User, order_by), User.id] if order_by else [User.id]
+            if after is not None:
+                values = [after[0], after[1]] if order_by else [after[1]]
                 if order == "desc":
-                    query = query.order_by(desc(order_column))
+                    query = query.filter(tuple_(*columns) < tuple_(*values))
                 else:
-                    query = query.order_by(order_column)
+                    query = query.filter(tuple_(*columns) > tuple_(*values))
+            if order == "desc":
+                query = query.order_by(*[desc(column) for column in columns])
+            else:
+                query = query.order_by(*columns)
 
-            users = query.limit(limit).offset(offset).all()
+            if offset:
+                query = query.offset(offset)
+            users = query.limit(limit).all()
             return [
                 UserVO(
                     id=user.id,
@@ -223,18 +333,21 @@ class UserRepository(IUserRepository):
 
 
 class LoginHistoryRepository(ILoginHistoryRepository):
+    def __init__(self, uow: UnitOfWork | None = None):
+        self.uow = uow or UnitOfWork()
+
     def save(self, login_history: LoginHistoryVO):
         login_history = LoginHistory(
             id=login_history.id,
             user_id=login_history.user_id,
             login_at=login_history.login_at,
         )
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             db.add(login_history)
             db.commit()  # DB에 저장
 
     def find_by_user_id(self, user_id: str) -> list[LoginHistoryVO]:
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             login_histories = (
                 db.query(LoginHistory).filter(LoginHistory.user_id == user_id).all()
             )
@@ -248,7 +361,7 @@ class LoginHistoryRepository(ILoginHistoryRepository):
             ]
 
     def delete(self, login_history: LoginHistoryVO):
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             login_history = (
                 db.query(LoginHistory)
                 .filter(LoginHistory.id == login_history.id)
@@ -260,7 +373,7 @@ class LoginHistoryRepository(ILoginHistoryRepository):
         return login_history
 
     def find_all(self) -> list[LoginHistoryVO]:
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             login_histories = db.query(LoginHistory).all()
             return [
                 LoginHistoryVO(
@@ -272,7 +385,7 @@ class LoginHistoryRepository(ILoginHistoryRepository):
             ]
 
     def update(self, login_history: LoginHistoryVO):
-        with SessionLocal() as db:
+        with self.uow.session() as db:
             login_history = (
                 db.query(LoginHistory)
                 .filter(LoginHistory.id == login_history.id)
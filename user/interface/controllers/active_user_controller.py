@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from dependency_injector.wiring import inject, Provide
 from containers import Container
 from user.application.active_user_service import ActiveUserService
@@ -8,7 +8,7 @@ router = APIRouter(prefix="/active-users", tags=["active-users"])
 
 @router.get("/count")
 @inject
-async def get_active_users_count(
+def get_active_users_count(
     active_user_service: ActiveUserService = Depends(
         Provide[Container.active_user_service]
     ),
@@ -20,21 +20,17 @@ async def get_active_users_count(
 
 @router.get("/list")
 @inject
-async def get_active_users_list(
+def get_active_users_list(
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
     active_user_service: ActiveUserService = Depends(
         Provide[Container.active_user_service]
     ),
 ):
-    """현재 활성 사용자 목록을 반환하는 REST API 엔드포인트 (닉네임만 반환)"""
-    users = active_user_service.get_active_users()
+    """현재 활성 사용자 목록을 반환하는 REST API 엔드포인트 (최근 활동 순, 닉네임만 반환)"""
+    users = active_user_service.get_active_users(offset=offset, limit=limit)
 
-    # 닉네임만 필터링하여 반환
-    filtered_users = []
-    for user in users:
-        if "nickname" in user:
-            filtered_users.append({"nickname": user["nickname"]})
-        else:
-            # 닉네임이 없는 경우 빈 값으로 처리
-            filtered_users.append({"nickname": ""})
+    # 닉네임만 필터링하여 반환 (닉네임이 없는 경우 빈 값으로 처리)
+    filtered_users = [{"nickname": user.get("nickname") or ""} for user in users]
 
     return {"users": filtered_users}
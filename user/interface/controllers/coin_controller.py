@@ -28,7 +28,7 @@ router = APIRouter(
 
 @router.get("/wallet", response_model=WalletResponseDTO)
 @inject
-async def get_wallet(
+def get_wallet(
     user_id: str,
     coin_service: CoinService = Depends(Provide[Container.coin_service]),
 ) -> WalletResponseDTO:
@@ -71,7 +71,7 @@ async def get_wallet(
 
 @router.post("", response_model=CoinResponseDTO)
 @inject
-async def add_coin(
+def add_coin(
     user_id: str,
     request: CoinCreateDTO,
     coin_service: CoinService = Depends(Provide[Container.coin_service]),
@@ -98,7 +98,7 @@ async def add_coin(
 
 @router.post("/use", response_model=CoinResponseDTO)
 @inject
-async def use_coin(
+def use_coin(
     user_id: str,
     request: CoinCreateDTO,
     coin_service: CoinService = Depends(Provide[Container.coin_service]),
@@ -122,7 +122,7 @@ async def use_coin(
 
 @router.get("/history", response_model=CoinResponseListDTO)
 @inject
-async def get_coin_history(
+def get_coin_history(
     user_id: str,
     status: Optional[CoinStatus] = None,
     coin_service: CoinService = Depends(Provide[Container.coin_service]),
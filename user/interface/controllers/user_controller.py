@@ -1,7 +1,7 @@
 from typing import Annotated
 import logging
 
-from fastapi import APIRouter, Depends, status, HTTPException, Response
+from fastapi import APIRouter, Depends, Query, status, HTTPException, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel
@@ -10,8 +10,10 @@ from dependency_injector.wiring import inject, Provide
 from containers import Container
 from user.application.user_service import UserService
 from user.application.coin_service import CoinService
+from user.application.leaderboard_service import LeaderboardService
 from user.interface.dtos.user_dto import (
     UserRequestDTO,
+    UserRankRequestDTO,
     UserResponseDTO,
     UserCreateDTO,
     UserUpdateDTO,
@@ -25,6 +27,7 @@ from user.interface.dtos.user_dto import (
     UserRankResponseListDTO,
 )
 from common.auth import CurrentUser, get_admin_user, get_current_user
+from common.exceptions import QuizAppException
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -34,6 +37,8 @@ router = APIRouter(prefix="/user", tags=["user"])
 
 class UserResponseListDTO(BaseModel):
     users: list[UserResponseDTO]
+    next_cursor: str | None = None
+    has_more: bool = False
 
 
 @router.post("/register", status_code=status.HTTP_201_CREATED)
@@ -83,12 +88,12 @@ def update_user(
 
 @router.get("", response_model=UserResponseListDTO)
 @inject
-async def get_users(
+def get_users(
     request: UserRequestDTO = Depends(),
     current_user: CurrentUser = Depends(get_admin_user), # 어드민만 조회가능하도록 수정
     user_service: UserService = Depends(Provide[Container.user_service]),
 ) -> UserResponseListDTO:
-    users = user_service.get_users(
+    page = user_service.get_users(
         nickname=request.nickname,
         min_point=request.min_point,
         max_point=request.max_point,
@@ -96,6 +101,7 @@ async def get_users(
         order=request.order,
         offset=request.offset,
         limit=request.limit,
+        cursor=request.cursor,
     )
     return UserResponseListDTO(
         users=[
@@ -113,19 +119,44 @@ async def get_users(
                 memo=user.memo,
                 point=user.point,
             )
-            for user in users
-        ]
+            for user in page.items
+        ],
+        next_cursor=page.next_cursor,
+        has_more=page.has_more,
     )
 
 @router.get("/ranked", response_model=UserRankResponseListDTO)
 @inject
-async def get_ranked_users(
-    request: UserRequestDTO = Depends(),
+def get_ranked_users(
+    request: UserRankRequestDTO = Depends(),
     current_user: CurrentUser = Depends(get_current_user),
     user_service: UserService = Depends(Provide[Container.user_service]),
+    leaderboard: LeaderboardService = Depends(Provide[Container.leaderboard_service]),
 ) -> UserRankResponseListDTO:
     try:
-        users = user_service.get_users(
+        # 포인트 내림차순 기본 랭킹은 Redis 랭킹에서 조회
+        if (
+            request.order_by in (None, "point")
+            and request.order == "desc"
+            and request.nickname is None
+            and request.min_point is None
+            and request.max_point is None
+        ):
+            ranked_users = leaderboard.get_top(
+                limit=request.limit, offset=request.offset or 0
+            )
+            return UserRankResponseListDTO(
+                users=[
+                    UserRankResponseDTO(
+                        nickname=ranked_user.nickname or "",
+                        point=ranked_user.point,
+                        rank=ranked_user.rank,
+                    )
+                    for ranked_user in ranked_users
+                ]
+            )
+
+        page = user_service.get_users(
             nickname=request.nickname,
             min_point=request.min_point,
             max_point=request.max_point,
@@ -140,14 +171,65 @@ async def get_ranked_users(
                     nickname=user.nickname,
                     point=user.point,
                 )
-                for user in users
+                for user in page.items
             ]
         )
+    except QuizAppException:
+        raise
     except Exception as e:
         logger.error(f"Error getting ranked users: {str(e)}", exc_info=True)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
+@router.get("/ranked/me", response_model=UserRankResponseDTO | None)
+@inject
+def get_my_rank(
+    current_user: CurrentUser = Depends(get_current_user),
+    leaderboard: LeaderboardService = Depends(Provide[Container.leaderboard_service]),
+):
+    ranked_user = leaderboard.get_rank(current_user.id)
+    if ranked_user is None:
+        return None
+    return UserRankResponseDTO(
+        nickname=ranked_user.nickname or "",
+        point=ranked_user.point,
+        rank=ranked_user.rank,
+    )
+
+
+@router.get("/ranked/me/around", response_model=UserRankResponseListDTO)
+@inject
+def get_ranked_users_around_me(
+    window: int = Query(default=5, ge=1, le=50),
+    current_user: CurrentUser = Depends(get_current_user),
+    leaderboard: LeaderboardService = Depends(Provide[Container.leaderboard_service]),
+) -> UserRankResponseListDTO:
+    ranked_users = leaderboard.get_around(current_user.id, window=window)
+    return UserRankResponseListDTO(
+        users=[
+            UserRankResponseDTO(
+                nickname=ranked_user.nickname or "",
+                point=ranked_user.point,
+                rank=ranked_user.rank,
+            )
+            for ranked_user in ranked_users
+        ]
+    )
+
+
+@router.post("/ranked/rebuild")
+@inject
+def rebuild_ranking(
+    current_user: CurrentUser = Depends(get_admin_user),
+    leaderboard: LeaderboardService = Depends(Provide[Container.leaderboard_service]),
+):
+    """DB 기준으로 Redis 랭킹 재생성"""
+    count = leaderboard.rebuild()
+    if count is None:
+        return {"message": "Ranking rebuild already in progress", "count": None}
+    return {"message": "Ranking rebuilt", "count": count}
+
+
 @router.get("/me")
 @inject
 def get_my_info(
@@ -168,6 +250,16 @@ def get_user_by_id(
     return user_service.get_user_by_id(user_id)
 
 
+@router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+@inject
+def delete_user(
+    user_id: str,
+    user_service: UserService = Depends(Provide[Container.user_service]),
+    current_user: CurrentUser = Depends(get_admin_user),
+):
+    user_service.delete_user(user_id)
+
+
 @router.post("/login")
 @inject
 def login(
@@ -199,7 +291,7 @@ def update_my_info(
 
 @router.patch("/me", response_model=UserResponseDTO)
 @inject
-async def update_me(
+def update_me(
     request: UserUpdateDTO,
     current_user: CurrentUser = Depends(get_current_user),
     user_service: UserService = Depends(Provide[Container.user_service]),
@@ -229,7 +321,7 @@ async def update_me(
 
 @router.get("/check-nickname/{nickname}")
 @inject
-async def check_nickname(
+def check_nickname(
     nickname: str,
     user_service: UserService = Depends(Provide[Container.user_service]),
 ):
@@ -242,7 +334,7 @@ async def check_nickname(
 
 @router.get("/check-email/{email}")
 @inject
-async def check_email(
+def check_email(
     email: str,
     user_service: UserService = Depends(Provide[Container.user_service]),
 ):
@@ -257,20 +349,21 @@ async def check_email(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.post("/send-verification-email")
+@router.post("/send-verification-email", status_code=status.HTTP_202_ACCEPTED)
 @inject
-async def send_verification_email(
+def send_verification_email(
     body: EmailVerficationDTO,
     user_service: UserService = Depends(Provide[Container.user_service]),
 ):
     """
     Send verification email to current user
+    메일은 백그라운드 작업으로 발송된다.
     """
 
     try:
-        user_service.send_verification_email(body.email)
-        logger.debug(f"Verification email sent successfully")
-        return {"message": "Verification email sent"}
+        task_id = user_service.send_verification_email(body.email)
+        logger.debug(f"Verification email queued: {task_id}")
+        return {"message": "Verification email queued", "task_id": task_id}
     except Exception as e:
         logger.error(f"Error sending verification email: {str(e)}", exc_info=True)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -333,15 +426,15 @@ def verify_token(
 #         )
 
 
-@router.post("/password-reset/request", status_code=status.HTTP_200_OK)
+@router.post("/password-reset/request", status_code=status.HTTP_202_ACCEPTED)
 @inject
 def request_password_reset(
     request: PasswordResetRequestDTO,
     user_service: UserService = Depends(Provide[Container.user_service]),
 ):
-    """비밀번호 재설정 요청"""
-    user_service.request_password_reset(request.email)
-    return {"message": "Password reset email sent"}
+    """비밀번호 재설정 요청 (메일은 백그라운드 작업으로 발송)"""
+    task_id = user_service.request_password_reset(request.email)
+    return {"message": "Password reset email queued", "task_id": task_id}
 
 
 @router.post("/password-reset", status_code=status.HTTP_200_OK)
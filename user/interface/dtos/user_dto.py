@@ -14,10 +14,22 @@ class UserRequestDTO(UserBase):
     nickname: str | None = None
     min_point: int | None = None
     max_point: int | None = None
-    order_by: str | None = None  # 'point' or 'nickname'
+    order_by: str | None = None  # 'point', 'nickname' or 'created_at'
+    order: str | None = "asc"  # 'asc' or 'desc'
+    cursor: str | None = None  # 이전 응답의 next_cursor
+    offset: int | None = None  # 이전 클라이언트 호환용. cursor 사용 권장
+    limit: int | None = Field(default=100, ge=1)
+
+
+class UserRankRequestDTO(UserBase):
+    # 랭킹은 cursor 없이 offset / limit 으로 조회 (Redis 랭킹과 같은 방식)
+    nickname: str | None = None
+    min_point: int | None = None
+    max_point: int | None = None
+    order_by: str | None = None  # 'point', 'nickname' or 'created_at'
     order: str | None = "asc"  # 'asc' or 'desc'
     offset: int | None = 0
-    limit: int | None = 10000
+    limit: int | None = Field(default=10000, ge=1)
 
 
 class UserCreateDTO(UserBase):
@@ -72,6 +84,7 @@ class UserResponseListDTO(BaseModel):
 class UserRankResponseDTO(UserBase):
     nickname: str
     point: int
+    rank: int | None = None
 
 
 class UserRankResponseListDTO(BaseModel):
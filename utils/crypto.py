@@ -1,12 +1,87 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from passlib.context import CryptContext
 
+from common.exceptions import TooManyRequestsError
+from common.metrics import metrics
+from config import get_settings
+
 
 class Crypto:
-    def __init__(self):
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    """bcrypt 해시 / 검증
+
+    해시 작업은 전용 스레드풀(BCRYPT_MAX_WORKERS)에서 실행한다.
+    실행 중 + 대기 중 작업이 BCRYPT_MAX_WORKERS + BCRYPT_MAX_QUEUE 를 넘으면
+    TooManyRequestsError(429) 로 바로 거절해 요청 스레드가 쌓이지 않도록 한다.
+    """
+
+    def __init__(
+        self,
+        rounds: int | None = None,
+        max_workers: int | None = None,
+        max_queue: int | None = None,
+    ):
+        settings = get_settings()
+        self.rounds = rounds or settings.BCRYPT_ROUNDS
+        self.max_workers = max_workers or settings.BCRYPT_MAX_WORKERS
+        self.max_queue = settings.BCRYPT_MAX_QUEUE if max_queue is None else max_queue
+
+        # min/max 를 기본값과 같게 두면 cost 가 다른 기존 해시는 needs_update 로 판단된다
+        self.pwd_context = CryptContext(
+            schemes=["bcrypt"],
+            deprecated="auto",
+            bcrypt__default_rounds=self.rounds,
+            bcrypt__min_rounds=self.rounds,
+            bcrypt__max_rounds=self.rounds,
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="bcrypt"
+        )
+        self._pending = 0
+        self._lock = threading.Lock()
+
+        self._pending_gauge = metrics.gauge(
+            "bcrypt_pending", "Hash operations running or queued"
+        )
+        self._rejected = metrics.counter(
+            "bcrypt_rejected_total", "Hash operations rejected because the pool was full"
+        )
+        self._duration = metrics.summary(
+            "bcrypt_seconds", "Time from submit to result, including queue wait"
+        )
 
     def encrypt(self, secret):
-        return self.pwd_context.hash(secret=secret)
+        return self._run(self.pwd_context.hash, secret)
 
     def verify(self, secret, hash):
-        return self.pwd_context.verify(secret=secret, hash=hash)
+        return self._run(self.pwd_context.verify, secret, hash)
+
+    def verify_and_update(self, secret, hash) -> tuple[bool, str | None]:
+        """검증하고, cost 가 현재 설정과 다르면 새 해시도 반환
+
+        Returns:
+            (일치 여부, 새 해시 또는 None)
+        """
+        return self._run(self.pwd_context.verify_and_update, secret, hash)
+
+    def _run(self, fn, *args):
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self._rejected.inc()
+                raise TooManyRequestsError(
+                    "Too many login attempts, please retry shortly",
+                    retry_after=1,
+                )
+            self._pending += 1
+            self._pending_gauge.set(self._pending)
+
+        started = time.perf_counter()
+        try:
+            return self._executor.submit(fn, *args).result()
+        finally:
+            self._duration.observe(time.perf_counter() - started)
+            with self._lock:
+                self._pending -= 1
+                self._pending_gauge.set(self._pending)
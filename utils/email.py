@@ -1,20 +1,110 @@
 """Email utility class"""
 
+import logging
 import os
+import queue
 import smtplib
+import threading
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.header import Header
 import datetime
 
+from common.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# 연결이 끊긴 경우에만 새 연결로 한 번 더 시도 (수신 거부 등은 그대로 raise)
+RECONNECT_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+
+class RateLimiter:
+    """token bucket. acquire() 는 토큰이 생길 때까지 대기"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
 
 class EmailSender:
-    def __init__(self):
-        self.smtp_server = os.getenv("SMTP_SERVER", "smtp.gmail.com")
-        self.smtp_port = int(os.getenv("SMTP_PORT", "587"))
-        self.smtp_username = os.getenv("SMTP_USERNAME", "geniusgamekorea@gmail.com")
-        self.smtp_password = os.getenv("SMTP_PASSWORD", "kfzk hpsl dhmb ethd")
+    """SMTP 메일 발송
+
+    연결(STARTTLS + 로그인)을 pool 에 보관해 여러 메일에 재사용하고,
+    발송 속도는 SMTP_RATE_LIMIT (초당 메일 수) 로 제한한다.
+    idle_timeout 보다 오래 쉰 연결은 서버가 끊었을 수 있으므로 새로 연결한다.
+    """
+
+    def __init__(
+        self,
+        smtp_server: str | None = None,
+        smtp_port: int | None = None,
+        smtp_username: str | None = None,
+        smtp_password: str | None = None,
+        use_tls: bool | None = None,
+        pool_size: int | None = None,
+        rate_limit: float | None = None,
+        idle_timeout: float | None = None,
+    ):
+        self.smtp_server = smtp_server or os.getenv("SMTP_SERVER", "smtp.gmail.com")
+        self.smtp_port = smtp_port or int(os.getenv("SMTP_PORT", "587"))
+        self.smtp_username = (
+            smtp_username
+            if smtp_username is not None
+            else os.getenv("SMTP_USERNAME", "geniusgamekorea@gmail.com")
+        )
+        self.smtp_password = (
+            smtp_password
+            if smtp_password is not None
+            else os.getenv("SMTP_PASSWORD", "kfzk hpsl dhmb ethd")
+        )
         self.sender_email = os.getenv("SENDER_EMAIL", "geniusgamekorea@gmail.com")
+        self.use_tls = (
+            use_tls
+            if use_tls is not None
+            else os.getenv("SMTP_USE_TLS", "true").lower() == "true"
+        )
+        self.idle_timeout = (
+            idle_timeout
+            if idle_timeout is not None
+            else float(os.getenv("SMTP_IDLE_TIMEOUT", "60"))
+        )
+        pool_size = pool_size or int(os.getenv("SMTP_POOL_SIZE", "2"))
+        rate_limit = (
+            rate_limit
+            if rate_limit is not None
+            else float(os.getenv("SMTP_RATE_LIMIT", "5"))
+        )
+
+        # (연결, 마지막 사용 시각)
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._rate_limiter = RateLimiter(rate_limit, burst=max(1, int(rate_limit)))
+
+        self._sent = metrics.counter("email_sent_total")
+        self._failed = metrics.counter("email_failed_total")
+        self._connects = metrics.counter(
+            "smtp_connections_opened_total", "SMTP connect + STARTTLS + login"
+        )
 
     def send_email(
         self, to_email: str, subject: str, content: str, is_html: bool = False
@@ -35,10 +125,7 @@ class EmailSender:
         content_type = "html" if is_html else "plain"
         msg.attach(MIMEText(content, content_type, "utf-8"))
 
-        with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-            server.starttls()
-            server.login(self.smtp_username, self.smtp_password)
-            server.send_message(msg)
+        self._send(msg)
 
     def send_verification_email(self, to_email: str, verification_token: str):
         """Send verification email
@@ -148,7 +235,62 @@ class EmailSender:
 
         msg.attach(MIMEText(html_content, "html", "utf-8"))
 
-        with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-            server.starttls()
-            server.login(self.smtp_username, self.smtp_password)
-            server.send_message(msg)
+        self._send(msg)
+
+    def close(self) -> None:
+        """pool 의 연결 종료"""
+        while True:
+            try:
+                server, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._quit(server)
+
+    def _send(self, msg: MIMEMultipart) -> None:
+        self._rate_limiter.acquire()
+        with self._slots:
+            server = self._checkout()
+            try:
+                try:
+                    server.send_message(msg)
+                except RECONNECT_ERRORS as e:
+                    logger.info(f"SMTP connection lost, reconnecting: {e}")
+                    self._quit(server)
+                    server = self._connect()
+                    server.send_message(msg)
+            except Exception:
+                self._failed.inc()
+                self._quit(server)
+                raise
+            # 정상 발송한 연결만 pool 에 반납
+            self._idle.put((server, time.monotonic()))
+        self._sent.inc()
+
+    def _checkout(self) -> smtplib.SMTP:
+        while True:
+            try:
+                server, last_used = self._idle.get_nowait()
+            except queue.Empty:
+                return self._connect()
+            if time.monotonic() - last_used < self.idle_timeout:
+                return server
+            self._quit(server)
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=30)
+        try:
+            if self.use_tls:
+                server.starttls()
+            if self.smtp_username:
+                server.login(self.smtp_username, self.smtp_password)
+        except Exception:
+            self._quit(server)
+            raise
+        self._connects.inc()
+        return server
+
+    def _quit(self, server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except Exception:
+            server.close()
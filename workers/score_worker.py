@@ -4,10 +4,17 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from common.redis.client import RedisClient
 from common.redis.config import RedisSettings
+from common.redis.reliable_queue import QueueJob
 from game.domain.repository.game_repo import IGameRepository
 from answer.domain.repository.answer_repo import IAnswerRepository
-from user.domain.repository.user_repo import IUserRepository
+from user.application.leaderboard_service import LeaderboardService
+from answer.application.game_ranking_cache import GameRankingCache
+from common.metrics import metrics, serve_metrics
+from config import get_settings
 from containers import Container
+import argparse
+import signal
+import threading
 import time
 import logging
 
@@ -20,78 +27,163 @@ class ScoreCalculationWorker:
         redis_client: RedisClient,
         game_repo: IGameRepository,
         answer_repo: IAnswerRepository,
-        user_repo: IUserRepository
+        leaderboard: LeaderboardService,
+        ranking_cache: GameRankingCache,
     ):
         self.redis_client = redis_client
         self.game_repo = game_repo
         self.answer_repo = answer_repo
-        self.user_repo = user_repo
-    
+        self.leaderboard = leaderboard
+        self.ranking_cache = ranking_cache
+        self._stop = threading.Event()
+
+        queue = redis_client.queue
+        for state in ("ready", "processing", "delayed", "dead"):
+            metrics.gauge(
+                f"score_queue_{state}",
+                f"Score jobs {state}",
+                callback=lambda state=state: queue.size()[state],
+            )
+        self._busy = metrics.gauge("score_workers_busy", "Consumers processing a job")
+        self._completed = metrics.counter("score_jobs_completed_total")
+        self._failed = metrics.counter("score_jobs_failed_total")
+        self._duration = metrics.summary("score_job_seconds", "Score job processing time")
+        self._wait = metrics.summary(
+            "score_job_wait_seconds", "Time from enqueue until a worker picks the job up"
+        )
+
     def calculate_score(self, game_id: str) -> None:
-        """게임의 점수를 계산하고 사용자 포인트를 업데이트"""
+        """게임의 점수를 계산하고 사용자 포인트를 업데이트
+
+        여러 번 실행되어도 결과가 같다 (score_game 은 목표 점수와의 차이만 반영).
+        실패 시 예외를 그대로 올려 큐에서 재시도하도록 한다.
+        변화량이 없으면(재전달) 이전 실행이 랭킹 반영 전에 중단됐을 수 있으므로
+        이 게임에서 점수를 받은 유저의 랭킹 점수를 DB 값으로 다시 맞춘다.
+        """
+        # 게임 정보 조회
+        game = self.game_repo.find_by_id(game_id)
+        if not game:
+            logger.error(f"Game not found: {game_id}")
+            return
+
+        # 답변 점수 계산과 유저 포인트 반영을 한 트랜잭션에서 처리
+        started = time.perf_counter()
+        deltas = self.answer_repo.score_game(game_id)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if deltas:
+            self.leaderboard.apply_deltas(deltas)
+        else:
+            self.leaderboard.sync_users(
+                self.answer_repo.find_scored_user_ids_by_game_id(game_id)
+            )
+        self.ranking_cache.refresh(game_id)
+
+        logger.info(
+            f"Score calculation completed for game {game_id}: "
+            f"{len(deltas)} users updated in {elapsed_ms:.0f} ms"
+        )
+
+    def process(self, job: QueueJob) -> None:
+        """작업 하나 처리 후 ack, 실패 시 재시도 / dead-letter"""
+        queue = self.redis_client.queue
+        game_id = job.data.get("game_id")
+        if not game_id:
+            queue.dead_letter(job, "missing game_id")
+            return
+
+        if job.enqueued_at:
+            self._wait.observe(max(time.time() - job.enqueued_at, 0))
+        logger.info(
+            f"Processing score calculation for game {game_id} (attempt {job.attempts + 1})"
+        )
+        started = time.perf_counter()
         try:
-            # 게임 정보 조회
-            game = self.game_repo.find_by_id(game_id)
-            if not game:
-                logger.error(f"Game not found: {game_id}")
-                return
-            
-            # 해당 게임의 모든 답변 조회
-            answers = self.answer_repo.find_by_game_id(game_id)
-            
-            for answer in answers:
-                # 정답 여부 확인
-                is_correct = game.answer.strip().lower() == answer.answer_text.strip().lower()
-                points = 10 if is_correct else 0  # 임시로 정답이면 10점
-                
-                # 사용자 포인트 업데이트
-                user = self.user_repo.find_by_id(answer.user_id)
-                if user:
-                    user.point += points
-                    self.user_repo.update(user)
-                    logger.info(f"Updated points for user {user.id}: +{points}")
-                
-                # 답변 포인트 업데이트
-                answer.point = points
-                self.answer_repo.update(answer)
-            
-            logger.info(f"Score calculation completed for game {game_id}")
-            
+            self.calculate_score(game_id)
         except Exception as e:
+            self._failed.inc()
             logger.error(f"Error calculating score for game {game_id}: {str(e)}")
-    
-    def run(self):
-        """워커 실행"""
-        logger.info("Score calculation worker started")
-        while True:
+            queue.retry(job, str(e))
+        else:
+            self._completed.inc()
+            if not queue.ack(job):
+                logger.warning(f"Score job for game {game_id} finished after its lease expired")
+        finally:
+            self._duration.observe(time.perf_counter() - started)
+
+    def consume(self) -> None:
+        """stop() 전까지 작업을 하나씩 처리 (스레드 하나)
+
+        작업이 있으면 바로 다음 작업을 가져오고, 없으면 reserve 가 poll_timeout 동안 대기한다.
+        """
+        while not self._stop.is_set():
             try:
-                # 큐에서 작업 가져오기
-                data = self.redis_client.dequeue()
-                if data and 'game_id' in data:
-                    logger.info(f"Processing score calculation for game {data['game_id']}")
-                    self.calculate_score(data['game_id'])
-                
-                time.sleep(1)  # 부하 방지를 위한 대기
-                
+                # 큐에서 작업 가져오기 (처리 중 목록으로 옮겨져 워커가 죽어도 남는다)
+                job = self.redis_client.dequeue()
             except Exception as e:
                 logger.error(f"Worker error: {str(e)}")
-                time.sleep(5)  # 에러 발생시 더 긴 대기
+                self._stop.wait(5)  # Redis 장애 등. 잠시 후 다시 시도
+                continue
+            if job:
+                self._busy.inc()
+                try:
+                    self.process(job)
+                finally:
+                    self._busy.dec()
+
+    def run(self, concurrency: int = 1):
+        """워커 실행. concurrency 개의 스레드가 같은 큐에서 작업을 가져온다.
+
+        stop() (SIGTERM / SIGINT) 이 호출되면 새 작업을 가져오지 않고
+        처리 중인 작업이 끝날 때까지 기다린 뒤 반환한다.
+        """
+        logger.info(f"Score calculation worker started ({concurrency} consumers)")
+        threads = [
+            threading.Thread(target=self.consume, name=f"score-consumer-{i}")
+            for i in range(concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        logger.info("Score calculation worker stopped")
+
+    def stop(self) -> None:
+        self._stop.set()
+
 
 def main():
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Score calculation worker")
+    parser.add_argument("--concurrency", type=int, default=settings.WORKER_CONCURRENCY)
+    parser.add_argument("--metrics-port", type=int, default=settings.WORKER_METRICS_PORT)
+    args = parser.parse_args()
+
     # 컨테이너 초기화
     container = Container()
     container.init_resources()
-    
+
     # 워커 인스턴스 생성
     worker = ScoreCalculationWorker(
         redis_client=container.redis_client(),
-        game_repo=container.game_repo(),  # game_repository() -> game_repo()
-        answer_repo=container.answer_repo(),  # answer_repository() -> answer_repo()
-        user_repo=container.user_repo()  # user_repository() -> user_repo()
+        game_repo=container.game_repo(),
+        answer_repo=container.answer_repo(),
+        leaderboard=container.leaderboard_service(),
+        ranking_cache=container.game_ranking_cache(),
     )
-    
+
+    def shutdown(signum, frame):
+        logger.info(f"Received signal {signum}, finishing in-flight jobs")
+        worker.stop()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    if args.metrics_port:
+        serve_metrics(args.metrics_port, token=settings.METRICS_TOKEN)
+
     # 워커 실행
-    worker.run()
+    worker.run(concurrency=args.concurrency)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,105 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dataclasses import asdict
+from datetime import datetime
+
+from common.metrics import serve_metrics
+from common.tasks import TaskName, TaskWorker
+from config import get_settings
+from containers import Container
+from utils.email import EmailSender
+import argparse
+import signal
+import threading
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def build_handlers(container: Container, email_sender: EmailSender) -> dict:
+    """작업 이름별 handler (payload dict -> JSON 결과)"""
+    answer_service = container.answer_service()
+
+    def send_email(payload: dict) -> None:
+        email_sender.send_email(**payload)
+
+    def send_verification_email(payload: dict) -> None:
+        email_sender.send_verification_email(payload["email"], payload["token"])
+
+    def provision_answers(payload: dict) -> dict:
+        active_since = payload.get("active_since")
+        result = answer_service.create_answer_for_all_users_per_game(
+            payload["game_id"],
+            payload.get("count", 1),
+            active_since=datetime.fromisoformat(active_since) if active_since else None,
+        )
+        return asdict(result)
+
+    def calculate_points(payload: dict) -> dict:
+        deltas = answer_service.update_total_user_point(game_id=payload["game_id"])
+        return {"updated_users": len(deltas)}
+
+    return {
+        TaskName.EMAIL_SEND: send_email,
+        TaskName.EMAIL_VERIFICATION: send_verification_email,
+        TaskName.ANSWER_PROVISION: provision_answers,
+        TaskName.ANSWER_CALCULATE_POINTS: calculate_points,
+    }
+
+
+def consume(worker: TaskWorker, stop: threading.Event) -> None:
+    while not stop.is_set():
+        try:
+            worker.run_once()
+        except Exception as e:
+            logger.error(f"Worker error: {str(e)}")
+            stop.wait(5)  # Redis 장애 등. 잠시 후 다시 시도
+
+
+def main():
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Background task worker")
+    parser.add_argument("--concurrency", type=int, default=settings.WORKER_CONCURRENCY)
+    parser.add_argument("--metrics-port", type=int, default=settings.WORKER_METRICS_PORT)
+    args = parser.parse_args()
+
+    container = Container()
+    container.init_resources()
+    # SMTP 연결은 프로세스 안의 모든 consumer 가 공유한다
+    email_sender = EmailSender()
+    worker = TaskWorker(
+        task_queue=container.task_queue(),
+        handlers=build_handlers(container, email_sender),
+        uow=container.unit_of_work(),
+    )
+
+    stop = threading.Event()
+
+    def shutdown(signum, frame):
+        logger.info(f"Received signal {signum}, finishing in-flight tasks")
+        stop.set()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    if args.metrics_port:
+        serve_metrics(args.metrics_port, token=settings.METRICS_TOKEN)
+
+    logger.info(f"Task worker started ({args.concurrency} consumers)")
+    threads = [
+        threading.Thread(target=consume, args=(worker, stop), name=f"task-consumer-{i}")
+        for i in range(args.concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    email_sender.close()
+    logger.info("Task worker stopped")
+
+
+if __name__ == "__main__":
+    main()